@@ -0,0 +1,55 @@
+"""CSV -> XLSX 转换基准：对比 pandas 路径与 write-only 流式路径的吞吐量。
+
+用法（在仓库根目录执行）:
+    python -m benchmarks.bench_csv_to_xlsx --rows 200000 --cols 20
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+import time
+
+from src.utils.csv_to_xlsx_converter_service import CsvToXlsxConverterService
+
+
+def _make_csv(path: str, rows: int, cols: int) -> None:
+    with open(path, "w", encoding="utf-8-sig", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow([f"COL{idx}" for idx in range(cols)])
+        for row_idx in range(rows):
+            writer.writerow([f"R{row_idx}C{col_idx}" for col_idx in range(cols)])
+
+
+def _run(label: str, func, input_file: str, output_dir: str, rows: int) -> None:
+    start = time.perf_counter()
+    success, error = func(input_file, output_dir)
+    elapsed = time.perf_counter() - start
+    if not success:
+        print(f"{label:<10} 失败: {error}")
+        return
+    print(f"{label:<10} {elapsed:8.2f}s  {rows / elapsed:12,.0f} rows/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--cols", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_file = os.path.join(temp_dir, "bench.csv")
+        _make_csv(input_file, args.rows, args.cols)
+        print(f"输入: {args.rows} 行 x {args.cols} 列, {os.path.getsize(input_file) / 1024 / 1024:.1f} MB")
+
+        pandas_dir = os.path.join(temp_dir, "pandas")
+        streaming_dir = os.path.join(temp_dir, "streaming")
+        os.makedirs(pandas_dir)
+        os.makedirs(streaming_dir)
+
+        _run("pandas", CsvToXlsxConverterService.convert_file, input_file, pandas_dir, args.rows)
+        _run("streaming", CsvToXlsxConverterService.convert_file_streaming, input_file, streaming_dir, args.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""HTML 链接提取基准：对比 BeautifulSoup 引擎与单次流式扫描的 fast 引擎。
+
+用法（在仓库根目录执行）:
+    python -m benchmarks.bench_link_extraction page1.html page2.html
+    python -m benchmarks.bench_link_extraction --rows 5000
+
+不指定文件时生成一个包含表格、链接与图片的合成页面。
+"""
+
+import argparse
+import os
+import time
+
+from src.utils.dead_link_checker_service import DeadLinkCheckerService
+
+
+def _make_page(rows: int) -> str:
+    body = "".join(
+        f'<tr><td id="r{idx}"><a href="/pages/{idx}.html">第 {idx} 行</a></td>'
+        f'<td><img src="img/{idx}.png" srcset="img/{idx}@2x.png 2x" alt=""> 说明文字 &amp; 其他</td>'
+        f"<td>{idx * 3}</td></tr>\n"
+        for idx in range(rows)
+    )
+    return (
+        '<html><head><link rel="stylesheet" href="site.css"><script src="app.js"></script></head>'
+        f"<body><table>{body}</table></body></html>"
+    )
+
+
+def _run(label: str, html: str) -> float:
+    checker = DeadLinkCheckerService(engine=label)
+    start = time.perf_counter()
+    links = checker.extract_links_from_html(html)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<10} {elapsed:8.3f}s  {len(links):10,} links")
+    return elapsed
+
+
+def _bench(name: str, html: str) -> None:
+    print(f"{name} ({len(html.encode('utf-8')) / 1024 / 1024:.1f} MB)")
+    slow = _run("soup", html)
+    fast = _run("fast", html)
+    if fast:
+        print(f"  加速比     {slow / fast:8.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", help="要测试的 HTML 文件")
+    parser.add_argument("--rows", type=int, default=5_000)
+    args = parser.parse_args()
+
+    if args.files:
+        for path in args.files:
+            _bench(os.path.basename(path), DeadLinkCheckerService._read_html(path))
+        return
+
+    _bench("synthetic.html", _make_page(args.rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""XLSX 读取基准：对比 openpyxl 只读模式与 FastXlsxReader 逐行取字符串的吞吐量。
+
+用法（在仓库根目录执行）:
+    python -m benchmarks.bench_xlsx_reader spec1.xlsx spec2.xlsx
+    python -m benchmarks.bench_xlsx_reader --sheets 10 --rows 20000 --cols 15
+
+不指定文件时生成一个包含文本、数字与日期列的合成工作簿。
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+
+from src.utils.fast_xlsx_reader import FastXlsxReader
+from src.utils.xlsx_sheet_splitter_service import XlsxSheetSplitterService
+
+
+def _make_workbook(path: str, sheets: int, rows: int, cols: int) -> None:
+    workbook = Workbook(write_only=True)
+    base_date = datetime(2020, 1, 1)
+    for sheet_idx in range(sheets):
+        worksheet = workbook.create_sheet(f"DOMAIN{sheet_idx + 1}")
+        worksheet.append([f"COL{idx}" for idx in range(cols)])
+        date_cell = WriteOnlyCell(worksheet)
+        date_cell.number_format = "yyyy/mm/dd"
+        date_style = date_cell._style
+        for row_idx in range(rows):
+            row = []
+            for col_idx in range(cols):
+                if col_idx % 3 == 0:
+                    row.append(f"R{row_idx}C{col_idx}")
+                elif col_idx % 3 == 1:
+                    row.append(row_idx * 1.5)
+                else:
+                    cell = WriteOnlyCell(worksheet, base_date + timedelta(days=row_idx % 3650))
+                    cell._style = date_style
+                    row.append(cell)
+            worksheet.append(row)
+    workbook.save(path)
+
+
+def _read_openpyxl(path: str) -> int:
+    count = 0
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for worksheet in workbook.worksheets:
+            for row in worksheet.iter_rows():
+                [XlsxSheetSplitterService._cell_to_string(cell) for cell in row]
+                count += 1
+    finally:
+        workbook.close()
+    return count
+
+
+def _read_fast(path: str) -> int:
+    count = 0
+    with FastXlsxReader(path) as reader:
+        for sheet_name in reader.sheet_names:
+            for _row in reader.iter_string_rows(sheet_name, XlsxSheetSplitterService._format_excel_date):
+                count += 1
+    return count
+
+
+def _run(label: str, func, path: str) -> float:
+    start = time.perf_counter()
+    rows = func(path)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<10} {elapsed:8.2f}s  {rows / elapsed if elapsed else 0:12,.0f} rows/s")
+    return elapsed
+
+
+def _bench(path: str) -> None:
+    print(f"{os.path.basename(path)} ({os.path.getsize(path) / 1024 / 1024:.1f} MB)")
+    slow = _run("openpyxl", _read_openpyxl, path)
+    fast = _run("fast", _read_fast, path)
+    if fast:
+        print(f"  加速比     {slow / fast:8.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", help="要测试的 XLSX 文件（如 spec 工作簿）")
+    parser.add_argument("--sheets", type=int, default=5)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--cols", type=int, default=15)
+    args = parser.parse_args()
+
+    if args.files:
+        for path in args.files:
+            _bench(path)
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "bench.xlsx")
+        _make_workbook(path, args.sheets, args.rows, args.cols)
+        _bench(path)
+
+
+if __name__ == "__main__":
+    main()
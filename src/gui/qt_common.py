@@ -3,11 +3,21 @@ from __future__ import annotations
 import ctypes
 import os
 import sys
-from typing import Iterable
+from typing import Iterable, Iterator
 
 from PySide6.QtCore import QEvent, QObject, Qt, Signal
 from PySide6.QtGui import QFontDatabase
-from PySide6.QtWidgets import QAbstractItemView, QFileDialog, QListWidget, QListWidgetItem, QMessageBox, QWidget
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QFileDialog,
+    QListWidget,
+    QListWidgetItem,
+    QMessageBox,
+    QWidget,
+)
+
+from ..utils.file_discovery import iter_files
 
 
 def pick_font(candidates: list[str], fallback: str) -> str:
@@ -388,33 +398,30 @@ class FileListWidget(QListWidget):
         return super().eventFilter(watched, event)
 
     def add_paths(self, paths: Iterable[str]) -> list[str]:
-        files: list[str] = []
-        for path in paths:
-            if not path:
-                continue
-            if os.path.isfile(path):
-                files.append(path)
-                continue
-            if os.path.isdir(path) and self.allow_dirs:
-                for root, _, filenames in os.walk(path):
-                    for filename in filenames:
-                        files.append(os.path.join(root, filename))
-                    if not self.recursive:
-                        break
-
-        if self.allowed_exts:
-            files = [f for f in files if any(f.lower().endswith(ext) for ext in self.allowed_exts)]
-
         existing = set(self.paths())
         added: list[str] = []
-        for file_path in files:
+        for file_path in self._iter_candidate_files(paths):
             if file_path in existing:
                 continue
             self.addItem(QListWidgetItem(file_path))
             existing.add(file_path)
             added.append(file_path)
+            if len(added) % 500 == 0:
+                # 大目录边遍历边显示，界面保持响应
+                QApplication.processEvents()
         return added
 
+    def _iter_candidate_files(self, paths: Iterable[str]) -> Iterator[str]:
+        for path in paths:
+            if not path:
+                continue
+            if os.path.isfile(path):
+                if not self.allowed_exts or any(path.lower().endswith(ext) for ext in self.allowed_exts):
+                    yield path
+                continue
+            if os.path.isdir(path) and self.allow_dirs:
+                yield from iter_files(path, extensions=self.allowed_exts, recursive=self.recursive)
+
     def paths(self) -> list[str]:
         return [self.item(i).text() for i in range(self.count())]
 
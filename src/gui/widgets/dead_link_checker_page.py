@@ -6,9 +6,9 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QUrl
+from PySide6.QtCore import Qt, QThread, QUrl, Signal
 from PySide6.QtGui import QDesktopServices
-from PySide6.QtWidgets import QApplication, QHBoxLayout, QVBoxLayout, QWidget
+from PySide6.QtWidgets import QHBoxLayout, QVBoxLayout, QWidget
 from qfluentwidgets import (
     BodyLabel,
     CaptionLabel,
@@ -26,15 +26,72 @@ from ...utils.dead_link_checker_service import DeadLinkCheckerService
 from ..qt_common import mono_font, select_existing_directory, select_open_file, show_error, show_info, show_warning
 
 
+class DeadLinkCheckWorker(QThread):
+    """在后台线程中检测单个 HTML 文件或整个文件夹，并生成报告。"""
+
+    progress = Signal(int, int, str)  # (current, total, item)
+    finished_result = Signal(object, str)  # (result, output_file)；未找到 HTML 文件时 output_file 为空
+    finished_error = Signal(str)
+
+    def __init__(
+        self,
+        checker: DeadLinkCheckerService,
+        path: str,
+        base_url: str,
+        output_file: str,
+        include_subfolders: bool = False,
+        fresh: bool = False,
+        local_site: bool = False,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self._checker = checker
+        self._path = path
+        self._base_url = base_url
+        self._output_file = output_file
+        self._include_subfolders = include_subfolders
+        self._fresh = fresh
+        self._local_site = local_site
+
+    def run(self) -> None:
+        try:
+            if os.path.isfile(self._path):
+                result = self._checker.check_html_file(
+                    self._path,
+                    self._base_url,
+                    progress_callback=self.progress.emit,
+                    use_cache=True,
+                    fresh=self._fresh,
+                    local_site=self._local_site,
+                )
+            else:
+                result = self._checker.check_folder(
+                    self._path,
+                    self._base_url,
+                    include_subfolders=self._include_subfolders,
+                    progress_callback=self.progress.emit,
+                    use_cache=True,
+                    fresh=self._fresh,
+                    local_site=self._local_site,
+                )
+                if result["total_files"] == 0:
+                    self.finished_result.emit(result, "")
+                    return
+            self._checker.generate_report(result, self._output_file)
+            self.finished_result.emit(result, self._output_file)
+        except Exception as exc:  # pylint: disable=broad-except
+            self.finished_error.emit(str(exc))
+
+
 class DeadLinkCheckerPage(QWidget):
     def __init__(self, main_window) -> None:
         super().__init__()
         self.setObjectName("dead_link_checker")
         self.main_window = main_window
 
-        self.checker = DeadLinkCheckerService(timeout=10)
+        self.checker = DeadLinkCheckerService(timeout=10, max_concurrency=16, max_per_host=4)
         self.last_output_file: str | None = None
-        self.is_checking = False
+        self._worker: DeadLinkCheckWorker | None = None
 
         self._build_ui()
         self.setAcceptDrops(True)
@@ -89,6 +146,8 @@ class DeadLinkCheckerPage(QWidget):
 
         option_row = QHBoxLayout()
         self.include_subfolders = CheckBox("包含子文件夹")
+        self.fresh_check = CheckBox("忽略缓存，重新检测全部链接")
+        self.local_site_check = CheckBox("本地站点模式（相对链接按文件检查）")
         timeout_label = BodyLabel("超时时间(秒)")
         self.timeout_spin = SpinBox()
         self.timeout_spin.setRange(5, 60)
@@ -96,6 +155,10 @@ class DeadLinkCheckerPage(QWidget):
 
         option_row.addWidget(self.include_subfolders)
         option_row.addSpacing(16)
+        option_row.addWidget(self.fresh_check)
+        option_row.addSpacing(16)
+        option_row.addWidget(self.local_site_check)
+        option_row.addSpacing(16)
         option_row.addWidget(timeout_label)
         option_row.addWidget(self.timeout_spin)
         option_row.addStretch(1)
@@ -153,7 +216,7 @@ class DeadLinkCheckerPage(QWidget):
         self.last_output_file = None
 
     def start_checking(self) -> None:
-        if self.is_checking:
+        if self._worker and self._worker.isRunning():
             show_warning(self, "提示", "正在检测中，请稍候...")
             return
 
@@ -166,76 +229,59 @@ class DeadLinkCheckerPage(QWidget):
             show_error(self, "错误", "选择的路径不存在。")
             return
 
-        self.is_checking = True
         self.last_output_file = None
-
-        try:
-            self.check_btn.setEnabled(False)
-            self.open_output_btn.setEnabled(False)
-            self.progress_bar.setValue(0)
-            self.progress_label.setText("")
-            self._update_log("开始检测死链...\n")
-
-            self.checker.timeout = int(self.timeout_spin.value())
-            base_url = self.base_url_input.text().strip()
-
-            if os.path.isfile(path):
-                self._check_single_file(path, base_url)
-            else:
-                self._check_folder(path, base_url)
-
-        except Exception as exc:  # pylint: disable=broad-except
-            show_error(self, "错误", f"检测时发生错误：{exc}")
-            self._update_log(f"\n检测失败：{exc}")
-        finally:
-            self.is_checking = False
-            self.check_btn.setEnabled(True)
-            self.progress_label.setText("")
-            self.progress_bar.setValue(0)
-
-    def _check_single_file(self, file_path: str, base_url: str) -> None:
-        result = self.checker.check_html_file(file_path, base_url, progress_callback=self.update_progress)
-
-        output_file = self._generate_output_filename(file_path)
-        self.checker.generate_report(result, output_file)
-
-        summary = self._format_summary(result)
-        self._update_log(summary)
-
-        show_info(self, "完成", f"检测完成！报告已保存至：\n{output_file}")
-        self.last_output_file = output_file
-        self.open_output_btn.setEnabled(True)
-
-    def _check_folder(self, folder_path: str, base_url: str) -> None:
-        result = self.checker.check_folder(
-            folder_path,
-            base_url,
+        self.check_btn.setEnabled(False)
+        self.open_output_btn.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.progress_label.setText("")
+        self._update_log("开始检测死链...\n")
+
+        self.checker.timeout = int(self.timeout_spin.value())
+        self._worker = DeadLinkCheckWorker(
+            self.checker,
+            path,
+            self.base_url_input.text().strip(),
+            self._generate_output_filename(path),
             include_subfolders=self.include_subfolders.isChecked(),
-            progress_callback=self.update_progress,
+            fresh=self.fresh_check.isChecked(),
+            local_site=self.local_site_check.isChecked(),
+            parent=self,
         )
-
-        if result["total_files"] == 0:
+        self._worker.progress.connect(self.update_progress)
+        self._worker.finished_result.connect(self._on_check_finished)
+        self._worker.finished_error.connect(self._on_check_error)
+        self._worker.start()
+
+    def _on_check_finished(self, result: dict, output_file: str) -> None:
+        self._reset_check_controls()
+        if not output_file:
             show_warning(self, "提示", "未找到 HTML 文件。")
             self._update_log("未找到 HTML 文件。")
             return
 
-        output_file = self._generate_output_filename(folder_path)
-        self.checker.generate_report(result, output_file)
-
-        summary = self._format_folder_summary(result)
+        summary = self._format_summary(result) if "file" in result else self._format_folder_summary(result)
         self._update_log(summary)
 
         show_info(self, "完成", f"检测完成！报告已保存至：\n{output_file}")
         self.last_output_file = output_file
         self.open_output_btn.setEnabled(True)
 
+    def _on_check_error(self, message: str) -> None:
+        self._reset_check_controls()
+        show_error(self, "错误", f"检测时发生错误：{message}")
+        self._update_log(f"\n检测失败：{message}")
+
+    def _reset_check_controls(self) -> None:
+        self.check_btn.setEnabled(True)
+        self.progress_label.setText("")
+        self.progress_bar.setValue(0)
+
     def update_progress(self, current: int, total: int, item: str) -> None:
         if total <= 0:
             return
         progress = int((current / total) * 100)
         self.progress_bar.setValue(progress)
         self.progress_label.setText(f"正在检测: {item} ({current}/{total}) | {progress}%")
-        QApplication.processEvents()
 
     def open_output_folder(self) -> None:
         if not self.last_output_file:
@@ -270,6 +316,8 @@ class DeadLinkCheckerPage(QWidget):
         lines.append(f"文件: {result['file']}")
         lines.append(f"总链接数: {result['total_links']}")
         lines.append(f"唯一链接数: {result['unique_links']}")
+        if "cache_hits" in result:
+            lines.append(f"缓存命中: {result['cache_hits']}")
         lines.append("")
 
         summary = result["summary"]
@@ -310,6 +358,10 @@ class DeadLinkCheckerPage(QWidget):
         lines = []
         lines.append(f"文件夹: {result['folder']}")
         lines.append(f"总文件数: {result['total_files']}")
+        if "network_requests" in result:
+            lines.append(f"链接检测次数: {result['checks_requested']}（实际网络请求 {result['network_requests']} 次）")
+        if "cache_hits" in result:
+            lines.append(f"缓存命中: {result['cache_hits']}")
         lines.append("")
 
         total_alive = 0
@@ -334,6 +386,13 @@ class DeadLinkCheckerPage(QWidget):
         lines.append(f"  ⊘ 跳过: {total_skipped}")
         lines.append("")
 
+        unreachable_hosts = result.get("unreachable_hosts") or {}
+        if unreachable_hosts:
+            lines.append("不可达主机:")
+            for host, reason in unreachable_hosts.items():
+                lines.append(f"  {host}: {reason}")
+            lines.append("")
+
         files_with_dead_links = [f for f in result["files"] if f["summary"]["dead"] > 0]
         if files_with_dead_links:
             lines.append("包含死链的文件:")
@@ -365,3 +424,8 @@ class DeadLinkCheckerPage(QWidget):
                 self.path_input.setText(path)
                 return
 
+    def closeEvent(self, event) -> None:  # noqa: N802
+        if self._worker and self._worker.isRunning():
+            self._worker.wait(3000)
+        super().closeEvent(event)
+
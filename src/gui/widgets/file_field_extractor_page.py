@@ -18,6 +18,9 @@ from qfluentwidgets import (
 from ...utils.file_field_extractor_service import FileFieldExtractorService
 from ..qt_common import mono_font, select_existing_directory, show_error, show_info, show_warning
 
+# 网络共享上耗时主要在打开/读取文件的延迟，线程数可以高于 CPU 核数
+EXTRACT_WORKERS = 8
+
 
 class FileFieldExtractorPage(QWidget):
     def __init__(self, main_window) -> None:
@@ -73,11 +76,17 @@ class FileFieldExtractorPage(QWidget):
         self.header_spin = SpinBox()
         self.header_spin.setRange(1, 999)
         self.header_spin.setValue(1)
+        self.refresh_index_check = CheckBox("忽略缓存，重新读取全部文件")
+        self.profile_check = CheckBox("生成列画像（非空比例、去重数、类型、样例值）")
 
         option_row.addWidget(self.include_subfolders)
         option_row.addSpacing(16)
         option_row.addWidget(header_label)
         option_row.addWidget(self.header_spin)
+        option_row.addSpacing(16)
+        option_row.addWidget(self.refresh_index_check)
+        option_row.addSpacing(16)
+        option_row.addWidget(self.profile_check)
         option_row.addStretch(1)
         layout.addLayout(option_row)
 
@@ -133,6 +142,10 @@ class FileFieldExtractorPage(QWidget):
                 include_subfolders=self.include_subfolders.isChecked(),
                 header_row=header_row,
                 progress_callback=self.update_progress,
+                max_workers=EXTRACT_WORKERS,
+                use_index=True,
+                refresh_index=self.refresh_index_check.isChecked(),
+                profile=self.profile_check.isChecked(),
             )
 
             output_file = result["output_file"]
@@ -142,7 +155,10 @@ class FileFieldExtractorPage(QWidget):
             processed_files = result["processed_files"]
 
             preview_lines = [f"输出文件：{output_file}"]
+            if result.get("profile_file"):
+                preview_lines.append(f"列画像：{result['profile_file']}")
             preview_lines.append(f"共处理 {processed_files} 个文件，提取字段 {total_fields} 个。")
+            preview_lines.append(f"缓存命中 {result['index_hits']} 个，重新读取 {result['index_misses']} 个。")
             if errors:
                 preview_lines.append("\n出现问题的文件：")
                 preview_lines.extend(f"- {err}" for err in errors)
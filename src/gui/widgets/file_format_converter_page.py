@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import os
 
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QApplication, QHBoxLayout, QVBoxLayout, QWidget
+from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtWidgets import QHBoxLayout, QVBoxLayout, QWidget
 from qfluentwidgets import (
     BodyLabel,
     CaptionLabel,
+    CheckBox,
     ComboBox,
     PrimaryPushButton,
     ProgressBar,
@@ -14,13 +15,45 @@ from qfluentwidgets import (
     TitleLabel,
 )
 
-from ...utils.csv_quote_remover_service import CsvQuoteRemoverService
-from ...utils.csv_encoding_converter_service import CsvEncodingConverterService
-from ...utils.csv_to_xlsx_converter_service import CsvToXlsxConverterService
-from ...utils.xlsx_to_csv_converter_service import XlsxToCsvConverterService
+from ...utils.batch_conversion_runner import BatchConversionRunner
 from ..qt_common import FileListWidget, select_existing_directory, select_open_files, show_error, show_info, show_warning
 
 
+class BatchConversionWorker(QThread):
+    """在后台线程中驱动多进程批量转换，逐个文件回传结果。"""
+
+    file_done = Signal(str, bool, str, bool, str)  # (file_path, success, error, skipped, message)
+    finished_all = Signal(bool)  # cancelled
+    finished_error = Signal(str)
+
+    def __init__(
+        self,
+        mode: str,
+        files: list[str],
+        output_path: str | None,
+        incremental: bool = False,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self._mode = mode
+        self._files = files
+        self._output_path = output_path
+        self._incremental = incremental
+        self._runner = BatchConversionRunner()
+
+    def request_stop(self) -> None:
+        self._runner.cancel()
+
+    def run(self) -> None:
+        try:
+            results = self._runner.run(self._mode, self._files, self._output_path, incremental=self._incremental)
+            for result in results:
+                self.file_done.emit(result.file_path, result.success, result.error, result.skipped, result.message)
+            self.finished_all.emit(self._runner.cancelled)
+        except Exception as exc:  # pylint: disable=broad-except
+            self.finished_error.emit(str(exc))
+
+
 class FileFormatConverterPage(QWidget):
     """文件格式转换页面：CSV/XLSX/BOM/引号清理 四种模式。"""
 
@@ -30,10 +63,13 @@ class FileFormatConverterPage(QWidget):
         self.main_window = main_window
 
         self.output_path: str | None = None
-        self.csv_to_xlsx = CsvToXlsxConverterService()
-        self.xlsx_to_csv = XlsxToCsvConverterService()
-        self.csv_bom = CsvEncodingConverterService()
-        self.csv_quote = CsvQuoteRemoverService()
+        self._worker: BatchConversionWorker | None = None
+        self._batch_total = 0
+        self._batch_done = 0
+        self._batch_success = 0
+        self._batch_skipped = 0
+        self._batch_errors: list[str] = []
+        self._batch_notes: list[str] = []
 
         self.mode_config = {
             "csv_to_xlsx": {
@@ -125,6 +161,9 @@ class FileFormatConverterPage(QWidget):
         output_row.addWidget(select_output_btn)
         layout.addLayout(output_row)
 
+        self.incremental_check = CheckBox("增量转换（跳过自上次转换后未变化的文件）")
+        layout.addWidget(self.incremental_check)
+
         self.progress_bar = ProgressBar()
         self.progress_bar.setValue(0)
         self.progress_label = CaptionLabel("")
@@ -132,9 +171,16 @@ class FileFormatConverterPage(QWidget):
         layout.addWidget(self.progress_bar)
         layout.addWidget(self.progress_label)
 
+        button_row = QHBoxLayout()
         self.convert_btn = PrimaryPushButton("开始转换")
         self.convert_btn.clicked.connect(self.convert_files)
-        layout.addWidget(self.convert_btn, alignment=Qt.AlignLeft)
+        self.cancel_btn = PushButton("取消")
+        self.cancel_btn.clicked.connect(self.cancel_conversion)
+        self.cancel_btn.setEnabled(False)
+        button_row.addWidget(self.convert_btn)
+        button_row.addWidget(self.cancel_btn)
+        button_row.addStretch(1)
+        layout.addLayout(button_row)
 
         self.status_label = CaptionLabel("")
         self.status_label.setTextColor("#7A8190", "#7A8190")
@@ -183,57 +229,91 @@ class FileFormatConverterPage(QWidget):
             return
         progress = int((current / total) * 100)
         self.progress_bar.setValue(progress)
-        self.progress_label.setText(f"正在处理: {current_file} ({current}/{total})")
-        QApplication.processEvents()
-
-    def _convert_single(self, file_path: str):
-        mode = self.current_mode()
-        if mode == "csv_to_xlsx":
-            return self.csv_to_xlsx.convert_file(file_path, self.output_path)
-        if mode == "xlsx_to_csv":
-            return self.xlsx_to_csv.convert_file(file_path, self.output_path)
-        if mode == "csv_bom":
-            return self.csv_bom.convert_file(file_path, self.output_path)
-        return self.csv_quote.process_file(file_path, self.output_path)
+        self.progress_label.setText(f"已完成: {current_file} ({current}/{total})")
 
     def convert_files(self) -> None:
+        if self._worker and self._worker.isRunning():
+            show_warning(self, "提示", "正在转换中，请稍候...")
+            return
+
         files = self.file_list.paths()
         if not files:
             show_warning(self, "警告", "请先选择要转换的文件！")
             return
 
+        self._batch_total = len(files)
+        self._batch_done = 0
+        self._batch_success = 0
+        self._batch_skipped = 0
+        self._batch_errors = []
+        self._batch_notes = []
         self.convert_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(True)
+        self.progress_bar.setValue(0)
+        self.progress_label.setText("准备中...")
+
+        self._worker = BatchConversionWorker(
+            self.current_mode(),
+            files,
+            self.output_path,
+            incremental=self.incremental_check.isChecked(),
+            parent=self,
+        )
+        self._worker.file_done.connect(self._on_file_done)
+        self._worker.finished_all.connect(self._on_batch_finished)
+        self._worker.finished_error.connect(self._on_batch_error)
+        self._worker.start()
+
+    def cancel_conversion(self) -> None:
+        if self._worker and self._worker.isRunning():
+            self._worker.request_stop()
+            self.cancel_btn.setEnabled(False)
+            self.progress_label.setText("正在取消，等待进行中的文件完成...")
+
+    def _on_file_done(self, file_path: str, success: bool, error_msg: str, skipped: bool, message: str) -> None:
+        self._batch_done += 1
+        if skipped:
+            self._batch_skipped += 1
+        if success:
+            self._batch_success += 1
+            if message:
+                self._batch_notes.append(f"{os.path.basename(file_path)}：{message}")
+        else:
+            self._batch_errors.append(f"{file_path} (错误: {error_msg})")
+        self.update_progress(self._batch_done, self._batch_total, os.path.basename(file_path))
+
+    def _on_batch_finished(self, cancelled: bool) -> None:
+        self._reset_batch_controls()
+        total = self._batch_total
+        success_count = self._batch_success
+        skipped_note = f"\n其中 {self._batch_skipped} 个文件未变化，已跳过。" if self._batch_skipped else ""
+        notes = "\n\n处理结果：\n" + "\n".join(self._batch_notes) if self._batch_notes else ""
+        if cancelled:
+            show_info(self, "已取消", f"转换已取消，已成功转换 {success_count}/{total} 个文件。{notes}")
+        elif self._batch_errors:
+            error_msg = "以下文件转换失败：\n\n" + "\n".join(self._batch_errors)
+            show_warning(
+                self, "转换完成", f"成功转换 {success_count}/{total} 个文件{skipped_note}{notes}\n\n{error_msg}"
+            )
+        else:
+            show_info(self, "转换完成", f"成功转换所有 {total} 个文件！{skipped_note}{notes}")
 
-        try:
-            total = len(files)
-            success_count = 0
-            error_files = []
-
-            for i, file in enumerate(files, 1):
-                try:
-                    self.update_progress(i, total, os.path.basename(file))
-                    success, error_msg = self._convert_single(file)
-                    if success:
-                        success_count += 1
-                    else:
-                        error_files.append(f"{file} (错误: {error_msg})")
-                except Exception as exc:  # pylint: disable=broad-except
-                    error_files.append(f"{file} (错误: {exc})")
-
-            if error_files:
-                error_msg = "以下文件转换失败：\n\n" + "\n".join(error_files)
-                show_warning(self, "转换完成", f"成功转换 {success_count}/{total} 个文件\n\n{error_msg}")
-            else:
-                show_info(self, "转换完成", f"成功转换所有 {total} 个文件！")
-
-            self.progress_bar.setValue(0)
-            self.progress_label.setText("")
-        except Exception as exc:  # pylint: disable=broad-except
-            show_error(self, "错误", f"转换过程中发生错误：{exc}")
-        finally:
-            self.convert_btn.setEnabled(True)
+    def _on_batch_error(self, message: str) -> None:
+        self._reset_batch_controls()
+        show_error(self, "错误", f"转换过程中发生错误：{message}")
+
+    def _reset_batch_controls(self) -> None:
+        self.convert_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.progress_label.setText("")
 
     def clear_file_list(self) -> None:
         self.file_list.clear()
         self.status_label.setText("")
 
+    def closeEvent(self, event) -> None:  # noqa: N802
+        if self._worker and self._worker.isRunning():
+            self._worker.request_stop()
+            self._worker.wait(3000)
+        super().closeEvent(event)
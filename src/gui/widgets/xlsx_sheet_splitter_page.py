@@ -4,7 +4,16 @@ import os
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication, QHBoxLayout, QVBoxLayout, QWidget
-from qfluentwidgets import BodyLabel, CaptionLabel, LineEdit, PrimaryPushButton, ProgressBar, PushButton, TitleLabel
+from qfluentwidgets import (
+    BodyLabel,
+    CaptionLabel,
+    CheckBox,
+    LineEdit,
+    PrimaryPushButton,
+    ProgressBar,
+    PushButton,
+    TitleLabel,
+)
 
 from ...utils.xlsx_sheet_splitter_service import XlsxSheetSplitterService
 from ..qt_common import select_existing_directory, select_open_file, show_error, show_info, show_warning
@@ -17,7 +26,6 @@ class XlsxSheetSplitterPage(QWidget):
         self.main_window = main_window
 
         self.output_path: str | None = None
-        self.sheet_splitter = XlsxSheetSplitterService()
 
         self._build_ui()
         self.setAcceptDrops(True)
@@ -70,6 +78,21 @@ class XlsxSheetSplitterPage(QWidget):
         output_row.addWidget(select_output_btn)
         layout.addLayout(output_row)
 
+        filter_row = QHBoxLayout()
+        filter_label = BodyLabel("工作表筛选")
+        self.sheet_filter_input = LineEdit()
+        self.sheet_filter_input.setPlaceholderText("留空导出全部；多个名称用逗号分隔，支持通配符，如 DM, AE*, LB")
+        preview_btn = PushButton("预览工作表")
+        preview_btn.clicked.connect(self.preview_sheets)
+
+        filter_row.addWidget(filter_label)
+        filter_row.addWidget(self.sheet_filter_input, stretch=1)
+        filter_row.addWidget(preview_btn)
+        layout.addLayout(filter_row)
+
+        self.number_format_check = CheckBox("数字按 Excel 显示格式导出（小数位、百分比、千分位）")
+        layout.addWidget(self.number_format_check)
+
         self.progress_bar = ProgressBar()
         self.progress_bar.setValue(0)
         self.progress_label = CaptionLabel("")
@@ -106,6 +129,41 @@ class XlsxSheetSplitterPage(QWidget):
         self.file_input.setText(file_path)
         self.status_label.setText(f"已选择: {os.path.basename(file_path)}")
 
+    def _sheet_patterns(self) -> list[str] | None:
+        patterns = [item.strip() for item in self.sheet_filter_input.text().replace("，", ",").split(",")]
+        patterns = [item for item in patterns if item]
+        return patterns or None
+
+    def preview_sheets(self) -> None:
+        input_file = self.file_input.text().strip()
+        if not input_file:
+            show_warning(self, "提示", "请先选择要处理的 Excel 文件。")
+            return
+
+        try:
+            inventory = XlsxSheetSplitterService().inventory(input_file)
+            selected = set(
+                XlsxSheetSplitterService.select_sheets(
+                    [item["sheet"] for item in inventory], include=self._sheet_patterns()
+                )
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            show_error(self, "错误", f"读取工作表信息失败：{exc}")
+            return
+
+        lines = []
+        for item in inventory:
+            rows, columns = item["estimated_rows"], item["estimated_columns"]
+            size = f"约 {rows} 行 × {columns} 列" if rows is not None else "未声明范围"
+            mark = "✓" if item["sheet"] in selected else "  "
+            hidden = "（隐藏）" if item["state"] != "visible" else ""
+            lines.append(f"{mark} {item['sheet']}{hidden}：{size}")
+        show_info(
+            self,
+            "工作表预览",
+            f"共 {len(inventory)} 个工作表，将导出 {len(selected)} 个：\n\n" + "\n".join(lines),
+        )
+
     def update_progress(self, current: int, total: int, sheet_name: str) -> None:
         if total <= 0:
             return
@@ -125,10 +183,16 @@ class XlsxSheetSplitterPage(QWidget):
             self.progress_bar.setValue(0)
             self.progress_label.setText("")
 
-            result = self.sheet_splitter.split_file(
+            sheet_splitter = XlsxSheetSplitterService(
+                engine="fast",
+                render_number_formats=self.number_format_check.isChecked(),
+            )
+            result = sheet_splitter.split_file(
                 input_file,
                 output_path=self.output_path,
                 progress_callback=self.update_progress,
+                workers=os.cpu_count() or 1,
+                include=self._sheet_patterns(),
             )
 
             total = result["total_sheets"]
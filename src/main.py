@@ -1,3 +1,4 @@
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -43,4 +44,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # 打包后的程序在批量转换中使用多进程，子进程需要经由 freeze_support 启动
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,189 @@
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .conversion_manifest import ConversionManifest, file_fingerprint
+from .csv_encoding_converter_service import CsvEncodingConverterService
+from .csv_quote_remover_service import CsvQuoteRemoverService
+from .csv_to_xlsx_converter_service import CsvToXlsxConverterService
+from .xlsx_to_csv_converter_service import XlsxToCsvConverterService
+
+
+CONVERSION_MODES = ("csv_to_xlsx", "xlsx_to_csv", "csv_bom", "csv_quote")
+
+
+def convert_single(mode: str, file_path: str, output_path: Optional[str] = None) -> Tuple[bool, str]:
+    """按转换模式处理单个文件（模块级函数，便于在子进程中执行）。
+
+    返回 (是否成功, 信息)：失败时为错误信息，成功时为可选的处理说明（如引号去除的统计）。
+    """
+    if mode == "csv_to_xlsx":
+        return CsvToXlsxConverterService.convert_file_streaming(file_path, output_path)
+    if mode == "xlsx_to_csv":
+        return XlsxToCsvConverterService.convert_file_streaming(file_path, output_path, engine="fast")
+    if mode == "csv_bom":
+        return CsvEncodingConverterService(streaming=True).convert_file(file_path, output_path)
+    if mode == "csv_quote":
+        return CsvQuoteRemoverService.process_file(file_path, output_path)
+    raise ValueError(f"未知的转换模式: {mode}")
+
+
+def expected_outputs(mode: str, file_path: str, output_path: Optional[str] = None) -> List[str]:
+    """返回某个文件在给定模式下的输出文件路径（用于增量清单）。"""
+    directory = output_path or os.path.dirname(file_path)
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    if mode == "csv_to_xlsx":
+        return [os.path.join(directory, stem + ".xlsx")]
+    if mode == "xlsx_to_csv":
+        return [os.path.join(directory, stem + ".csv")]
+    return [os.path.join(directory, os.path.basename(file_path))]
+
+
+def _convert_and_fingerprint(
+    mode: str,
+    file_path: str,
+    output_path: Optional[str],
+    with_fingerprint: bool,
+) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+    """转换单个文件，并在需要时于同一进程内计算转换后的输入文件指纹。"""
+    success, error = convert_single(mode, file_path, output_path)
+    fingerprint = file_fingerprint(file_path) if success and with_fingerprint else None
+    return success, error, fingerprint
+
+
+@dataclass
+class ConversionResult:
+    file_path: str
+    success: bool
+    error: str = ""
+    skipped: bool = False
+    message: str = ""  # 成功时转换器给出的处理说明
+
+
+class BatchConversionRunner:
+    """多进程批量转换执行器。
+
+    文件按大小从大到小派发到进程池（默认进程数为 CPU 核数），
+    先处理大文件以缩短整批的尾部等待；每个文件完成后立即产出结果。
+    调用 cancel() 后不再派发新文件，已在子进程中运行的文件会执行完毕但不再产出结果。
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def run(
+        self,
+        mode: str,
+        files: Iterable[str],
+        output_path: Optional[str] = None,
+        incremental: bool = False,
+    ) -> Iterator[ConversionResult]:
+        """执行批量转换，按完成顺序逐个产出 ConversionResult。
+
+        incremental=True 时读取输出目录中的转换清单，输入与设置均未变化的文件
+        直接产出 skipped=True 的结果，转换成功的文件写回清单。
+        """
+        if mode not in CONVERSION_MODES:
+            raise ValueError(f"未知的转换模式: {mode}")
+
+        self._cancel_event.clear()
+        settings = self._settings(mode, output_path)
+        manifests: Dict[str, ConversionManifest] = {}
+
+        def manifest_for(file_path: str) -> ConversionManifest:
+            manifest_path = ConversionManifest.path_for(file_path, output_path)
+            if manifest_path not in manifests:
+                manifests[manifest_path] = ConversionManifest(manifest_path)
+            return manifests[manifest_path]
+
+        try:
+            pending: List[str] = []
+            for file_path in self._order_by_size(files):
+                if incremental and manifest_for(file_path).is_up_to_date(file_path, settings):
+                    yield ConversionResult(file_path, True, skipped=True)
+                else:
+                    pending.append(file_path)
+
+            for file_path, success, error, fingerprint in self._dispatch(mode, pending, output_path, incremental):
+                if incremental and success:
+                    manifest_for(file_path).record(
+                        file_path,
+                        settings,
+                        expected_outputs(mode, file_path, output_path),
+                        fingerprint,
+                    )
+                if success:
+                    yield ConversionResult(file_path, True, message=error)
+                else:
+                    yield ConversionResult(file_path, False, error)
+        finally:
+            for manifest in manifests.values():
+                try:
+                    manifest.save()
+                except OSError:
+                    pass
+
+    def _dispatch(
+        self,
+        mode: str,
+        files: List[str],
+        output_path: Optional[str],
+        with_fingerprint: bool,
+    ) -> Iterator[Tuple[str, bool, str, Optional[Dict[str, Any]]]]:
+        workers = min(self.max_workers, len(files))
+        if workers <= 1:
+            for file_path in files:
+                if self.cancelled:
+                    return
+                try:
+                    yield (file_path, *_convert_and_fingerprint(mode, file_path, output_path, with_fingerprint))
+                except Exception as exc:  # pylint: disable=broad-except
+                    yield file_path, False, str(exc), None
+            return
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            pending: Dict[Future, str] = {
+                executor.submit(_convert_and_fingerprint, mode, file_path, output_path, with_fingerprint): file_path
+                for file_path in files
+            }
+            while pending and not self.cancelled:
+                # 定时醒来检查取消标记，避免长时间阻塞在单个大文件上
+                done, _ = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file_path = pending.pop(future)
+                    try:
+                        yield (file_path, *future.result())
+                    except Exception as exc:  # pylint: disable=broad-except
+                        yield file_path, False, str(exc), None
+                    if self.cancelled:
+                        break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _settings(mode: str, output_path: Optional[str]) -> Dict[str, Any]:
+        return {
+            "mode": mode,
+            "output_path": os.path.abspath(output_path) if output_path else None,
+        }
+
+    @staticmethod
+    def _order_by_size(files: Iterable[str]) -> List[str]:
+        def size_of(path: str) -> int:
+            try:
+                return os.path.getsize(path)
+            except OSError:
+                return 0
+
+        return sorted(files, key=size_of, reverse=True)
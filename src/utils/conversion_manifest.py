@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from .file_utils import atomic_write
+
+
+MANIFEST_FILENAME = "_conversion_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def file_fingerprint(file_path: str, chunk_size: int = 1024 * 1024) -> Dict[str, Any]:
+    """返回文件的大小、修改时间（纳秒）与 SHA-256 内容哈希。"""
+    stat = os.stat(file_path)
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as handle:
+        while True:
+            chunk = handle.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest.hexdigest()}
+
+
+class ConversionManifest:
+    """增量转换清单：记录每个输入文件上次成功转换时的指纹、设置与输出文件。
+
+    清单以 JSON 保存在输出目录中（未指定输出目录时保存在输入文件所在目录），
+    键为输入文件的绝对路径。输入文件大小、修改时间与设置均未变化、且输出文件
+    仍然存在时视为无需重新转换；仅修改时间变化时再比较内容哈希。
+    """
+
+    def __init__(self, manifest_path: str) -> None:
+        self.manifest_path = manifest_path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self.load()
+
+    @staticmethod
+    def path_for(input_file: str, output_path: Optional[str] = None) -> str:
+        directory = output_path or os.path.dirname(os.path.abspath(input_file))
+        return os.path.join(directory, MANIFEST_FILENAME)
+
+    def load(self) -> None:
+        self.entries = {}
+        if not os.path.isfile(self.manifest_path):
+            return
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError):
+            return
+        if isinstance(payload, dict) and payload.get("version") == MANIFEST_VERSION:
+            files = payload.get("files")
+            if isinstance(files, dict):
+                self.entries = files
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        with atomic_write(self.manifest_path, "w", encoding="utf-8") as handle:
+            json.dump(
+                {"version": MANIFEST_VERSION, "files": self.entries},
+                handle,
+                ensure_ascii=False,
+                indent=2,
+            )
+        self._dirty = False
+
+    def is_up_to_date(self, input_file: str, settings: Dict[str, Any]) -> bool:
+        entry = self.entries.get(os.path.abspath(input_file))
+        if not entry or entry.get("settings") != settings:
+            return False
+        if not all(os.path.exists(path) for path in entry.get("outputs", [])):
+            return False
+
+        try:
+            stat = os.stat(input_file)
+        except OSError:
+            return False
+        if stat.st_size != entry.get("size"):
+            return False
+        if stat.st_mtime_ns == entry.get("mtime_ns"):
+            return True
+
+        # 仅修改时间变化（例如被重新复制）时比较内容哈希
+        fingerprint = file_fingerprint(input_file)
+        if fingerprint["sha256"] != entry.get("sha256"):
+            return False
+        entry["mtime_ns"] = fingerprint["mtime_ns"]
+        self._dirty = True
+        return True
+
+    def record(
+        self,
+        input_file: str,
+        settings: Dict[str, Any],
+        outputs: List[str],
+        fingerprint: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """记录一次成功转换；fingerprint 应在转换完成后计算（原地覆盖模式下输入即输出）。"""
+        fingerprint = fingerprint or file_fingerprint(input_file)
+        self.entries[os.path.abspath(input_file)] = {
+            "size": fingerprint["size"],
+            "mtime_ns": fingerprint["mtime_ns"],
+            "sha256": fingerprint["sha256"],
+            "mode": settings.get("mode"),
+            "settings": settings,
+            "outputs": [os.path.abspath(path) for path in outputs],
+        }
+        self._dirty = True
@@ -1,5 +1,9 @@
+import codecs
 import os
-from typing import Iterable, Optional, Tuple
+from typing import BinaryIO, Iterable, List, Optional, Tuple
+
+from .encoding_detector import EncodingDetector, get_default_detector
+from .file_utils import atomic_write
 
 
 class CsvEncodingConverterService:
@@ -9,6 +13,10 @@ class CsvEncodingConverterService:
         self,
         target_encoding: str = "utf-8-sig",
         fallback_encodings: Optional[Iterable[str]] = None,
+        streaming: bool = False,
+        chunk_size: int = 1024 * 1024,
+        sample_size: int = 64 * 1024,
+        encoding_detector: Optional[EncodingDetector] = None,
     ) -> None:
         self.target_encoding = target_encoding
         self.fallback_encodings = list(fallback_encodings) if fallback_encodings else [
@@ -18,11 +26,19 @@ class CsvEncodingConverterService:
             "cp936",
             "latin1",
         ]
+        self.streaming = streaming
+        self.chunk_size = chunk_size
+        self.sample_size = sample_size
+        self.encoding_detector = encoding_detector or get_default_detector()
+
+    def _ordered_encodings(self, file_path: str) -> List[str]:
+        """探测到的编码排在最前（仅当它属于候选编码），其余候选编码按原顺序跟随。"""
+        return self.encoding_detector.order_candidates(file_path, self.fallback_encodings)
 
     def _read_with_fallback(self, file_path: str) -> str:
         """按序尝试不同编码读取文件，直到成功。"""
         last_error = None
-        for encoding in self.fallback_encodings:
+        for encoding in self._ordered_encodings(file_path):
             try:
                 with open(file_path, "r", encoding=encoding, newline="") as file:
                     return file.read()
@@ -45,17 +61,72 @@ class CsvEncodingConverterService:
             (是否成功, 错误信息)。
         """
         try:
-            content = self._read_with_fallback(input_file)
-
             if output_path:
                 os.makedirs(output_path, exist_ok=True)
                 output_file = os.path.join(output_path, os.path.basename(input_file))
             else:
                 output_file = input_file
 
+            if self.streaming:
+                self._convert_streaming(input_file, output_file)
+                return True, ""
+
+            content = self._read_with_fallback(input_file)
+
             with open(output_file, "w", encoding=self.target_encoding, newline="") as file:
                 file.write(content)
 
             return True, ""
         except Exception as e:
             return False, str(e)
+
+    def _convert_streaming(self, input_file: str, output_file: str) -> None:
+        """按固定大小分块转码，输出先写入临时文件，完成后原子替换目标文件。
+
+        编码由文件开头的有限字节样本确定；若后续分块解码失败，
+        清空临时文件并用下一个候选编码从头重来。
+        """
+        candidates = self._candidate_encodings(input_file)
+        last_error: Optional[UnicodeDecodeError] = None
+
+        with atomic_write(output_file, "wb") as handle:
+            for encoding in candidates:
+                handle.seek(0)
+                handle.truncate()
+                try:
+                    self._transcode(input_file, handle, encoding)
+                    return
+                except UnicodeDecodeError as exc:
+                    last_error = exc
+                    continue
+
+            if last_error:
+                raise last_error
+            raise UnicodeDecodeError("utf-8", b"", 0, 1, "无法识别文件编码")
+
+    def _candidate_encodings(self, input_file: str) -> List[str]:
+        """探测到的编码优先；其余候选编码先用字节样本筛选，只保留样本可解码的。"""
+        ordered = self._ordered_encodings(input_file)
+        with open(input_file, "rb") as file:
+            sample = file.read(self.sample_size)
+
+        accepted: List[str] = ordered[:1]
+        for encoding in ordered[1:]:
+            try:
+                # final=False：样本末尾被截断的多字节字符不算作解码错误
+                codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+            except UnicodeDecodeError:
+                continue
+            accepted.append(encoding)
+        return accepted
+
+    def _transcode(self, input_file: str, handle: BinaryIO, encoding: str) -> None:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        encoder = codecs.getincrementalencoder(self.target_encoding)()
+        with open(input_file, "rb") as source:
+            while True:
+                chunk = source.read(self.chunk_size)
+                if not chunk:
+                    break
+                handle.write(encoder.encode(decoder.decode(chunk)))
+            handle.write(encoder.encode(decoder.decode(b"", final=True), final=True))
@@ -1,6 +1,8 @@
 import os
 import csv
-from typing import Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+
+from .file_utils import atomic_write
 
 class CsvQuoteRemoverService:
     """CSV引号去除处理器
@@ -17,18 +19,43 @@ class CsvQuoteRemoverService:
             output_path (Optional[str]): 输出文件夹路径，如果为None则输出到原文件所在目录
             
         Returns:
-            Tuple[bool, str]: (是否成功, 错误消息)
+            Tuple[bool, str]: (是否成功, 错误消息)；成功时为处理统计，如 "处理 3 行，去除 4 个引号"
         """
         try:
-            # 确定输出文件路径
-            if output_path:
-                # 使用原文件名
-                file_name = os.path.basename(input_file)
-                output_file = os.path.join(output_path, file_name)
-            else:
-                # 直接覆盖原文件
-                output_file = input_file
+            stats = CsvQuoteRemoverService.clean_file(input_file, output_path)
+            return True, f"处理 {stats['rows']} 行，去除 {stats['quotes_removed']} 个引号"
+            
+        except Exception as e:
+            return False, str(e)
+    
+    @staticmethod
+    def clean_file(input_file: str, output_path: Optional[str] = None) -> Dict[str, object]:
+        """逐行读取、清理并写出CSV文件，返回处理统计
+        
+        每读取一行即清理并写入同目录下的临时文件，全部完成后原子替换目标文件，
+        内存中只保留当前行。分隔符仍由文件开头的样本自动检测。
+        
+        Args:
+            input_file (str): 输入CSV文件路径
+            output_path (Optional[str]): 输出文件夹路径，如果为None则直接覆盖原文件
             
+        Returns:
+            Dict[str, object]: 包含 output_file、rows（处理行数）、quotes_removed（去除的引号数）
+        """
+        # 确定输出文件路径
+        if output_path:
+            # 使用原文件名
+            file_name = os.path.basename(input_file)
+            output_file = os.path.join(output_path, file_name)
+        else:
+            # 直接覆盖原文件
+            output_file = input_file
+        
+        rows = 0
+        quotes_removed = 0
+        
+        # 先打开临时输出再打开输入：输入文件关闭后才会替换目标文件
+        with atomic_write(output_file, 'w', encoding='utf-8-sig', newline='') as outfile:
             # 读取CSV文件，使用UTF-8-sig编码处理BOM
             with open(input_file, 'r', encoding='utf-8-sig', newline='') as infile:
                 # 自动检测CSV方言
@@ -37,34 +64,40 @@ class CsvQuoteRemoverService:
                 sniffer = csv.Sniffer()
                 delimiter = sniffer.sniff(sample).delimiter
                 
-                # 读取数据
                 reader = csv.reader(infile, delimiter=delimiter)
-                rows = list(reader)
-            
-            # 处理数据，去除每个字段中不必要的引号
-            cleaned_rows = []
-            for row in rows:
-                cleaned_row = []
-                for field in row:
-                    # 移除字段开头和结尾的引号
-                    cleaned_field = field.strip()
-                    # 处理可能有多层引号的情况
-                    while cleaned_field.startswith('"') and cleaned_field.endswith('"'):
-                        cleaned_field = cleaned_field[1:-1]
-                    # 处理字段内部的双引号转义
-                    cleaned_field = cleaned_field.replace('""', '"')
-                    cleaned_row.append(cleaned_field)
-                cleaned_rows.append(cleaned_row)
-            
-            # 写入处理后的CSV文件，使用UTF-8-sig保持BOM
-            with open(output_file, 'w', encoding='utf-8-sig', newline='') as outfile:
+                # 写入处理后的CSV文件，使用UTF-8-sig保持BOM
                 writer = csv.writer(outfile, delimiter=delimiter, quoting=csv.QUOTE_MINIMAL)
-                writer.writerows(cleaned_rows)
-            
-            return True, ""
-            
-        except Exception as e:
-            return False, str(e)
+                for row in reader:
+                    cleaned_row, removed = CsvQuoteRemoverService._clean_row(row)
+                    writer.writerow(cleaned_row)
+                    rows += 1
+                    quotes_removed += removed
+        
+        return {
+            "output_file": output_file,
+            "rows": rows,
+            "quotes_removed": quotes_removed,
+        }
+    
+    @staticmethod
+    def _clean_row(row: List[str]) -> Tuple[List[str], int]:
+        """去除每个字段中不必要的引号，返回 (清理后的行, 去除的引号数)"""
+        cleaned_row = []
+        removed = 0
+        for field in row:
+            # 移除字段开头和结尾的引号
+            cleaned_field = field.strip()
+            # 处理可能有多层引号的情况
+            while cleaned_field.startswith('"') and cleaned_field.endswith('"'):
+                cleaned_field = cleaned_field[1:-1]
+                removed += 2
+            # 处理字段内部的双引号转义
+            escaped = cleaned_field.count('""')
+            if escaped:
+                cleaned_field = cleaned_field.replace('""', '"')
+                removed += escaped
+            cleaned_row.append(cleaned_field)
+        return cleaned_row, removed
     
     @staticmethod
     def validate_csv_file(file_path: str) -> bool:
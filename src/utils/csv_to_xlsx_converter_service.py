@@ -1,20 +1,67 @@
-﻿import os
+﻿import csv
+import os
 import pandas as pd
 from typing import Tuple, Optional
 
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+
+EXCEL_MAX_ROWS = 1048576
+
+
+class _RollingXlsxWriter:
+    """write-only 工作簿写出器，支持续写到新工作表或新工作簿。"""
+
+    def __init__(self, output_file: str, split_workbooks: bool) -> None:
+        self.output_file = output_file
+        self.split_workbooks = split_workbooks
+        self.part_index = 1
+        self.sheet_index = 1
+        self._new_workbook()
+
+    def _new_workbook(self) -> None:
+        self.workbook = Workbook(write_only=True)
+        self.sheet_index = 1
+        self._new_sheet()
+
+    def _new_sheet(self) -> None:
+        self.worksheet = self.workbook.create_sheet(f'Sheet{self.sheet_index}')
+        # 只构造一次文本样式，之后该工作表的所有单元格共享同一个 StyleArray，
+        # 避免逐个单元格设置 number_format 带来的样式查找开销。
+        style_cell = WriteOnlyCell(self.worksheet)
+        style_cell.number_format = '@'
+        self.text_style = style_cell._style
+
+    def append(self, row) -> None:
+        self.worksheet.append(
+            [CsvToXlsxConverterService._make_text_cell(self.worksheet, value, self.text_style) for value in row]
+        )
+
+    def roll_over(self) -> None:
+        if self.split_workbooks:
+            self.workbook.save(self._part_file(self.part_index))
+            self.part_index += 1
+            self._new_workbook()
+        else:
+            self.sheet_index += 1
+            self._new_sheet()
+
+    def close(self) -> None:
+        target = self.output_file if self.part_index == 1 else self._part_file(self.part_index)
+        self.workbook.save(target)
+
+    def _part_file(self, index: int) -> str:
+        base, ext = os.path.splitext(self.output_file)
+        return f'{base}_part{index:03d}{ext}'
+
+
 class CsvToXlsxConverterService:
     @staticmethod
     def convert_file(input_file: str, output_path: Optional[str] = None) -> Tuple[bool, str]:
         try:
             df = pd.read_csv(input_file, dtype=str, na_filter=False)
             
-            if output_path:
-                output_file = os.path.join(
-                    output_path,
-                    os.path.splitext(os.path.basename(input_file))[0] + '.xlsx'
-                )
-            else:
-                output_file = os.path.splitext(input_file)[0] + '.xlsx'
+            output_file = CsvToXlsxConverterService._build_output_file(input_file, output_path)
             
             with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
                 df.to_excel(writer, index=False, sheet_name='Sheet1')
@@ -27,3 +74,90 @@ class CsvToXlsxConverterService:
             
         except Exception as e:
             return False, str(e)
+
+    @staticmethod
+    def convert_file_streaming(
+        input_file: str,
+        output_path: Optional[str] = None,
+        max_rows_per_sheet: int = EXCEL_MAX_ROWS,
+        max_bytes_per_sheet: Optional[int] = None,
+        split_workbooks: bool = False,
+    ) -> Tuple[bool, str]:
+        """逐行读取 CSV 并通过 openpyxl write-only 工作簿写出 XLSX。
+
+        与 convert_file 不同，整个过程不构建 DataFrame，也不在写出后二次遍历单元格，
+        所有单元格在写入时即共享同一个文本格式（'@'），内存占用与文件大小无关。
+
+        当前工作表达到行数上限（默认 Excel 的 1,048,576 行，含表头）或单元格文本
+        累计长度超过 max_bytes_per_sheet 时，自动续写到 Sheet2、Sheet3 ……；
+        split_workbooks=True 时改为续写到 <文件名>_part002.xlsx 等独立工作簿。
+        每个工作表/工作簿都会重复写入 CSV 的首行作为表头，CSV 只读取一遍。
+
+        Args:
+            input_file: 输入 CSV 文件路径（UTF-8，可带 BOM）。
+            output_path: 输出目录，None 时输出到原文件所在目录。
+            max_rows_per_sheet: 每个工作表的最大行数（含表头）。
+            max_bytes_per_sheet: 每个工作表的单元格文本长度预算，None 表示不限制。
+            split_workbooks: 超限时是否拆分为多个工作簿（默认拆分为多个工作表）。
+
+        Returns:
+            (是否成功, 错误信息)。
+        """
+        try:
+            if max_rows_per_sheet < 2 or max_rows_per_sheet > EXCEL_MAX_ROWS:
+                raise ValueError(f"每个工作表的行数上限必须在 2 到 {EXCEL_MAX_ROWS} 之间")
+
+            output_file = CsvToXlsxConverterService._build_output_file(input_file, output_path)
+            writer = _RollingXlsxWriter(output_file, split_workbooks)
+
+            with open(input_file, 'r', encoding='utf-8-sig', newline='') as infile:
+                reader = csv.reader(infile)
+                header = next(reader, None)
+                if header is not None:
+                    header_bytes = CsvToXlsxConverterService._row_size(header)
+                    writer.append(header)
+                    sheet_rows = 1
+                    sheet_bytes = header_bytes
+
+                    for row in reader:
+                        row_bytes = CsvToXlsxConverterService._row_size(row)
+                        over_rows = sheet_rows >= max_rows_per_sheet
+                        over_bytes = (
+                            max_bytes_per_sheet is not None
+                            and sheet_rows > 1
+                            and sheet_bytes + row_bytes > max_bytes_per_sheet
+                        )
+                        if over_rows or over_bytes:
+                            writer.roll_over()
+                            writer.append(header)
+                            sheet_rows = 1
+                            sheet_bytes = header_bytes
+
+                        writer.append(row)
+                        sheet_rows += 1
+                        sheet_bytes += row_bytes
+
+            writer.close()
+            return True, ""
+
+        except Exception as e:
+            return False, str(e)
+
+    @staticmethod
+    def _row_size(row) -> int:
+        return sum(len(value) for value in row) + len(row)
+
+    @staticmethod
+    def _make_text_cell(worksheet, value: str, text_style) -> WriteOnlyCell:
+        cell = WriteOnlyCell(worksheet, value if value != '' else None)
+        cell._style = text_style
+        return cell
+
+    @staticmethod
+    def _build_output_file(input_file: str, output_path: Optional[str]) -> str:
+        if output_path:
+            return os.path.join(
+                output_path,
+                os.path.splitext(os.path.basename(input_file))[0] + '.xlsx'
+            )
+        return os.path.splitext(input_file)[0] + '.xlsx'
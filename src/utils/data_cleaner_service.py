@@ -1,11 +1,17 @@
 ﻿import pandas as pd
 import os
 
+from .fast_xlsx_reader import FastXlsxReader, read_sheet_frame, validate_engine
+
 class DataCleanerService:
     # 常量数组
     NEED_KEY = ['○','〇','◯']  # 根据实际情况填写
 
-    def __init__(self):
+    def __init__(self, engine: str = "openpyxl"):
+        """
+        :param engine: 规则文件读取引擎，"openpyxl"（pandas.read_excel）或 "fast"（FastXlsxReader）
+        """
+        self.engine = validate_engine(engine)
         self.rule_file = None
         self.PAT = set()
         self.KEEP = dict()
@@ -20,12 +26,12 @@ class DataCleanerService:
         self.rule_file = file_path
 
         # 读取 Patients 表
-        df_patients = pd.read_excel(self.rule_file, sheet_name='Patients', dtype=str, na_filter=False)
+        df_patients = self._read_rule_sheet('Patients')
         df_patients = df_patients[df_patients['MIGRATIONFLAG'].isin(self.NEED_KEY)]
         self.PAT = set(df_patients['SUBJID'].dropna())
 
         # 读取 Process 表 (列名在第二行，故跳过第一行)
-        df_process = pd.read_excel(self.rule_file, sheet_name='Process', header=1, dtype=str, na_filter=False)
+        df_process = self._read_rule_sheet('Process', header=1)
         df_process = df_process[df_process['MIGRATIONFLAG'].isin(self.NEED_KEY)]
 
         self.KEEP = {}
@@ -40,7 +46,7 @@ class DataCleanerService:
             
         # 读取 File 表以获取行过滤逻辑和SUBJIDFIELDID
         try:
-            df_file = pd.read_excel(self.rule_file, sheet_name='Files', dtype=str, na_filter=False)
+            df_file = self._read_rule_sheet('Files')
             df_file = df_file[df_file['MIGRATIONFLAG'].isin(self.NEED_KEY)]
             
             self.ROW_FILTERS = {}
@@ -68,6 +74,12 @@ class DataCleanerService:
         except Exception as e:
             print(f"处理File表时出错: {e}")
 
+    def _read_rule_sheet(self, sheet_name: str, header: int = 0) -> pd.DataFrame:
+        if self.engine == "fast":
+            with FastXlsxReader(self.rule_file) as reader:
+                return read_sheet_frame(reader, sheet_name, header=header)
+        return pd.read_excel(self.rule_file, sheet_name=sheet_name, header=header, dtype=str, na_filter=False)
+
     def clean_csv_file(self, csv_file_path: str, output_path: str = None):
         """
         清洗单个CSV文件
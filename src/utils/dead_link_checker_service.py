@@ -5,26 +5,375 @@ This module provides functionality to check for dead links in HTML files.
 It extracts all links from HTML files and validates them by sending HTTP requests.
 """
 
-from pathlib import Path
-from typing import Callable
-from urllib.parse import urljoin, urlparse
+import asyncio
+import os
+import socket
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from html.parser import HTMLParser
+from typing import Callable, Iterable
+from urllib.parse import unquote, urljoin, urlparse, urlsplit
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from .file_discovery import collect_files
+from .link_check_cache import LinkCheckCache
+
+
+HTML_ENGINES = ("fast", "soup")
+
+# URL-bearing attributes collected by the fast engine, per tag
+_URL_ATTRIBUTES = {
+    'a': ('href',),
+    'area': ('href',),
+    'link': ('href',),
+    'img': ('src', 'srcset'),
+    'script': ('src',),
+    'iframe': ('src',),
+    'frame': ('src',),
+    'embed': ('src',),
+    'source': ('src', 'srcset'),
+    'track': ('src',),
+    'audio': ('src',),
+    'video': ('src', 'poster'),
+}
+
+
+_SRCSET_SPACE = ' \t\n\r\f'
+
+
+def _srcset_urls(value: str) -> list[str]:
+    """
+    Candidate URLs of a srcset attribute, parsed as the HTML spec does.
+
+    A URL is a run of non-whitespace (so it may contain commas, as in
+    ".../w_300,h_200/cat.jpg"); its descriptors run up to the next comma
+    outside parentheses. Inline data: candidates are skipped.
+    """
+    urls = []
+    position, length = 0, len(value)
+    while True:
+        while position < length and (value[position] in _SRCSET_SPACE or value[position] == ','):
+            position += 1
+        if position >= length:
+            return urls
+        start = position
+        while position < length and value[position] not in _SRCSET_SPACE:
+            position += 1
+        url = value[start:position]
+        if url.endswith(','):
+            # "a.jpg, b.jpg 2x": trailing commas end a candidate without descriptors
+            url = url.rstrip(',')
+        else:
+            depth = 0
+            while position < length:
+                char = value[position]
+                if char == '(':
+                    depth += 1
+                elif char == ')' and depth:
+                    depth -= 1
+                elif char == ',' and not depth:
+                    break
+                position += 1
+        if url and url[:5].lower() != 'data:':
+            urls.append(url)
+
+
+class _LinkParser(HTMLParser):
+    """
+    Streaming link extractor: one tokenizer pass, no tree.
+
+    Collects URL-bearing attributes in document order, fragment targets
+    (id, <a name>) and the first <base href>.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links: list[str] = []
+        self.anchors: set[str] = set()
+        self.base_href: str | None = None
+
+    def handle_starttag(self, tag, attrs):
+        wanted = _URL_ATTRIBUTES.get(tag, ())
+        for name, value in attrs:
+            if value is None:
+                continue
+            if name == 'id':
+                self.anchors.add(value)
+            elif name in wanted:
+                if name == 'srcset':
+                    self.links.extend(_srcset_urls(value))
+                else:
+                    self.links.append(value.strip())
+            elif name == 'name' and tag == 'a':
+                self.anchors.add(value)
+            elif name == 'href' and tag == 'base' and self.base_href is None:
+                self.base_href = value.strip()
+
+
+# getaddrinfo errors meaning the name does not exist (as opposed to EAI_AGAIN etc.)
+_DNS_MISSING_ERRORS = {socket.EAI_NONAME, getattr(socket, 'EAI_NODATA', socket.EAI_NONAME)}
+
+
+def _probe_host(host: str, port: int, timeout: float) -> tuple[str, str] | None:
+    """
+    Resolve host and open one TCP connection to it.
+
+    Returns None when the host is reachable (or the outcome is not
+    definitive), otherwise (status, reason) to report for its links.
+    """
+    try:
+        addresses = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        if e.errno in _DNS_MISSING_ERRORS:
+            return 'dead', f'Host unreachable: DNS lookup failed for {host}'
+        return None
+    except (OSError, UnicodeError):
+        return None
+
+    failure = None
+    for family, sock_type, proto, _canonname, address in addresses:
+        try:
+            with socket.socket(family, sock_type, proto) as sock:
+                sock.settimeout(timeout)
+                sock.connect(address)
+            return None
+        except socket.timeout:
+            failure = 'timeout', f'Host unreachable: connection to {host}:{port} timed out'
+        except OSError as e:
+            failure = 'dead', f'Host unreachable: connection to {host}:{port} failed ({e.strerror or e})'
+    return failure
+
+
+class HostTracker:
+    """
+    Run-scoped reachability of the hosts behind a set of links.
+
+    The first link to a host resolves its name once and opens one TCP
+    connection; links to the same host wait for that probe instead of
+    starting their own. After a definitive DNS or connection failure every
+    link to the host gets the recorded failure straight away, without its
+    own timeout and GET retry. Hosts reached through a proxy are not probed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._targets: dict[tuple[str, str], tuple[str, int] | None] = {}
+        self._probes: dict[tuple[str, int], Future] = {}
+        self.short_circuited = 0
+
+    def target(self, url: str, resolve: Callable[[str], tuple[str, int] | None]) -> tuple[str, int] | None:
+        """Return the (host, port) to probe for url, computed once per scheme and netloc."""
+        parsed = urlsplit(url)
+        key = (parsed.scheme.lower(), parsed.netloc.lower())
+        with self._lock:
+            if key in self._targets:
+                return self._targets[key]
+        target = resolve(url)
+        with self._lock:
+            self._targets[key] = target
+        return target
+
+    def probe(self, host: str, port: int, timeout: float, executor=None) -> Future:
+        """Future of the probe result for (host, port); runs the probe on first use."""
+        with self._lock:
+            future = self._probes.get((host, port))
+            owner = future is None
+            if owner:
+                future = Future()
+                self._probes[(host, port)] = future
+        if owner:
+            if executor is None:
+                self._run(future, host, port, timeout)
+            else:
+                executor.submit(self._run, future, host, port, timeout)
+        return future
+
+    @staticmethod
+    def _run(future: Future, host: str, port: int, timeout: float) -> None:
+        try:
+            future.set_result(_probe_host(host, port, timeout))
+        except Exception:
+            # A probe that cannot run must not fail the links themselves
+            future.set_result(None)
+
+    def record_short_circuit(self) -> None:
+        with self._lock:
+            self.short_circuited += 1
+
+    def failures(self) -> dict[str, str]:
+        """Unreachable hosts found so far, as {"host:port": reason}."""
+        with self._lock:
+            probes = list(self._probes.items())
+        return {
+            f'{host}:{port}': future.result()[1]
+            for (host, port), future in probes
+            if future.done() and future.result() is not None
+        }
+
+
+class LinkResultCache:
+    """
+    Run-scoped cache of link check results shared across files.
+
+    Each distinct URL is checked once; callers asking for a URL that is
+    already being checked wait for that check instead of starting another.
+    Safe to use from several threads. Every caller gets its own copy of the
+    result dictionary.
+
+    An optional persistent LinkCheckCache (store) carries results across
+    runs; fresh=True ignores stored results but still records new ones.
+    """
+
+    def __init__(self, store: LinkCheckCache | None = None, fresh: bool = False):
+        self.store = store
+        self.fresh = fresh
+        self.hosts = HostTracker()
+        self._lock = threading.Lock()
+        self._entries: dict[str, Future] = {}
+        self._checked = 0
+        self.checks_requested = 0
+
+    @property
+    def network_requests(self) -> int:
+        """Distinct URLs that needed a request (conditional ones included)."""
+        store_hits = self.store.hits if self.store is not None else 0
+        return self._checked - store_hits - self.hosts.short_circuited
+
+    def completed(self, url: str) -> dict | None:
+        """Return a finished result for url without waiting, or None."""
+        with self._lock:
+            future = self._entries.get(url)
+            if future is None or not future.done() or future.exception() is not None:
+                return None
+            self.checks_requested += 1
+        return dict(future.result())
+
+    def get(self, url: str, check: Callable[[str], dict]) -> dict:
+        """Return the result for url, running check(url) only on first use."""
+        with self._lock:
+            self.checks_requested += 1
+            future = self._entries.get(url)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._entries[url] = future
+
+        if owner:
+            try:
+                result = check(url)
+            except BaseException as e:
+                # Drop the failed entry so a later request can retry
+                with self._lock:
+                    del self._entries[url]
+                future.set_exception(e)
+                raise
+            if result['status'] != 'skipped':
+                with self._lock:
+                    self._checked += 1
+            future.set_result(result)
+        return dict(future.result())
+
+
+class LocalSiteIndex:
+    """
+    Run-scoped index of a site exported to local disk.
+
+    Caches stat results per resolved path and the fragment targets (element
+    ids and <a name> values) of every page, so each page is parsed at most
+    once per run however many links point at it. A page parsed early as a
+    link target keeps its links until the page itself is checked.
+    """
+
+    def __init__(self, root: str):
+        """
+        Args:
+            root: Site root on disk; root-relative links ("/a/b.html") resolve against it
+        """
+        self.root = os.path.abspath(root)
+        self._kinds: dict[str, str | None] = {}
+        self._anchors: dict[str, frozenset[str]] = {}
+        self._pending_links: dict[str, list[str]] = {}
+
+    def kind(self, path: str) -> str | None:
+        """Return 'file', 'dir' or None (missing) for path."""
+        if path not in self._kinds:
+            if os.path.isfile(path):
+                self._kinds[path] = 'file'
+            elif os.path.isdir(path):
+                self._kinds[path] = 'dir'
+            else:
+                self._kinds[path] = None
+        return self._kinds[path]
+
+    def add_page(self, path: str, anchors: Iterable[str]) -> None:
+        """Record the fragment targets of a page that has already been parsed."""
+        self._anchors[os.path.abspath(path)] = frozenset(anchors)
+
+    def anchors(
+        self,
+        path: str,
+        parse: Callable[[str], tuple[list[str], Iterable[str]]]
+    ) -> frozenset[str]:
+        """Return the fragment targets of path, calling parse(path) -> (links, anchors) on first use."""
+        path = os.path.abspath(path)
+        if path not in self._anchors:
+            links, anchors = parse(path)
+            self._anchors[path] = frozenset(anchors)
+            self._pending_links[path] = links
+        return self._anchors[path]
+
+    def take_links(self, path: str) -> list[str] | None:
+        """Return and forget the links of a page parsed earlier as a link target."""
+        return self._pending_links.pop(os.path.abspath(path), None)
 
 
 class DeadLinkCheckerService:
     """Class for checking dead links in HTML files."""
 
-    def __init__(self, timeout: int = 10):
+    def __init__(
+        self,
+        timeout: int = 10,
+        max_concurrency: int = 1,
+        max_per_host: int = 4,
+        cache_path: str | None = None,
+        cache_ttl: dict[str, int] | None = None,
+        engine: str = "fast"
+    ):
         """
         Initialize the DeadLinkCheckerService.
 
         Args:
             timeout: Request timeout in seconds (default: 10)
+            max_concurrency: Maximum number of links checked at the same time.
+                Values above 1 enable the asyncio engine (default: 1, sequential)
+            max_per_host: Maximum number of concurrent requests to one host
+                when the asyncio engine is used (default: 4)
+            cache_path: Location of the persistent result cache used with
+                use_cache=True (default: next to the app config file)
+            cache_ttl: Per-status cache lifetimes in seconds, overriding
+                link_check_cache.DEFAULT_TTL
+            engine: HTML link extraction engine, "fast" (default; single
+                streaming pass over every URL-bearing attribute, honours
+                <base href>) or "soup" (BeautifulSoup, a/link/img/script only)
         """
+        if max_concurrency < 1 or max_per_host < 1:
+            raise ValueError("max_concurrency and max_per_host must be at least 1")
+        if engine not in HTML_ENGINES:
+            raise ValueError(f"Unsupported engine: {engine} (choose from {', '.join(HTML_ENGINES)})")
+        self.engine = engine
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.max_per_host = max_per_host
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl
         self.session = requests.Session()
+        # Keep enough pooled connections per host for the concurrent engine
+        adapter = HTTPAdapter(pool_maxsize=max(10, max_concurrency))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         # Use complete browser-like headers to avoid anti-bot detection
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
@@ -52,6 +401,12 @@ class DeadLinkCheckerService:
         Returns:
             List of extracted URLs
         """
+        return self._parse_html(html_content, base_url)[0]
+
+    def _parse_html(self, html_content: str, base_url: str = "") -> tuple[list[str], set[str]]:
+        """Extract links and fragment targets (ids, <a name>) in one parse."""
+        if self.engine == "fast":
+            return self._parse_html_fast(html_content, base_url)
         soup = BeautifulSoup(html_content, 'html.parser')
         links = []
 
@@ -83,7 +438,93 @@ class DeadLinkCheckerService:
                 src = urljoin(base_url, src)
             links.append(src)
 
-        return links
+        anchors = {tag['id'] for tag in soup.find_all(id=True)}
+        anchors.update(tag['name'] for tag in soup.find_all('a', attrs={'name': True}))
+
+        return links, anchors
+
+    @staticmethod
+    def _parse_html_fast(html_content: str, base_url: str = "") -> tuple[list[str], set[str]]:
+        parser = _LinkParser()
+        parser.feed(html_content)
+        parser.close()
+
+        # <base href> applies to the whole document and is itself relative to base_url
+        base = base_url
+        if parser.base_href is not None:
+            base = urljoin(base_url, parser.base_href) if base_url else parser.base_href
+        links = parser.links
+        if base:
+            links = [urljoin(base, link) for link in links]
+        return links, parser.anchors
+
+    @staticmethod
+    def _read_html(file_path: str) -> str:
+        """Read an HTML file as UTF-8, falling back to GBK."""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except UnicodeDecodeError:
+            # Try with different encoding
+            with open(file_path, 'r', encoding='gbk') as f:
+                return f.read()
+
+    @staticmethod
+    def is_local_link(url: str) -> bool:
+        """Whether url is relative to the page (no scheme and no host)."""
+        parsed = urlsplit(url)
+        return not parsed.scheme and not parsed.netloc
+
+    def check_local_link(self, url: str, page_path: str, site_index: LocalSiteIndex) -> dict:
+        """
+        Check a relative link against the file system, without any request.
+
+        The path part resolves against the page's directory ("/..." against
+        the site root); a directory resolves to its index.html / index.htm
+        when one exists. A fragment must match an id or <a name> in the
+        target page; "#" and "#top" always point at the top of the page.
+
+        Returns:
+            Dictionary with 'url', 'status', 'status_code', and 'error' keys
+        """
+        result = {
+            'url': url,
+            'status': 'alive',
+            'status_code': None,
+            'error': None
+        }
+        parsed = urlsplit(url)
+        path = unquote(parsed.path)
+        if not path:
+            target = os.path.abspath(page_path)
+        elif path.startswith('/'):
+            target = os.path.normpath(os.path.join(site_index.root, path.lstrip('/')))
+        else:
+            target = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(page_path)), path))
+
+        kind = site_index.kind(target)
+        if kind == 'dir':
+            for name in ('index.html', 'index.htm'):
+                candidate = os.path.join(target, name)
+                if site_index.kind(candidate) == 'file':
+                    target, kind = candidate, 'file'
+                    break
+        if kind is None:
+            result['status'] = 'dead'
+            result['error'] = 'File not found'
+            return result
+
+        fragment = unquote(parsed.fragment)
+        if fragment and fragment.lower() != 'top':
+            is_html = kind == 'file' and target.lower().endswith(('.html', '.htm'))
+            if not is_html:
+                # Fragments into non-HTML targets (PDF pages, media) are not checked
+                return result
+            anchors = site_index.anchors(target, lambda path: self._parse_html(self._read_html(path)))
+            if fragment not in anchors:
+                result['status'] = 'dead'
+                result['error'] = f'Anchor not found: #{fragment}'
+        return result
 
     def check_link(self, url: str) -> dict:
         """
@@ -95,6 +536,11 @@ class DeadLinkCheckerService:
         Returns:
             Dictionary with 'url', 'status', 'status_code', and 'error' keys
         """
+        return self._check_link(url)[0]
+
+    def _check_link(self, url: str) -> tuple[dict, dict]:
+        """check_link plus the ETag / Last-Modified of the deciding response."""
+        validators = {}
         result = {
             'url': url,
             'status': 'unknown',
@@ -107,13 +553,13 @@ class DeadLinkCheckerService:
         if parsed.scheme in ['mailto', 'tel', 'javascript', '']:
             result['status'] = 'skipped'
             result['error'] = f'Skipped scheme: {parsed.scheme or "empty"}'
-            return result
+            return result, validators
 
         # Skip anchor links
         if url.startswith('#'):
             result['status'] = 'skipped'
             result['error'] = 'Anchor link'
-            return result
+            return result, validators
 
         try:
             # First try HEAD request (faster, less bandwidth)
@@ -123,6 +569,7 @@ class DeadLinkCheckerService:
                 allow_redirects=True
             )
             result['status_code'] = response.status_code
+            validators = self._validators(response)
 
             # If HEAD request fails with certain status codes, retry with GET
             # Some servers don't support HEAD or block it for automated requests
@@ -142,6 +589,7 @@ class DeadLinkCheckerService:
                     )
                     result['status_code'] = response.status_code
                     result['error'] = 'HEAD blocked, verified with GET'
+                    validators = self._validators(response)
                     # Close the connection to avoid downloading full content
                     response.close()
                 except:
@@ -169,6 +617,7 @@ class DeadLinkCheckerService:
                     result['status'] = 'alive'
                     result['status_code'] = response.status_code
                     result['error'] = 'HEAD timeout, verified with GET'
+                    validators = self._validators(response)
                 response.close()
             except:
                 # If GET also times out, keep timeout status
@@ -187,13 +636,196 @@ class DeadLinkCheckerService:
             result['status'] = 'error'
             result['error'] = f'Unexpected error: {str(e)}'
 
+        return result, validators
+
+    @staticmethod
+    def _validators(response) -> dict:
+        """Cache validators of a response, kept for conditional revalidation."""
+        return {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        }
+
+    def _revalidate(self, url: str, etag: str | None, last_modified: str | None) -> bool:
+        """Ask the server whether a stored alive result still holds (304)."""
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        try:
+            response = self.session.head(url, timeout=self.timeout, allow_redirects=True, headers=headers)
+        except requests.exceptions.RequestException:
+            return False
+        return response.status_code == 304
+
+    def _host_target(self, url: str) -> tuple[str, int] | None:
+        """(host, port) a direct connection for url would use, or None if not probed."""
+        parsed = urlsplit(url)
+        if parsed.scheme not in ('http', 'https') or not parsed.hostname:
+            return None
+        try:
+            port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        except ValueError:
+            return None
+        proxies = dict(self.session.proxies)
+        if self.session.trust_env:
+            for scheme, proxy in requests.utils.get_environ_proxies(url).items():
+                proxies.setdefault(scheme, proxy)
+        if requests.utils.select_proxy(url, proxies):
+            return None
+        return parsed.hostname.lower(), port
+
+    def _host_failure(self, url: str, hosts: HostTracker) -> dict | None:
+        """Result for url when its host is known to be unreachable, else None."""
+        target = hosts.target(url, self._host_target)
+        if target is None:
+            return None
+        failure = hosts.probe(*target, self.timeout).result()
+        if failure is None:
+            return None
+        hosts.record_short_circuit()
+        status, reason = failure
+        return {
+            'url': url,
+            'status': status,
+            'status_code': None,
+            'error': reason
+        }
+
+    def _check_link_stored(self, url: str, store: LinkCheckCache, fresh: bool, hosts: HostTracker) -> dict:
+        """check_link backed by the persistent cache."""
+        entry = None if fresh else store.lookup(url)
+        if entry is not None and entry.fresh:
+            return entry.result(url)
+
+        failure = self._host_failure(url, hosts)
+        if failure is not None:
+            # Not persisted: an unreachable host is often just this machine
+            # being offline, and the stored entry would outlive the outage
+            return failure
+        if entry is not None:
+            if entry.revalidatable and self._revalidate(url, entry.etag, entry.last_modified):
+                store.touch(url)
+                return entry.result(url)
+
+        result, validators = self._check_link(url)
+        store.store(url, result, validators.get('etag'), validators.get('last_modified'))
         return result
 
+    def _link_checker(self, cache: LinkResultCache | None, hosts: HostTracker) -> Callable[[str], dict]:
+        """Per-URL check function for check_links, routed through the caches."""
+        if cache is None or cache.store is None:
+            fetch = lambda url: self._host_failure(url, hosts) or self.check_link(url)
+        else:
+            store, fresh = cache.store, cache.fresh
+            fetch = lambda url: self._check_link_stored(url, store, fresh, hosts)
+        if cache is None:
+            return fetch
+        return lambda url: cache.get(url, fetch)
+
+    def check_links(
+        self,
+        urls: Iterable[str],
+        progress_callback: Callable[[int, int, str], None] | None = None,
+        cache: LinkResultCache | None = None
+    ) -> list[dict]:
+        """
+        Check a list of links, concurrently when max_concurrency > 1.
+
+        Each link goes through check_link, so the HEAD -> GET fallback and the
+        timeout -> GET retry behave exactly as in sequential mode. Hosts are
+        probed once (see HostTracker); links to a host that does not resolve
+        or refuses / times out the connection are reported without a request.
+        Results are returned in the order of ``urls``.
+
+        Args:
+            urls: URLs to check
+            progress_callback: Callback function for progress updates. In
+                sequential mode it is called before each link; in concurrent
+                mode it is called from the calling thread as each link finishes
+            cache: Optional LinkResultCache; URLs already checked through it
+                are not requested again
+
+        Returns:
+            List of check_link result dictionaries
+        """
+        urls = list(urls)
+        hosts = cache.hosts if cache is not None else HostTracker()
+        check = self._link_checker(cache, hosts)
+        if self.max_concurrency <= 1 or len(urls) <= 1:
+            results = []
+            for i, url in enumerate(urls):
+                if progress_callback:
+                    progress_callback(i + 1, len(urls), url)
+                results.append(check(url))
+            return results
+        return asyncio.run(self.check_links_async(urls, progress_callback, cache, hosts))
+
+    async def check_links_async(
+        self,
+        urls: Iterable[str],
+        progress_callback: Callable[[int, int, str], None] | None = None,
+        cache: LinkResultCache | None = None,
+        hosts: HostTracker | None = None
+    ) -> list[dict]:
+        """
+        Asyncio engine behind check_links, for callers already inside an event loop.
+
+        At most max_concurrency links are in flight overall and at most
+        max_per_host per host. The blocking requests calls run in a dedicated
+        thread pool sized to the global cap, as does the proxy lookup that
+        decides whether a host is probed (once per scheme and host). Links
+        already finished in cache are answered without taking a slot, and links
+        wait for their host's probe before taking one, so an unreachable host
+        never holds slots.
+        """
+        urls = list(urls)
+        if hosts is None:
+            hosts = cache.hosts if cache is not None else HostTracker()
+        check = self._link_checker(cache, hosts)
+        loop = asyncio.get_running_loop()
+        global_limit = asyncio.Semaphore(self.max_concurrency)
+        host_limits: dict[str, asyncio.Semaphore] = {}
+        targets: dict[tuple[str, str], asyncio.Future] = {}
+        done = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            async def run(url: str) -> dict:
+                nonlocal done
+                result = cache.completed(url) if cache is not None else None
+                if result is None:
+                    parsed = urlsplit(url)
+                    key = (parsed.scheme.lower(), parsed.netloc.lower())
+                    if key not in targets:
+                        # The proxy lookup reads the environment and may resolve names; keep it off the loop
+                        targets[key] = loop.run_in_executor(executor, hosts.target, url, self._host_target)
+                    target = await targets[key]
+                    if target is not None:
+                        await asyncio.wrap_future(hosts.probe(*target, self.timeout, executor))
+                    host = urlparse(url).netloc.lower()
+                    host_limit = host_limits.setdefault(host, asyncio.Semaphore(self.max_per_host))
+                    # Wait for the host slot first so a busy host does not hold global slots
+                    async with host_limit:
+                        async with global_limit:
+                            result = await loop.run_in_executor(executor, check, url)
+                done += 1
+                if progress_callback:
+                    progress_callback(done, len(urls), url)
+                return result
+
+            return list(await asyncio.gather(*(run(url) for url in urls)))
+
     def check_html_file(
         self,
         file_path: str,
         base_url: str = "",
-        progress_callback: Callable[[int, int, str], None] | None = None
+        progress_callback: Callable[[int, int, str], None] | None = None,
+        cache: LinkResultCache | None = None,
+        use_cache: bool = False,
+        fresh: bool = False,
+        local_site: bool = False,
+        site_index: LocalSiteIndex | None = None
     ) -> dict:
         """
         Check all links in an HTML file.
@@ -202,20 +834,29 @@ class DeadLinkCheckerService:
             file_path: Path to the HTML file
             base_url: Base URL for resolving relative links
             progress_callback: Callback function for progress updates
+            cache: Optional LinkResultCache shared with other files
+            use_cache: Reuse results from the persistent cache across runs
+                (ignored when cache is given)
+            fresh: With use_cache, re-check every link and refresh the cache
+            local_site: Check relative links and fragments against the file
+                system (see check_local_link) instead of joining them with
+                base_url; absolute links are still requested
+            site_index: Optional LocalSiteIndex shared with other files; its
+                root defaults to the file's directory
 
         Returns:
             Dictionary with check results
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-        except UnicodeDecodeError:
-            # Try with different encoding
-            with open(file_path, 'r', encoding='gbk') as f:
-                html_content = f.read()
-
-        links = self.extract_links_from_html(html_content, base_url)
-        unique_links = list(set(links))  # Remove duplicates
+        if local_site:
+            if site_index is None:
+                site_index = LocalSiteIndex(os.path.dirname(os.path.abspath(file_path)))
+            links = site_index.take_links(file_path)
+            if links is None:
+                links, anchors = self._parse_html(self._read_html(file_path))
+                site_index.add_page(file_path, anchors)
+        else:
+            links = self.extract_links_from_html(self._read_html(file_path), base_url)
+        unique_links = list(dict.fromkeys(links))  # Remove duplicates, keep page order
 
         results = {
             'file': file_path,
@@ -231,14 +872,29 @@ class DeadLinkCheckerService:
             }
         }
 
-        for i, link in enumerate(unique_links):
-            if progress_callback:
-                progress_callback(i + 1, len(unique_links), link)
-
-            check_result = self.check_link(link)
-            results['checks'].append(check_result)
-            results['summary'][check_result['status']] += 1
+        store = None
+        if cache is None and use_cache:
+            store = LinkCheckCache(self.cache_path, self.cache_ttl)
+            cache = LinkResultCache(store, fresh)
+        if local_site:
+            remote_links = [link for link in unique_links if not self.is_local_link(link)]
+        else:
+            remote_links = unique_links
+        try:
+            remote_results = iter(self.check_links(remote_links, progress_callback, cache))
+            for link in unique_links:
+                if local_site and self.is_local_link(link):
+                    check_result = self.check_local_link(link, file_path, site_index)
+                else:
+                    check_result = next(remote_results)
+                results['checks'].append(check_result)
+                results['summary'][check_result['status']] += 1
+        finally:
+            if store is not None:
+                store.close()
 
+        if store is not None:
+            results['cache_hits'] = store.hits
         return results
 
     def check_folder(
@@ -246,27 +902,38 @@ class DeadLinkCheckerService:
         folder_path: str,
         base_url: str = "",
         include_subfolders: bool = False,
-        progress_callback: Callable[[int, int, str], None] | None = None
+        progress_callback: Callable[[int, int, str], None] | None = None,
+        use_cache: bool = False,
+        fresh: bool = False,
+        local_site: bool = False
     ) -> dict:
         """
         Check all HTML files in a folder.
 
+        Link results are shared across files for the duration of the call, so
+        a URL linked from many pages is requested once. Per-file results still
+        list every link.
+
         Args:
             folder_path: Path to the folder
             base_url: Base URL for resolving relative links
             include_subfolders: Whether to include subfolders
             progress_callback: Callback function for progress updates
+            use_cache: Reuse results from the persistent cache across runs
+            fresh: With use_cache, re-check every link and refresh the cache
+            local_site: Check relative links and fragments against the file
+                system, with folder_path as the site root
 
         Returns:
-            Dictionary with check results for all files
+            Dictionary with check results for all files, including
+            'checks_requested' (link checks asked for by all files) and
+            'network_requests' (distinct URLs actually requested), plus
+            'cache_hits' when use_cache is set
         """
-        html_files = []
-        folder = Path(folder_path)
-
-        if include_subfolders:
-            html_files = list(folder.rglob('*.html')) + list(folder.rglob('*.htm'))
-        else:
-            html_files = list(folder.glob('*.html')) + list(folder.glob('*.htm'))
+        html_files = collect_files(folder_path, extensions=('.html', '.htm'), recursive=include_subfolders)
+        store = LinkCheckCache(self.cache_path, self.cache_ttl) if use_cache else None
+        cache = LinkResultCache(store, fresh)
+        site_index = LocalSiteIndex(folder_path) if local_site else None
 
         all_results = {
             'folder': folder_path,
@@ -274,13 +941,28 @@ class DeadLinkCheckerService:
             'files': []
         }
 
-        for i, html_file in enumerate(html_files):
-            if progress_callback:
-                progress_callback(i + 1, len(html_files), str(html_file.name))
+        try:
+            for i, html_file in enumerate(html_files):
+                if progress_callback:
+                    progress_callback(i + 1, len(html_files), os.path.basename(html_file))
 
-            file_result = self.check_html_file(str(html_file), base_url)
-            all_results['files'].append(file_result)
+                file_result = self.check_html_file(
+                    html_file,
+                    base_url,
+                    cache=cache,
+                    local_site=local_site,
+                    site_index=site_index
+                )
+                all_results['files'].append(file_result)
+        finally:
+            if store is not None:
+                store.close()
 
+        all_results['checks_requested'] = cache.checks_requested
+        all_results['network_requests'] = cache.network_requests
+        all_results['unreachable_hosts'] = cache.hosts.failures()
+        if store is not None:
+            all_results['cache_hits'] = store.hits
         return all_results
 
     def generate_report(self, results: dict, output_file: str) -> None:
@@ -299,7 +981,20 @@ class DeadLinkCheckerService:
             if 'folder' in results:
                 # Multiple files
                 f.write(f"检测文件夹: {results['folder']}\n")
-                f.write(f"总文件数: {results['total_files']}\n\n")
+                f.write(f"总文件数: {results['total_files']}\n")
+                if 'network_requests' in results:
+                    f.write(f"链接检测次数: {results['checks_requested']}\n")
+                    f.write(f"实际网络请求数: {results['network_requests']}\n")
+                if 'cache_hits' in results:
+                    f.write(f"缓存命中数: {results['cache_hits']}\n")
+                f.write("\n")
+
+                if results.get('unreachable_hosts'):
+                    f.write("不可达主机（其链接未逐个请求）:\n")
+                    for host, reason in results['unreachable_hosts'].items():
+                        f.write(f"  {host}\n")
+                        f.write(f"      原因: {reason}\n")
+                    f.write("\n")
 
                 for file_result in results['files']:
                     self._write_file_result(f, file_result)
@@ -357,6 +1052,8 @@ class DeadLinkCheckerService:
             f.write("超时链接:\n")
             for check in timeout_links:
                 f.write(f"  {check['url']}\n")
+                if check['error'] and check['error'] != 'Request timeout':
+                    f.write(f"      原因: {check['error']}\n")
             f.write("\n")
 
         # Write error links
@@ -0,0 +1,163 @@
+import codecs
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class EncodingDetector:
+    """基于有限字节样本的文本编码探测器，结果按 (路径, 大小, 修改时间) 缓存。
+
+    探测顺序：
+    1. BOM（UTF-8 / UTF-16 / UTF-32）；
+    2. 增量校验 UTF-8（样本末尾被截断的多字节字符不算错误）；
+    3. 对 GBK / CP936 / Shift-JIS 按解码错误密度打分，在错误密度阈值内的
+       候选中选常用字符占比最高者；
+    4. 没有候选满足阈值时返回 fallback（默认 latin1）。
+    """
+
+    BOMS: Tuple[Tuple[bytes, str], ...] = (
+        (codecs.BOM_UTF8, "utf-8-sig"),
+        (codecs.BOM_UTF32_LE, "utf-32"),
+        (codecs.BOM_UTF32_BE, "utf-32"),
+        (codecs.BOM_UTF16_LE, "utf-16"),
+        (codecs.BOM_UTF16_BE, "utf-16"),
+    )
+    DEFAULT_CANDIDATES = ("gbk", "cp936", "shift_jis")
+
+    def __init__(
+        self,
+        sample_size: int = 64 * 1024,
+        candidates: Optional[Iterable[str]] = None,
+        max_error_density: float = 0.01,
+        min_plausibility: float = 0.5,
+        fallback: str = "latin1",
+    ) -> None:
+        self.sample_size = sample_size
+        self.candidates = self._dedupe_codecs(candidates or self.DEFAULT_CANDIDATES)
+        self.max_error_density = max_error_density
+        self.min_plausibility = min_plausibility
+        self.fallback = fallback
+        self._cache: Dict[Tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def detect(self, file_path: str) -> str:
+        """返回文件的编码名称；同一文件未变化时直接返回缓存结果。"""
+        stat = os.stat(file_path)
+        key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        with open(file_path, "rb") as handle:
+            sample = handle.read(self.sample_size)
+        encoding = self.detect_bytes(sample)
+
+        with self._lock:
+            self._cache[key] = encoding
+        return encoding
+
+    def detect_bytes(self, sample: bytes) -> str:
+        """根据字节样本判断编码。"""
+        for bom, encoding in self.BOMS:
+            if sample.startswith(bom):
+                return encoding
+
+        if self._is_valid_utf8(sample):
+            return "utf-8"
+
+        best: Optional[Tuple[float, float, str]] = None
+        for encoding in self.candidates:
+            density, plausibility = self._score(sample, encoding)
+            if density > self.max_error_density:
+                continue
+            if best is None or (plausibility, -density) > (best[1], -best[0]):
+                best = (density, plausibility, encoding)
+
+        if best is None or best[1] < self.min_plausibility:
+            return self.fallback
+        return best[2]
+
+    def order_candidates(self, file_path: str, candidates: Iterable[str]) -> List[str]:
+        """按探测结果调整调用方候选编码的尝试顺序。
+
+        只有探测结果属于候选编码、且不是 fallback 时才把它移到最前，其余候选保持
+        原顺序；探测器不会引入候选列表之外的编码（例如把 GBK 文件误判为 shift_jis）。
+        """
+        candidates = list(candidates)
+        detected_name = codecs.lookup(self.detect(file_path)).name
+        if detected_name == codecs.lookup(self.fallback).name:
+            return candidates
+        preferred = [encoding for encoding in candidates if codecs.lookup(encoding).name == detected_name]
+        if not preferred:
+            return candidates
+        return preferred[:1] + [encoding for encoding in candidates if codecs.lookup(encoding).name != detected_name]
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    @staticmethod
+    def _is_valid_utf8(sample: bytes) -> bool:
+        try:
+            codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        except UnicodeDecodeError:
+            return False
+        return True
+
+    @staticmethod
+    def _score(sample: bytes, encoding: str) -> Tuple[float, float]:
+        """返回 (解码错误密度, 非 ASCII 字符中常用字符的占比)。"""
+        text = codecs.getincrementaldecoder(encoding)(errors="replace").decode(sample, final=False)
+        errors = text.count("\ufffd")
+        density = errors / len(sample) if sample else 0.0
+        non_ascii = [ch for ch in text if ord(ch) >= 0x80 and ch != "\ufffd"]
+        if not non_ascii:
+            return density, 0.0
+        name = codecs.lookup(encoding).name
+        common = sum(1 for ch in non_ascii if EncodingDetector._is_common_char(ch, name))
+        return density, common / len(non_ascii)
+
+    @staticmethod
+    def _is_common_char(ch: str, codec_name: str) -> bool:
+        """判断字符是否落在该编码的常用区。
+
+        GBK 以 GB2312 字符集为常用区；Shift-JIS 以首字节 0x81-0x9F 的双字节区
+        （符号、假名、第一水准汉字）为常用区，半角片假名视为不常用。
+        """
+        if codec_name == "gbk":
+            try:
+                ch.encode("gb2312")
+            except UnicodeEncodeError:
+                return False
+            return True
+        if codec_name == "shift_jis":
+            encoded = ch.encode("shift_jis")
+            return len(encoded) == 2 and 0x81 <= encoded[0] <= 0x9F
+        code = ord(ch)
+        return 0x3000 <= code <= 0x9FFF or 0xFF01 <= code <= 0xFF60
+
+    @staticmethod
+    def _dedupe_codecs(encodings: Iterable[str]) -> List[str]:
+        """按 codec 实际名称去重（例如 cp936 在 Python 中即 gbk 的别名）。"""
+        seen = set()
+        result: List[str] = []
+        for encoding in encodings:
+            name = codecs.lookup(encoding).name
+            if name in seen:
+                continue
+            seen.add(name)
+            result.append(encoding)
+        return result
+
+
+_default_detector = EncodingDetector()
+
+
+def get_default_detector() -> EncodingDetector:
+    """返回进程内共享的探测器，使不同服务复用同一份探测缓存。"""
+    return _default_detector
+
+
+def detect_encoding(file_path: str) -> str:
+    return _default_detector.detect(file_path)
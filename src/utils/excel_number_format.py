@@ -0,0 +1,270 @@
+"""Excel 数字格式编译器。
+
+同一个工作表通常只有少数几种 number_format，逐个单元格重复解析格式字符串
+（正则替换、拆分日期/时间段、识别分隔符）开销很大。本模块把格式字符串
+一次性编译为可复用的渲染函数，并按格式字符串缓存：
+
+- compile_date_format：日期/时间格式，输出规则与工作表拆分工具一贯的日期导出一致；
+- compile_number_format：定点小数、百分比、千分位等数值格式，按 Excel 的显示方式
+  输出文本；不支持的格式（常规、科学计数、分数、文本等）返回 None，由调用方回退到 str(value)。
+"""
+
+import re
+from datetime import date, datetime
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from typing import Callable, List, Optional, Sequence, Tuple
+
+_BRACKET_PATTERN = re.compile(r"\[[^\]]*\]")
+_QUOTED_PATTERN = re.compile(r'"[^"]*"')
+
+
+def format_excel_date(value: object, number_format: str) -> str:
+    return compile_date_format(number_format or "")(value)
+
+
+def format_excel_number(value: object, number_format: str) -> str:
+    renderer = compile_number_format(number_format or "")
+    return renderer(value) if renderer is not None else str(value)
+
+
+@lru_cache(maxsize=512)
+def compile_date_format(number_format: str) -> Callable[[object], str]:
+    """把日期格式编译为渲染函数。
+
+    日期部分只保留年月日的顺序与位数，分隔符取格式中的 "/"、"-" 或 "."；
+    值带有非零时间，或格式本身包含时/秒时追加 "HH:MM[:SS]"。
+    """
+    fmt = (number_format or "").lower()
+    fmt = fmt.split(";")[0]
+    fmt = _BRACKET_PATTERN.sub("", fmt)
+    fmt = _QUOTED_PATTERN.sub("", fmt)
+
+    if "h" in fmt:
+        date_part, time_part = fmt.split("h", 1)
+        time_part = "h" + time_part
+    else:
+        date_part, time_part = fmt, ""
+
+    tokens = _extract_date_tokens(date_part)
+    sep = _detect_date_separator(date_part)
+    if tokens:
+        date_template = sep.join(_token_template(token) for token in tokens)
+    else:
+        date_template = sep.join(["{y:04d}", "{m:02d}", "{d:02d}"])
+    time_template = "{H:02d}:{M:02d}:{S:02d}" if "s" in time_part else "{H:02d}:{M:02d}"
+    datetime_template = f"{date_template} {time_template}"
+    always_time = bool(time_part)
+
+    def render(value: object) -> str:
+        if not isinstance(value, (datetime, date)):
+            return str(value)
+
+        year = value.year
+        if isinstance(value, datetime) and (
+            always_time or value.hour or value.minute or value.second or value.microsecond
+        ):
+            return datetime_template.format(
+                y=year, ys=year % 100, m=value.month, d=value.day,
+                H=value.hour, M=value.minute, S=value.second,
+            )
+        return date_template.format(y=year, ys=year % 100, m=value.month, d=value.day)
+
+    return render
+
+
+def _extract_date_tokens(date_part: str) -> Sequence[str]:
+    tokens: List[str] = []
+    i = 0
+    while i < len(date_part):
+        ch = date_part[i]
+        if ch in {"y", "m", "d"}:
+            j = i + 1
+            while j < len(date_part) and date_part[j] == ch:
+                j += 1
+            tokens.append(date_part[i:j])
+            i = j
+        else:
+            i += 1
+    return tokens
+
+
+def _detect_date_separator(date_part: str) -> str:
+    if "/" in date_part:
+        return "/"
+    if "-" in date_part:
+        return "-"
+    if "." in date_part:
+        return "."
+    return "-"
+
+
+def _token_template(token: str) -> str:
+    if token.startswith("y"):
+        return "{ys:02d}" if len(token) <= 2 else "{y:04d}"
+    if token.startswith("m"):
+        return "{m:02d}" if len(token) >= 2 else "{m}"
+    return "{d:02d}" if len(token) >= 2 else "{d}"
+
+
+@lru_cache(maxsize=512)
+def compile_number_format(number_format: str) -> Optional[Callable[[object], str]]:
+    """把数值格式编译为渲染函数，不支持的格式返回 None。
+
+    支持 "0"、"0.00"、"#,##0.00"、"0%"、"0.0%"、末尾逗号缩放（"#,##0,"）、
+    引号/反斜杠字面量、货币符号（含 "[$€-407]"）以及正数;负数;零 三段格式。
+    """
+    if not number_format or number_format.lower() == "general":
+        return None
+
+    sections = _split_sections(number_format)
+    compiled = []
+    for section in sections[:3]:
+        renderer = _compile_numeric_section(section)
+        if renderer is None:
+            return None
+        compiled.append(renderer)
+
+    positive = compiled[0]
+    negative = compiled[1] if len(compiled) > 1 else None
+    zero = compiled[2] if len(compiled) > 2 else None
+
+    def render(value: object) -> str:
+        number = Decimal(repr(value)) if isinstance(value, float) else Decimal(value)
+        if number < 0 and negative is not None:
+            return negative(-number, False)
+        if number == 0 and zero is not None:
+            return zero(number, False)
+        return positive(number, True)
+
+    return render
+
+
+def _split_sections(number_format: str) -> List[str]:
+    sections: List[str] = []
+    current: List[str] = []
+    in_quotes = False
+    escaped = False
+    for ch in number_format:
+        if escaped:
+            current.append(ch)
+            escaped = False
+        elif ch == "\\":
+            current.append(ch)
+            escaped = True
+        elif ch == '"':
+            current.append(ch)
+            in_quotes = not in_quotes
+        elif ch == ";" and not in_quotes:
+            sections.append("".join(current))
+            current = []
+        else:
+            current.append(ch)
+    sections.append("".join(current))
+    return sections
+
+
+def _parse_numeric_section(section: str) -> Optional[Tuple[str, str, str, int]]:
+    prefix: List[str] = []
+    suffix: List[str] = []
+    pattern: List[str] = []
+    percent = 0
+    state = "before"
+    i = 0
+    while i < len(section):
+        ch = section[i]
+        literal = ""
+        if ch == '"':
+            end = section.find('"', i + 1)
+            end = len(section) if end < 0 else end
+            literal = section[i + 1:end]
+            i = end + 1
+        elif ch == "\\":
+            literal = section[i + 1:i + 2]
+            i += 2
+        elif ch == "[":
+            end = section.find("]", i)
+            if end < 0:
+                return None
+            content = section[i + 1:end]
+            if content[:1] in {"<", ">", "="}:
+                return None
+            if content.startswith("$"):
+                literal = content[1:].split("-", 1)[0]
+            i = end + 1
+        elif ch == "_":
+            literal = " "
+            i += 2
+        elif ch == "*":
+            i += 2
+            continue
+        elif ch in "0#?.,":
+            if state == "after":
+                return None
+            state = "in"
+            pattern.append(ch)
+            i += 1
+            continue
+        elif ch == "%":
+            percent += 1
+            literal = "%"
+            i += 1
+        elif (ch.isascii() and ch.isalpha()) or ch in "/@":
+            # 常规、科学计数、分数、文本及日期格式交给调用方处理
+            return None
+        else:
+            literal = ch
+            i += 1
+
+        if literal:
+            if state == "before":
+                prefix.append(literal)
+            else:
+                suffix.append(literal)
+                state = "after"
+
+    return "".join(prefix), "".join(pattern), "".join(suffix), percent
+
+
+def _compile_numeric_section(section: str) -> Optional[Callable[[Decimal, bool], str]]:
+    parsed = _parse_numeric_section(section)
+    if parsed is None:
+        return None
+    prefix, pattern, suffix, percent = parsed
+
+    if not pattern:
+        # 如 "0;-0;;@" 的空段，或只含字面量的段
+        return lambda number, auto_sign: prefix + suffix
+
+    if pattern.count(".") > 1:
+        return None
+    int_part, has_point, dec_part = pattern.partition(".")
+    stripped = int_part.rstrip(",")
+    scale = Decimal(1000) ** (len(int_part) - len(stripped))
+    thousands = "," in stripped
+    min_int = stripped.count("0")
+    dec_part = dec_part.replace(",", "")
+    dec_min = dec_part.count("0")
+    dec_max = len(dec_part)
+    quantum = Decimal(1).scaleb(-dec_max)
+    multiplier = Decimal(100) ** percent
+
+    def render(number: Decimal, auto_sign: bool) -> str:
+        scaled = number * multiplier / scale
+        negative = scaled < 0
+        rounded = abs(scaled).quantize(quantum, rounding=ROUND_HALF_UP)
+        int_digits, _, decimals = f"{rounded:f}".partition(".")
+
+        if dec_max > dec_min:
+            decimals = decimals.rstrip("0").ljust(dec_min, "0")
+        if int_digits == "0" and min_int == 0:
+            int_digits = ""
+        if thousands and int_digits:
+            int_digits = f"{int(int_digits):,}"
+        int_digits = int_digits.zfill(min_int)
+
+        text = int_digits + ("." + decimals if has_point else "")
+        sign = "-" if auto_sign and negative and rounded != 0 else ""
+        return f"{sign}{prefix}{text}{suffix}"
+
+    return render
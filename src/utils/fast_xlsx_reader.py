@@ -0,0 +1,520 @@
+"""轻量 XLSX 读取引擎：直接用 zipfile + iterparse 流式解析工作表 XML。
+
+openpyxl 只读模式会为每个单元格构造 ReadOnlyCell 对象，而拆分、转换、字段提取
+这类场景只需要纯文本。本模块在打开工作簿时解析日期样式，共享字符串表则按需
+增量解析（只取表头时通常只需读到表的开头），之后逐行产出普通的值或字符串，取值规则与 openpyxl 只读模式（data_only=True）一致：
+数字按 openpyxl 的规则转为 int/float，日期样式的数字转为 datetime，行按
+<dimension> 声明的宽度补齐，缺失的行补空行。
+"""
+
+import posixpath
+import zipfile
+from datetime import date, datetime
+from operator import itemgetter
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from xml.etree.ElementTree import fromstring, iterparse
+
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format
+from openpyxl.utils.cell import column_index_from_string, range_boundaries
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_excel, from_ISO8601
+
+ENGINES = ("openpyxl", "fast")
+
+SHEET_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_ROW_TAG = f"{{{SHEET_MAIN_NS}}}row"
+_VALUE_TAG = f"{{{SHEET_MAIN_NS}}}v"
+_INLINE_TAG = f"{{{SHEET_MAIN_NS}}}is"
+_TEXT_TAG = f"{{{SHEET_MAIN_NS}}}t"
+_RUN_TAG = f"{{{SHEET_MAIN_NS}}}r"
+_SI_TAG = f"{{{SHEET_MAIN_NS}}}si"
+_DIMENSION_TAG = f"{{{SHEET_MAIN_NS}}}dimension"
+_SHEET_DATA_TAG = f"{{{SHEET_MAIN_NS}}}sheetData"
+
+_SHEET_REL_TYPES = {
+    f"{REL_NS}/worksheet",
+    f"{REL_NS}/chartsheet",
+}
+
+
+def validate_engine(engine: str) -> str:
+    """校验读取引擎名称，返回原值。"""
+    if engine not in ENGINES:
+        raise ValueError(f"不支持的读取引擎: {engine}（可选: {', '.join(ENGINES)}）")
+    return engine
+
+
+def _text_content(node) -> str:
+    # 与 openpyxl Text.content 一致：纯文本 <t> 加上各富文本段 <r><t>，忽略注音 <rPh>
+    snippets: List[str] = []
+    for child in node:
+        if child.tag == _TEXT_TAG:
+            if child.text:
+                snippets.append(child.text)
+        elif child.tag == _RUN_TAG:
+            text = child.findtext(_TEXT_TAG)
+            if text:
+                snippets.append(text)
+    return "".join(snippets)
+
+
+class FastXlsxReader:
+    """基于 iterparse 的只读 XLSX 读取器。"""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._archive = zipfile.ZipFile(path)
+        self._column_cache: Dict[str, int] = {}
+        self._shared_source = None
+        self._shared_events = None
+        try:
+            self._load_workbook()
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self) -> "FastXlsxReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._close_shared_strings()
+        self._archive.close()
+
+    @property
+    def sheet_names(self) -> List[str]:
+        return list(self._sheet_paths)
+
+    def dimensions(self, sheet_name: str) -> Optional[Tuple[int, int, int, int]]:
+        """返回工作表声明的 (min_col, min_row, max_col, max_row)，未声明时返回 None。
+
+        只解析到 <sheetData> 开始为止，不会读取单元格数据。
+        """
+        ref = self.dimension_ref(sheet_name)
+        return range_boundaries(ref) if ref else None
+
+    def dimension_ref(self, sheet_name: str) -> Optional[str]:
+        """返回工作表 <dimension> 声明的区域字符串（如 "A1:F120"），未声明时返回 None。"""
+        with self._archive.open(self._sheet_path(sheet_name)) as source:
+            for _event, element in iterparse(source, events=("start",)):
+                if element.tag == _DIMENSION_TAG:
+                    return element.get("ref") or None
+                if element.tag == _SHEET_DATA_TAG:
+                    break
+        return None
+
+    def sheet_state(self, sheet_name: str) -> str:
+        """返回工作表的可见状态："visible"、"hidden" 或 "veryHidden"。"""
+        self._sheet_path(sheet_name)
+        return self._sheet_states.get(sheet_name, "visible")
+
+    def sheet_xml_size(self, sheet_name: str) -> int:
+        """返回工作表 XML 解压后的字节数，可用于在读取前估计导出开销。"""
+        return self._archive.getinfo(self._sheet_path(sheet_name)).file_size
+
+    def number_format(self, style_id: int) -> str:
+        if 0 <= style_id < len(self._style_formats):
+            return self._style_formats[style_id]
+        return "General"
+
+    def iter_values(self, sheet_name: str) -> Iterator[Tuple[object, ...]]:
+        """逐行产出单元格值，等同于 openpyxl 只读模式的 iter_rows(values_only=True)。"""
+        return self._iter_rows(sheet_name, None, stringify=False)
+
+    def iter_string_rows(
+        self,
+        sheet_name: str,
+        date_formatter: Optional[Callable[[object, str], str]] = None,
+        number_formatter: Optional[Callable[[object, str], str]] = None,
+    ) -> Iterator[Tuple[str, ...]]:
+        """逐行产出字符串，空单元格为 ""。
+
+        日期单元格交给 date_formatter(value, number_format) 格式化，数值单元格
+        交给 number_formatter(value, number_format)，未提供时使用 str(value)；
+        其余单元格均为 str(value)。
+        """
+        return self._iter_rows(sheet_name, date_formatter, stringify=True, number_formatter=number_formatter)
+
+    def max_value_column(self, sheet_name: str) -> int:
+        """返回含非空值的最右列号（从 1 开始），工作表没有非空单元格时返回 0。
+
+        与 iter_values 使用相同的行列范围（受 <dimension> 限制），但只看单元格坐标与
+        原始文本，不做类型转换；每行只检查位于当前结果右侧的单元格，结果达到声明的
+        宽度时立即停止（有表头的工作表通常读完第一行即可返回）。共享字符串只在可能
+        扩大结果时才查表，以区分空串。
+
+        注意：<dimension> 比实际数据宽（例如只设置了格式的空列）或未声明时，无法
+        提前停止，会 iterparse 整个工作表 XML——这是一次完整的轻量遍历，开销约为
+        iter_values 的一半到相当，而不是只读列范围的廉价扫描。
+        """
+        dimensions = self.dimensions(sheet_name)
+        max_col = dimensions[2] if dimensions else None
+        max_row = dimensions[3] if dimensions else None
+        column_index = self._column_index
+        bound = 0
+        row_counter = 0
+        counter = 1
+
+        with self._archive.open(self._sheet_path(sheet_name)) as source:
+            for _event, element in iterparse(source):
+                if element.tag != _ROW_TAG:
+                    continue
+
+                ref = element.get("r")
+                row_counter = int(float(ref)) if ref is not None else row_counter + 1
+                if max_row is not None and row_counter > max_row:
+                    break
+                # 与 _iter_rows 一致：行号回退（重复或乱序）的行不会被产出
+                if row_counter < counter:
+                    element.clear()
+                    continue
+                counter = row_counter + 1
+
+                # 只收集位于当前结果右侧的单元格，再从右往左找第一个非空值
+                candidates = []
+                col_counter = 0
+                for cell in element:
+                    coordinate = cell.get("r")
+                    col_counter = column_index(coordinate) if coordinate else col_counter + 1
+                    if col_counter > bound and (max_col is None or col_counter <= max_col):
+                        candidates.append((col_counter, cell))
+                for column, cell in sorted(candidates, key=itemgetter(0), reverse=True):
+                    if self._cell_has_value(cell):
+                        bound = column
+                        break
+
+                element.clear()
+                if bound == max_col:
+                    # 已达到声明的宽度，不可能再扩大（通常在表头行即可确定）
+                    break
+        return bound
+
+    def _cell_has_value(self, cell) -> bool:
+        if cell.get("t") == "inlineStr":
+            inline = cell.find(_INLINE_TAG)
+            return inline is not None and _text_content(inline) != ""
+        value = cell.findtext(_VALUE_TAG)
+        if not value:
+            return False
+        if cell.get("t") == "s":
+            index = int(value)
+            try:
+                return self._shared_strings[index] != ""
+            except IndexError:
+                return self._shared_string(index) != ""
+        return True
+
+    def _iter_rows(self, sheet_name, date_formatter, stringify: bool, number_formatter=None):
+        dimensions = self.dimensions(sheet_name)
+        max_col = dimensions[2] if dimensions else None
+        max_row = dimensions[3] if dimensions else None
+        filler = "" if stringify else None
+        empty_row = (filler,) * max_col if max_col else ()
+
+        counter = 1
+        for idx, cells in self._parse_rows(sheet_name, date_formatter, stringify, number_formatter):
+            if max_row is not None and idx > max_row:
+                break
+
+            # 缺失的行补空行
+            while counter < idx:
+                counter += 1
+                yield empty_row
+
+            if counter <= idx:
+                counter += 1
+                if not cells and not max_col:
+                    yield ()
+                    continue
+                width = max_col or cells[-1][0]
+                row = [filler] * width
+                for column, value in cells:
+                    if 1 <= column <= width:
+                        row[column - 1] = value
+                yield tuple(row)
+
+    def _parse_rows(self, sheet_name, date_formatter, stringify: bool, number_formatter=None):
+        shared_strings = self._shared_strings
+        date_styles = self._date_styles
+        epoch = self._epoch
+        column_index = self._column_index
+        row_counter = 0
+
+        with self._archive.open(self._sheet_path(sheet_name)) as source:
+            for _event, element in iterparse(source):
+                if element.tag != _ROW_TAG:
+                    continue
+
+                ref = element.get("r")
+                if ref is not None:
+                    try:
+                        row_counter = int(ref)
+                    except ValueError:
+                        number = float(ref)
+                        if not number.is_integer():
+                            raise ValueError(f"{ref} is not a valid row number")
+                        row_counter = int(number)
+                else:
+                    row_counter += 1
+
+                col_counter = 0
+                cells: List[Tuple[int, object]] = []
+                for cell in element:
+                    coordinate = cell.get("r")
+                    col_counter = column_index(coordinate) if coordinate else col_counter + 1
+                    data_type = cell.get("t", "n")
+                    style = cell.get("s")
+                    style_id = int(style) if style else 0
+
+                    if data_type == "inlineStr":
+                        value = None
+                        inline = cell.find(_INLINE_TAG)
+                        if inline is not None:
+                            value = _text_content(inline)
+                    else:
+                        value = cell.findtext(_VALUE_TAG) or None
+                        if value is not None:
+                            if data_type == "n":
+                                if "." in value or "E" in value or "e" in value:
+                                    value = float(value)
+                                else:
+                                    value = int(value)
+                                if style_id in date_styles:
+                                    data_type = "d"
+                                    try:
+                                        value = from_excel(value, epoch)
+                                    except (OverflowError, ValueError):
+                                        data_type = "e"
+                                        value = "#VALUE!"
+                            elif data_type == "s":
+                                index = int(value)
+                                try:
+                                    value = shared_strings[index]
+                                except IndexError:
+                                    value = self._shared_string(index)
+                            elif data_type == "b":
+                                value = bool(int(value))
+                            elif data_type == "d":
+                                value = from_ISO8601(value)
+
+                    if stringify:
+                        if value is None:
+                            value = ""
+                        elif data_type == "d" and isinstance(value, (datetime, date)):
+                            number_format = self.number_format(style_id)
+                            value = date_formatter(value, number_format) if date_formatter else str(value)
+                        elif number_formatter is not None and data_type == "n":
+                            value = number_formatter(value, self.number_format(style_id))
+                        elif not isinstance(value, str):
+                            value = str(value)
+
+                    cells.append((col_counter, value))
+
+                element.clear()
+                yield row_counter, cells
+
+    def _column_index(self, coordinate: str) -> int:
+        letters = coordinate.rstrip("0123456789")
+        index = self._column_cache.get(letters)
+        if index is None:
+            index = column_index_from_string(letters)
+            self._column_cache[letters] = index
+        return index
+
+    def _sheet_path(self, sheet_name: str) -> str:
+        try:
+            return self._sheet_paths[sheet_name]
+        except KeyError:
+            raise KeyError(f"工作表不存在: {sheet_name}") from None
+
+    def _load_workbook(self) -> None:
+        workbook_part = self._find_workbook_part()
+        root = fromstring(self._archive.read(workbook_part))
+
+        properties = root.find(f"{{{SHEET_MAIN_NS}}}workbookPr")
+        date1904 = properties is not None and properties.get("date1904") in {"1", "true"}
+        self._epoch = CALENDAR_MAC_1904 if date1904 else CALENDAR_WINDOWS_1900
+
+        rels = self._read_rels(workbook_part)
+        self._sheet_paths: Dict[str, str] = {}
+        self._sheet_states: Dict[str, str] = {}
+        for sheet in root.iter(f"{{{SHEET_MAIN_NS}}}sheet"):
+            rel = rels.get(sheet.get(f"{{{REL_NS}}}id"))
+            if rel is not None and rel[0] in _SHEET_REL_TYPES:
+                self._sheet_paths[sheet.get("name")] = rel[1]
+                self._sheet_states[sheet.get("name")] = sheet.get("state", "visible")
+
+        targets = {rel_type.rsplit("/", 1)[-1]: target for rel_type, target in rels.values()}
+        self._open_shared_strings(targets.get("sharedStrings"))
+        self._style_formats, self._date_styles = self._read_styles(targets.get("styles"))
+
+    def _find_workbook_part(self) -> str:
+        rels = self._read_rels("")
+        for rel_type, target in rels.values():
+            if rel_type.endswith("/officeDocument"):
+                return target
+        return "xl/workbook.xml"
+
+    def _read_rels(self, part: str) -> Dict[str, Tuple[str, str]]:
+        folder, name = posixpath.split(part)
+        rels_path = posixpath.join(folder, "_rels", f"{name}.rels")
+        try:
+            root = fromstring(self._archive.read(rels_path))
+        except KeyError:
+            return {}
+
+        rels: Dict[str, Tuple[str, str]] = {}
+        for rel in root.iter(f"{{{PKG_REL_NS}}}Relationship"):
+            if rel.get("TargetMode") == "External":
+                continue
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                target = target.lstrip("/")
+            else:
+                target = posixpath.normpath(posixpath.join(folder, target))
+            rels[rel.get("Id")] = (rel.get("Type", ""), target)
+        return rels
+
+    def _open_shared_strings(self, part: Optional[str]) -> None:
+        self._shared_strings: List[str] = []
+        self._shared_source = None
+        self._shared_events = None
+        if part and part in self._archive.namelist():
+            self._shared_source = self._archive.open(part)
+            self._shared_events = iterparse(self._shared_source)
+
+    def _shared_string(self, index: int) -> str:
+        """继续解析共享字符串表，直到第 index 项可用。
+
+        大工作簿的共享字符串表可达数十 MB，只读表头时无需全部解析；
+        已解析的项保存在 _shared_strings 中，后续访问直接命中列表。
+        """
+        strings = self._shared_strings
+        if self._shared_events is not None:
+            for _event, element in self._shared_events:
+                if element.tag == _SI_TAG:
+                    strings.append(_text_content(element).replace("x005F_", ""))
+                    element.clear()
+                    if len(strings) > index:
+                        break
+            else:
+                self._close_shared_strings()
+        return strings[index]
+
+    def _close_shared_strings(self) -> None:
+        if self._shared_source is not None:
+            self._shared_source.close()
+        self._shared_source = None
+        self._shared_events = None
+
+    def _read_styles(self, part: Optional[str]) -> Tuple[Sequence[str], Set[int]]:
+        if not part or part not in self._archive.namelist():
+            return [], set()
+        root = fromstring(self._archive.read(part))
+
+        custom: Dict[int, str] = {}
+        num_fmts = root.find(f"{{{SHEET_MAIN_NS}}}numFmts")
+        if num_fmts is not None:
+            for fmt in num_fmts:
+                custom[int(fmt.get("numFmtId"))] = fmt.get("formatCode", "")
+
+        formats: List[str] = []
+        date_styles: Set[int] = set()
+        cell_xfs = root.find(f"{{{SHEET_MAIN_NS}}}cellXfs")
+        if cell_xfs is not None:
+            for idx, xf in enumerate(cell_xfs):
+                fmt_id = int(xf.get("numFmtId", 0))
+                code = custom[fmt_id] if fmt_id in custom else BUILTIN_FORMATS.get(fmt_id)
+                if is_date_format(code):
+                    date_styles.add(idx)
+                formats.append(code or "General")
+        return formats, date_styles
+
+
+def read_sheet_frame(reader: FastXlsxReader, sheet_name: str, header: int = 0, nrows: Optional[int] = None):
+    """把工作表读成 DataFrame，结果等同于 pd.read_excel(dtype=str, na_filter=False)。
+
+    列名规则与 pandas 一致：空列名为 "Unnamed: i"，重复列名追加 ".1"、".2"。
+    指定 nrows 时只读取表头所需的前几行，nrows=0 可用于只取列名。
+    """
+    import pandas as pd
+
+    rows_needed = None if nrows is None else header + 1 + nrows
+    data = _read_pandas_rows(reader, sheet_name, header, rows_needed)
+    if not data:
+        return pd.DataFrame()
+
+    columns = pandas_column_names(data[header])
+    body = data[header + 1:]
+    if nrows is not None:
+        body = body[:nrows]
+    frame = pd.DataFrame([[str(value) for value in row] for row in body], columns=columns, dtype=object)
+    return frame.astype(str) if not frame.empty else frame
+
+
+def read_sheet_header(reader: FastXlsxReader, sheet_name: str, header: int = 0) -> List[object]:
+    """只读取列名，等同于 pd.read_excel(header=header, nrows=0).columns。
+
+    读到表头行后立即停止解析工作表，不构造 DataFrame；共享字符串表也只解析到
+    表头引用的最大序号为止。
+    """
+    data = _read_pandas_rows(reader, sheet_name, header, header + 1)
+    return pandas_column_names(data[header]) if data else []
+
+
+def _read_pandas_rows(
+    reader: FastXlsxReader, sheet_name: str, header: int, rows_needed: Optional[int]
+) -> List[List[object]]:
+    data: List[List[object]] = []
+    last_row_with_data = -1
+    for values in reader.iter_values(sheet_name):
+        row = [_pandas_cell(value) for value in values]
+        while row and row[-1] == "":
+            row.pop()
+        if row:
+            last_row_with_data = len(data)
+        data.append(row)
+        if rows_needed is not None and len(data) >= rows_needed:
+            break
+
+    data = data[: last_row_with_data + 1]
+    if not data:
+        return data
+
+    width = max(len(row) for row in data)
+    data = [row + [""] * (width - len(row)) for row in data]
+    if header >= len(data):
+        raise ValueError(f"Passed header={header}, len of {width}, but only {len(data)} lines in file")
+    return data
+
+
+def _pandas_cell(value: object) -> object:
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        as_int = int(value)
+        return as_int if as_int == value else value
+    return value
+
+
+def pandas_column_names(header_row: Sequence[object]) -> List[object]:
+    """按 pandas 读取表头的规则命名列：空列名为 "Unnamed: i"，重复列名追加 ".1"、".2"。"""
+    columns = [f"Unnamed: {idx}" if value == "" else value for idx, value in enumerate(header_row)]
+    counts: Dict[object, int] = {}
+    for idx, column in enumerate(columns):
+        original = column
+        count = counts.get(column, 0)
+        while count > 0:
+            counts[original] = count + 1
+            column = f"{original}.{count}"
+            if column in columns:
+                count += 1
+            else:
+                count = counts.get(column, 0)
+        columns[idx] = column
+        counts[column] = count + 1
+    return columns
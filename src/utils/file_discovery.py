@@ -0,0 +1,107 @@
+"""基于 os.scandir 的文件发现。
+
+各工具共用的目录遍历：在读取目录项时就按扩展名过滤（不对被丢弃的文件做
+stat 或路径拼接），整棵跳过版本库、依赖与缓存目录，
+并以生成器逐个产出结果，超大目录树也能立即开始处理。
+
+产出顺序与对完整路径列表排序 (sorted) 的结果一致：同一目录内按名称排序，
+子目录按 "名称 + 路径分隔符" 参与排序后深度优先展开。
+"""
+
+import fnmatch
+import os
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_IGNORED_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".idea",
+        ".vscode",
+        ".venv",
+        "venv",
+        "node_modules",
+        "__pycache__",
+        ".pytest_cache",
+        ".mypy_cache",
+    }
+)
+
+DEFAULT_IGNORED_FILES = (
+    "~$*",  # Office 打开文件时生成的锁文件
+    ".~lock.*#",  # LibreOffice 锁文件
+    "Thumbs.db",
+    "desktop.ini",
+    ".DS_Store",
+)
+
+
+def iter_files(
+    root: str,
+    extensions: Optional[Iterable[str]] = None,
+    recursive: bool = True,
+    ignored_dirs: Iterable[str] = DEFAULT_IGNORED_DIRS,
+    ignored_files: Iterable[str] = DEFAULT_IGNORED_FILES,
+) -> Iterator[str]:
+    """逐个产出 root 下符合条件的文件路径。
+
+    Args:
+        root: 起始目录。
+        extensions: 允许的文件后缀（如 ".csv"，不区分大小写），None 表示不限。
+        recursive: 是否进入子目录。
+        ignored_dirs: 要跳过的目录名（精确匹配，不区分大小写）。
+        ignored_files: 要跳过的文件名通配模式（不区分大小写）；调用方可在
+            DEFAULT_IGNORED_FILES 基础上追加自身输出文件的模式。
+
+    无法读取的目录（权限不足、遍历期间被删除等）与 os.walk 一样被静默跳过；
+    不进入指向目录的符号链接。
+    """
+    suffixes = tuple(ext.lower() for ext in extensions) if extensions is not None else None
+    skipped_dirs = {name.lower() for name in ignored_dirs}
+    file_patterns = [pattern.lower() for pattern in ignored_files]
+
+    def is_ignored_file(name: str) -> bool:
+        return any(fnmatch.fnmatchcase(name, pattern) for pattern in file_patterns)
+
+    def walk(directory: str) -> Iterator[str]:
+        try:
+            with os.scandir(directory) as iterator:
+                entries: List[Tuple[str, os.DirEntry, bool]] = []
+                for entry in iterator:
+                    name = entry.name
+                    lowered = name.lower()
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if recursive and lowered not in skipped_dirs:
+                            entries.append((name + os.sep, entry, True))
+                        continue
+                    if suffixes is not None and not lowered.endswith(suffixes):
+                        continue
+                    if is_ignored_file(lowered):
+                        continue
+                    entries.append((name, entry, False))
+        except OSError:
+            return
+
+        entries.sort(key=lambda item: item[0])
+        for _key, entry, is_dir in entries:
+            if is_dir:
+                yield from walk(entry.path)
+            else:
+                try:
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                yield entry.path
+
+    return walk(root)
+
+
+def collect_files(root: str, **kwargs) -> List[str]:
+    """iter_files 的列表形式，参数相同。"""
+    return list(iter_files(root, **kwargs))
@@ -1,22 +1,58 @@
 import csv
 import os
-from typing import Callable, Dict, Iterable, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import pandas as pd
 
+from .column_profiler import ColumnProfiler
+from .encoding_detector import EncodingDetector, get_default_detector
+from .excel_number_format import format_excel_date
+from .fast_xlsx_reader import FastXlsxReader, pandas_column_names, read_sheet_header, validate_engine
+from .file_discovery import DEFAULT_IGNORED_FILES, collect_files
+from .header_index import HeaderIndex, file_signature
+
+
+# (文件路径, 字段列表, 错误, 列画像)；未启用画像时列画像为 None
+_Outcome = Tuple[str, List[str], Optional[Exception], Optional[List[Dict[str, object]]]]
+
+
+class _SheetReadFailure(str):
+    """字段列表中代替读取失败的工作表的条目；含此类条目的结果不写入表头索引。"""
+
 
 class FileFieldExtractorService:
     """Extract field names from supported flat files and spreadsheets."""
 
     SUPPORTED_EXTENSIONS = {".csv", ".xlsx", ".xlsm"}
+    # Summary and profile files this tool writes into the scanned folder
+    OUTPUT_FILE_PATTERNS = ("file_fields_summary*.csv", "file_fields_profile*.csv")
 
-    def __init__(self, encodings: Optional[Iterable[str]] = None) -> None:
+    def __init__(
+        self,
+        encodings: Optional[Iterable[str]] = None,
+        encoding_detector: Optional[EncodingDetector] = None,
+        engine: str = "fast",
+        index_path: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            encodings: Fallback encodings tried for CSV files.
+            encoding_detector: Detector used to pick the first CSV encoding.
+            engine: Excel reader, "fast" (default; header-only FastXlsxReader
+                pass that stops after the header row) or "openpyxl" (pandas).
+            index_path: SQLite header index used when ``use_index`` is enabled;
+                defaults to ``header_index.sqlite3`` next to the app config file.
+        """
         self.encodings = list(encodings) if encodings else [
             "utf-8-sig",
             "utf-8",
             "gbk",
             "latin1",
         ]
+        self.encoding_detector = encoding_detector or get_default_detector()
+        self.engine = validate_engine(engine)
+        self.index_path = index_path
 
     def extract_fields(
         self,
@@ -24,6 +60,10 @@ class FileFieldExtractorService:
         include_subfolders: bool = False,
         header_row: int = 1,
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        max_workers: int = 1,
+        use_index: bool = False,
+        refresh_index: bool = False,
+        profile: bool = False,
     ) -> Dict[str, object]:
         """
         Extract field names from supported files within a folder.
@@ -34,10 +74,26 @@ class FileFieldExtractorService:
             header_row: 1-based row index used as header names.
             progress_callback: Optional callable to report progress. Receives
                 the current index (1-based), total files count, and current file name.
+            max_workers: Number of threads reading files concurrently. Values
+                above 1 overlap open/read latency (e.g. on network shares);
+                progress callbacks are still delivered in file order from the
+                calling thread, once each file and all files before it are done.
+            use_index: Serve files whose (absolute path, size, mtime, header_row)
+                match the persistent header index without opening them, and
+                store newly extracted field lists in it.
+            refresh_index: Ignore existing index entries and re-read every
+                file, updating the index with the fresh results.
+            profile: Also stream every file once to build per-column profiles
+                (non-empty ratio, HyperLogLog distinct estimate, max length,
+                inferred type, reservoir samples) with bounded memory, and
+                write them to ``file_fields_profile*.csv`` next to the summary.
+                Profiling always reads the files, so the index is not consulted.
 
         Returns:
             A dictionary containing the output CSV path, extraction details,
-            processed file count, error list, and total extracted field count.
+            processed file count, error list, total extracted field count,
+            the header index hit/miss counts (both 0 when the index is unused),
+            and, in profile mode, the profile CSV path and per-file profiles.
 
         Raises:
             ValueError: If the folder does not exist or contains no supported files.
@@ -57,44 +113,165 @@ class FileFieldExtractorService:
         total_fields = 0
         total_files = len(files)
 
-        for idx, file_path in enumerate(files, 1):
-            if progress_callback:
-                progress_callback(idx, total_files, os.path.basename(file_path))
+        index = HeaderIndex(self.index_path) if use_index or refresh_index else None
+        signatures: Dict[str, Tuple[str, int, int]] = {}
+        cached: Dict[str, List[str]] = {}
+        profiles: Dict[str, List[Dict[str, object]]] = {}
+        try:
+            if index is not None:
+                for file_path in files:
+                    try:
+                        signatures[file_path] = file_signature(file_path)
+                    except OSError:
+                        continue
+                    fields = None if refresh_index or profile else index.lookup(signatures[file_path], header_row)
+                    if fields is not None:
+                        cached[file_path] = fields
 
-            try:
-                fields = self._extract_fields_from_file(file_path, header_row)
+            if max_workers > 1 and total_files - len(cached) > 1:
+                outcomes = self._extract_concurrently(
+                    files, header_row, max_workers, progress_callback, cached, profile
+                )
+            else:
+                outcomes = self._extract_sequentially(files, header_row, progress_callback, cached, profile)
+
+            for file_path, fields, error, file_profiles in outcomes:
                 details[file_path] = fields
                 total_fields += len(fields)
-            except Exception as exc:  # pylint: disable=broad-except
-                errors.append(f"{file_path}: {exc}")
-                details[file_path] = []
+                if file_profiles is not None:
+                    profiles[file_path] = file_profiles
+                if error:
+                    errors.append(f"{file_path}: {error}")
+                elif (
+                    index is not None
+                    and file_path not in cached
+                    and file_path in signatures
+                    and not any(isinstance(field, _SheetReadFailure) for field in fields)
+                ):
+                    index.store(signatures[file_path], header_row, fields)
+        finally:
+            if index is not None:
+                index.close()
 
         output_path = self._write_result_csv(folder_path, details)
-        return {
+        result = {
             "output_file": output_path,
             "details": details,
             "processed_files": total_files,
             "errors": errors,
             "total_fields": total_fields,
+            "index_hits": len(cached),
+            "index_misses": total_files - len(cached) if index is not None else 0,
         }
+        if profile:
+            result["profile_file"] = self._write_profile_csv(folder_path, output_path, profiles)
+            result["profiles"] = profiles
+        return result
+
+    def _extract_sequentially(
+        self,
+        files: Sequence[str],
+        header_row: int,
+        progress_callback: Optional[Callable[[int, int, str], None]],
+        cached: Dict[str, List[str]],
+        profile: bool = False,
+    ) -> Iterator[_Outcome]:
+        for idx, file_path in enumerate(files, 1):
+            if progress_callback:
+                progress_callback(idx, len(files), os.path.basename(file_path))
+            if file_path in cached:
+                yield file_path, cached[file_path], None, None
+            else:
+                yield self._extract_outcome(file_path, header_row, profile)
+
+    def _extract_concurrently(
+        self,
+        files: Sequence[str],
+        header_row: int,
+        max_workers: int,
+        progress_callback: Optional[Callable[[int, int, str], None]],
+        cached: Dict[str, List[str]],
+        profile: bool = False,
+    ) -> Iterator[_Outcome]:
+        pending = [file_path for file_path in files if file_path not in cached]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            futures = {
+                file_path: executor.submit(self._extract_outcome, file_path, header_row, profile)
+                for file_path in pending
+            }
+            # 按提交顺序取结果，进度回调与结果顺序都与顺序模式一致
+            for idx, file_path in enumerate(files, 1):
+                if file_path in cached:
+                    outcome = (file_path, cached[file_path], None, None)
+                else:
+                    outcome = futures[file_path].result()
+                if progress_callback:
+                    progress_callback(idx, len(files), os.path.basename(file_path))
+                yield outcome
+
+    def _extract_outcome(self, file_path: str, header_row: int, profile: bool = False) -> _Outcome:
+        try:
+            fields = self._extract_fields_from_file(file_path, header_row)
+        except Exception as exc:  # pylint: disable=broad-except
+            return file_path, [], exc, None
+        if not profile:
+            return file_path, fields, None, None
+        try:
+            return file_path, fields, None, self._profile_file(file_path, header_row)
+        except Exception as exc:  # pylint: disable=broad-except
+            return file_path, fields, ValueError(f"列画像失败: {exc}"), []
+
+    def _profile_file(self, file_path: str, header_row: int) -> List[Dict[str, object]]:
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension == ".csv":
+            return self._profile_csv(file_path, header_row)
+        return self._profile_excel(file_path, header_row)
+
+    def _profile_csv(self, file_path: str, header_row: int) -> List[Dict[str, object]]:
+        last_exception: Optional[Exception] = None
+        for encoding in self.encoding_detector.order_candidates(file_path, self.encodings):
+            try:
+                with open(file_path, "r", encoding=encoding, newline="") as handle:
+                    # 与 pandas.read_csv 一致：空行不计入表头行号，也不计入数据行
+                    rows = (row for row in csv.reader(handle) if row)
+                    for _ in range(header_row - 1):
+                        next(rows, None)
+                    header = next(rows, None)
+                    if header is None:
+                        return []
+                    # 表头取自同一个 reader 的首行，列名规则与 _extract_from_csv（pandas）一致
+                    profiler = ColumnProfiler([str(column) for column in pandas_column_names(header)])
+                    for row in rows:
+                        profiler.add_row(row)
+                    return profiler.results()
+            except UnicodeDecodeError as exc:
+                last_exception = exc
+        raise ValueError(f"无法解析CSV文件（编码可能不受支持）: {last_exception}")
+
+    def _profile_excel(self, file_path: str, header_row: int) -> List[Dict[str, object]]:
+        profiles: List[Dict[str, object]] = []
+        with FastXlsxReader(file_path) as reader:
+            for sheet in reader.sheet_names:
+                columns = read_sheet_header(reader, sheet, header=header_row - 1)
+                if not columns:
+                    continue
+                profiler = ColumnProfiler([f"{sheet}: {column}" for column in columns])
+                rows = reader.iter_string_rows(sheet, format_excel_date)
+                for _ in range(header_row):
+                    next(rows, None)
+                for row in rows:
+                    profiler.add_row(row)
+                profiles.extend(profiler.results())
+        return profiles
 
     def _collect_files(self, folder_path: str, include_subfolders: bool) -> List[str]:
-        files: List[str] = []
-        if include_subfolders:
-            for root, _, filenames in os.walk(folder_path):
-                for name in filenames:
-                    if self._is_supported(name):
-                        files.append(os.path.join(root, name))
-        else:
-            for name in os.listdir(folder_path):
-                candidate = os.path.join(folder_path, name)
-                if os.path.isfile(candidate) and self._is_supported(name):
-                    files.append(candidate)
-        files.sort()
-        return files
-
-    def _is_supported(self, filename: str) -> bool:
-        return os.path.splitext(filename)[1].lower() in self.SUPPORTED_EXTENSIONS
+        # 已按路径排序；自身输出的汇总/画像文件、Office 锁文件与 .git 等目录会被跳过
+        return collect_files(
+            folder_path,
+            extensions=self.SUPPORTED_EXTENSIONS,
+            recursive=include_subfolders,
+            ignored_files=DEFAULT_IGNORED_FILES + self.OUTPUT_FILE_PATTERNS,
+        )
 
     def _extract_fields_from_file(self, file_path: str, header_row: int) -> List[str]:
         extension = os.path.splitext(file_path)[1].lower()
@@ -106,7 +283,7 @@ class FileFieldExtractorService:
 
     def _extract_from_csv(self, file_path: str, header_row: int) -> List[str]:
         last_exception: Optional[Exception] = None
-        for encoding in self.encodings:
+        for encoding in self.encoding_detector.order_candidates(file_path, self.encodings):
             try:
                 df = pd.read_csv(
                     file_path,
@@ -122,6 +299,9 @@ class FileFieldExtractorService:
         raise ValueError(f"无法解析CSV文件（编码可能不受支持）: {last_exception}")
 
     def _extract_from_excel(self, file_path: str, header_row: int) -> List[str]:
+        if self.engine == "fast":
+            return self._extract_from_excel_fast(file_path, header_row)
+
         fields: List[str] = []
         try:
             excel_file = pd.ExcelFile(file_path, engine="openpyxl")
@@ -133,7 +313,23 @@ class FileFieldExtractorService:
                 df = excel_file.parse(sheet, nrows=0, dtype=str, header=header_row - 1)
                 fields.extend([f"{sheet}: {col}" for col in df.columns])
             except Exception as exc:  # pylint: disable=broad-except
-                fields.append(f"{sheet}: 读取失败 ({exc})")
+                fields.append(_SheetReadFailure(f"{sheet}: 读取失败 ({exc})"))
+        return fields
+
+    def _extract_from_excel_fast(self, file_path: str, header_row: int) -> List[str]:
+        fields: List[str] = []
+        try:
+            reader = FastXlsxReader(file_path)
+        except Exception as exc:  # pylint: disable=broad-except
+            raise ValueError(f"无法读取Excel文件: {exc}") from exc
+
+        with reader:
+            for sheet in reader.sheet_names:
+                try:
+                    columns = read_sheet_header(reader, sheet, header=header_row - 1)
+                    fields.extend([f"{sheet}: {col}" for col in columns])
+                except Exception as exc:  # pylint: disable=broad-except
+                    fields.append(_SheetReadFailure(f"{sheet}: 读取失败 ({exc})"))
         return fields
 
     def _write_result_csv(self, folder_path: str, details: Dict[str, List[str]]) -> str:
@@ -150,6 +346,35 @@ class FileFieldExtractorService:
                     writer.writerow([relative_name, ""])
         return output_path
 
+    def _write_profile_csv(
+        self, folder_path: str, summary_path: str, profiles: Dict[str, List[Dict[str, object]]]
+    ) -> str:
+        # 与字段汇总使用相同的序号后缀，便于把两个文件对应起来
+        summary_name = os.path.basename(summary_path)
+        output_path = os.path.join(
+            os.path.dirname(summary_path), summary_name.replace("file_fields_summary", "file_fields_profile", 1)
+        )
+        with open(output_path, "w", newline="", encoding="utf-8-sig") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(["文件名", "字段名", "行数", "非空数", "非空比例", "近似去重数", "最大长度", "推断类型", "样例值"])
+            for absolute_path, file_profiles in profiles.items():
+                relative_name = os.path.relpath(absolute_path, folder_path)
+                for item in file_profiles:
+                    writer.writerow(
+                        [
+                            relative_name,
+                            item["field"],
+                            item["rows"],
+                            item["non_empty"],
+                            item["non_empty_ratio"],
+                            item["approx_distinct"],
+                            item["max_length"],
+                            item["inferred_type"],
+                            " | ".join(item["samples"]),
+                        ]
+                    )
+        return output_path
+
     def _build_output_path(self, folder_path: str) -> str:
         base_name = "file_fields_summary.csv"
         output_path = os.path.join(folder_path, base_name)
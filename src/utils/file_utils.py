@@ -0,0 +1,35 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Iterator
+
+
+@contextmanager
+def atomic_write(target_path: str, mode: str = "w", **open_kwargs) -> Iterator[IO]:
+    """在目标文件同目录下写临时文件，成功后原子替换目标文件。
+
+    写入过程中发生异常时临时文件会被删除，目标文件保持原样；
+    因此即使目标就是正在读取的输入文件，也可以安全地“原地覆盖”。
+
+    Args:
+        target_path: 最终输出文件路径。
+        mode: 打开临时文件的模式（"w" 或 "wb"）。
+        **open_kwargs: 透传给 open 的参数，如 encoding、newline。
+    """
+    directory = os.path.dirname(os.path.abspath(target_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(target_path)}.",
+        suffix=".tmp",
+        dir=directory,
+    )
+    try:
+        with os.fdopen(fd, mode, **open_kwargs) as handle:
+            yield handle
+        os.replace(temp_path, target_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,81 @@
+import json
+import os
+import sqlite3
+from typing import List, Optional, Tuple
+
+from .app_config import get_app_config_path
+
+
+INDEX_FILENAME = "header_index.sqlite3"
+INDEX_VERSION = 1
+
+
+def default_index_path() -> str:
+    """返回默认索引路径：与应用配置文件位于同一目录。"""
+    return str(get_app_config_path().parent / INDEX_FILENAME)
+
+
+def file_signature(file_path: str) -> Tuple[str, int, int]:
+    """返回 (绝对路径, 大小, 修改时间纳秒)，作为索引键的文件部分。"""
+    stat = os.stat(file_path)
+    return os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns
+
+
+class HeaderIndex:
+    """字段提取结果的持久化索引（SQLite）。
+
+    键为 (绝对路径, 列名行号)，同时记录文件大小与修改时间；两者均与当前文件
+    一致时视为命中，否则视为未命中并在重新提取后覆盖。只缓存成功提取的结果，
+    读取失败的文件下次仍会重新读取。索引只应在创建它的线程中使用。
+    """
+
+    def __init__(self, index_path: Optional[str] = None) -> None:
+        self.index_path = index_path or default_index_path()
+        directory = os.path.dirname(self.index_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(self.index_path)
+        self._ensure_schema()
+
+    def __enter__(self) -> "HeaderIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.commit()
+        self._connection.close()
+
+    def lookup(self, signature: Tuple[str, int, int], header_row: int) -> Optional[List[str]]:
+        path, size, mtime_ns = signature
+        row = self._connection.execute(
+            "SELECT size, mtime_ns, fields FROM headers WHERE path = ? AND header_row = ?",
+            (path, header_row),
+        ).fetchone()
+        if row is None or row[0] != size or row[1] != mtime_ns:
+            return None
+        try:
+            fields = json.loads(row[2])
+        except ValueError:
+            return None
+        return fields if isinstance(fields, list) else None
+
+    def store(self, signature: Tuple[str, int, int], header_row: int, fields: List[str]) -> None:
+        path, size, mtime_ns = signature
+        self._connection.execute(
+            "INSERT OR REPLACE INTO headers (path, header_row, size, mtime_ns, fields) VALUES (?, ?, ?, ?, ?)",
+            (path, header_row, size, mtime_ns, json.dumps(fields, ensure_ascii=False)),
+        )
+
+    def _ensure_schema(self) -> None:
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != INDEX_VERSION:
+            self._connection.execute("DROP TABLE IF EXISTS headers")
+            self._connection.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS headers ("
+            "path TEXT NOT NULL, header_row INTEGER NOT NULL, size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, fields TEXT NOT NULL, PRIMARY KEY (path, header_row))"
+        )
+        self._connection.commit()
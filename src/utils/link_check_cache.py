@@ -0,0 +1,172 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from .app_config import get_app_config_path
+
+
+CACHE_FILENAME = "link_check_cache.sqlite3"
+CACHE_VERSION = 1
+
+# 各检测状态的默认有效期（秒）；skipped 不访问网络，不写入缓存。
+# dead 的有效期只用于带 HTTP 状态码的结果，连接失败等没有状态码的 dead 按 error 计
+DEFAULT_TTL: Dict[str, int] = {
+    "alive": 7 * 24 * 3600,
+    "dead": 24 * 3600,
+    "timeout": 3600,
+    "error": 3600,
+}
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def default_cache_path() -> str:
+    """返回默认缓存路径：与应用配置文件位于同一目录。"""
+    return str(get_app_config_path().parent / CACHE_FILENAME)
+
+
+def normalize_url(url: str) -> str:
+    """规范化 URL 作为缓存键：协议与主机转小写、去掉默认端口与片段，空路径补为 "/"。"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host
+    if port is not None and port != _DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{port}"
+    if parts.username is not None:
+        userinfo = parts.username if parts.password is None else f"{parts.username}:{parts.password}"
+        netloc = f"{userinfo}@{netloc}"
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+
+class CachedLink:
+    """缓存中的一条检测记录。"""
+
+    __slots__ = ("status", "status_code", "error", "etag", "last_modified", "fresh")
+
+    def __init__(self, status, status_code, error, etag, last_modified, fresh) -> None:
+        self.status = status
+        self.status_code = status_code
+        self.error = error
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fresh = fresh
+
+    @property
+    def revalidatable(self) -> bool:
+        """过期后能否用条件请求（If-None-Match / If-Modified-Since）低成本确认。"""
+        return self.status == "alive" and bool(self.etag or self.last_modified)
+
+    def result(self, url: str) -> dict:
+        return {"url": url, "status": self.status, "status_code": self.status_code, "error": self.error}
+
+
+class LinkCheckCache:
+    """链接检测结果的持久化缓存（SQLite），跨多次运行复用。
+
+    键为规范化后的 URL，同时记录检测时间与响应的 ETag / Last-Modified。
+    未超过对应状态有效期的记录直接复用；过期但带校验值的正常链接可用条件
+    请求重新确认。连接由锁保护，可在并发检测的工作线程中使用。
+    """
+
+    def __init__(
+        self,
+        cache_path: Optional[str] = None,
+        ttl: Optional[Dict[str, int]] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.cache_path = cache_path or default_cache_path()
+        self.ttl = dict(DEFAULT_TTL)
+        if ttl:
+            self.ttl.update(ttl)
+        self._clock = clock
+        self.hits = 0
+        self.revalidated = 0
+        directory = os.path.dirname(self.cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.cache_path, check_same_thread=False)
+        self._ensure_schema()
+
+    def __enter__(self) -> "LinkCheckCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.commit()
+            self._connection.close()
+
+    def lookup(self, url: str) -> Optional[CachedLink]:
+        """返回 url 的缓存记录（含是否仍在有效期内），没有记录时返回 None。"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status, status_code, error, etag, last_modified, checked_at FROM links WHERE url = ?",
+                (normalize_url(url),),
+            ).fetchone()
+        if row is None:
+            return None
+        status, status_code, error, etag, last_modified, checked_at = row
+        age = self._clock() - checked_at
+        fresh = 0 <= age < self.ttl.get(self._ttl_key(status, status_code), 0)
+        if fresh:
+            with self._lock:
+                self.hits += 1
+        return CachedLink(status, status_code, error, etag, last_modified, fresh)
+
+    def store(self, url: str, result: dict, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        if result["status"] not in self.ttl:
+            return
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO links (url, status, status_code, error, etag, last_modified, checked_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    normalize_url(url),
+                    result["status"],
+                    result["status_code"],
+                    result["error"],
+                    etag,
+                    last_modified,
+                    self._clock(),
+                ),
+            )
+
+    @staticmethod
+    def _ttl_key(status: str, status_code: Optional[int]) -> str:
+        # 网络层失败（DNS、拒绝连接等）往往只是暂时离线，不应按服务器明确返回的 4xx/5xx 长期缓存
+        if status == "dead" and status_code is None:
+            return "error"
+        return status
+
+    def touch(self, url: str) -> None:
+        """条件请求确认未变化后，刷新记录的检测时间。"""
+        with self._lock:
+            self.revalidated += 1
+            self._connection.execute(
+                "UPDATE links SET checked_at = ? WHERE url = ?", (self._clock(), normalize_url(url))
+            )
+
+    def _ensure_schema(self) -> None:
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != CACHE_VERSION:
+            self._connection.execute("DROP TABLE IF EXISTS links")
+            self._connection.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS links ("
+            "url TEXT PRIMARY KEY, status TEXT NOT NULL, status_code INTEGER, error TEXT, "
+            "etag TEXT, last_modified TEXT, checked_at REAL NOT NULL)"
+        )
+        self._connection.commit()
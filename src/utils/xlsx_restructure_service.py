@@ -3,6 +3,8 @@ import pandas as pd
 from typing import Optional, Tuple
 import re
 
+from .fast_xlsx_reader import FastXlsxReader, read_sheet_frame, validate_engine
+
 # 示例的STANDARD_FIELDS和SORTKEY，可按实际扩充
 STANDARD_FIELDS = {
     'AG':['STUDYID','DOMAIN','USUBJID','AGSEQ','AGGRPID','AGSPID','AGLNKID','AGLNKGRP','AGTRT','AGMODIFY','AGDECOD','AGCAT','AGSCAT','AGPRESP','AGOCCUR','AGSTAT','AGREASND','AGCLAS','AGCLASCD','AGDOSE','AGDOSTXT','AGDOSU','AGDOSFRM','AGDOSFRQ','AGROUTE','VISITNUM','VISIT','VISITDY','TAETORD','EPOCH','AGSTDTC','AGENDTC','AGSTDY','AGENDY','AGDUR','AGSTRF','AGENRF','AGSTRTPT','AGSTTPT','AGENRTPT','AGENTPT'],
@@ -92,14 +94,25 @@ class XlsxRestructureService:
             raise RuntimeError(f'读取Patients表失败: {e}')
         
     @staticmethod
-    def file_restructure(input_file: str, output_path: Optional[str] = None, studyid: str = "CIRCULATE", patients_mapping: Optional[dict] = None) -> Tuple[bool, str]:
+    def _read_all_sheets(input_file: str, engine: str) -> dict:
+        if validate_engine(engine) == "fast":
+            with FastXlsxReader(input_file) as reader:
+                return {name: read_sheet_frame(reader, name) for name in reader.sheet_names}
+        return pd.read_excel(input_file, sheet_name=None, dtype=str, engine='openpyxl', na_filter=False)
+
+    @staticmethod
+    def file_restructure(input_file: str, output_path: Optional[str] = None, studyid: str = "CIRCULATE", patients_mapping: Optional[dict] = None, engine: str = "openpyxl") -> Tuple[bool, str]:
+        """
+        engine 为读取引擎："openpyxl"（pandas.read_excel）或 "fast"（FastXlsxReader），
+        两者读出的 DataFrame 一致。
+        """
         try:
             # 文件名（不带扩展名）作为关键字，如 AB.xlsx => AB
             base_name = os.path.splitext(os.path.basename(input_file))[0]
             key = re.match(r'[A-Za-z]+', base_name).group()
 
             # 加载所有sheet
-            xls = pd.read_excel(input_file, sheet_name=None, dtype=str, engine='openpyxl', na_filter=False)
+            xls = XlsxRestructureService._read_all_sheets(input_file, engine)
                         
             # 合并的dataframe列表
             df_list = []
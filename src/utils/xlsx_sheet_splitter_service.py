@@ -1,10 +1,134 @@
+import codecs
 import csv
+import fnmatch
 import os
 import re
-from datetime import date, datetime, time
-from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from openpyxl import load_workbook
+from openpyxl.utils.cell import range_boundaries
+
+from .excel_number_format import format_excel_date, format_excel_number
+from .fast_xlsx_reader import FastXlsxReader, validate_engine
+
+# 小于该大小的工作簿顺序拆分：进程池启动与每个进程重新打开工作簿的开销大于并行收益。
+PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+# 并行拆分时，每个工作进程在初始化阶段打开一次只读工作簿（及用于求列范围的
+# FastXlsxReader），之后的工作表任务复用它们。
+_worker_workbook = None
+_worker_reader: Optional[FastXlsxReader] = None
+_worker_service: Optional["XlsxSheetSplitterService"] = None
+
+
+def _init_split_worker(input_file: str, service_options: Dict[str, object]) -> None:
+    global _worker_workbook, _worker_reader, _worker_service  # pylint: disable=global-statement
+    _worker_service = XlsxSheetSplitterService(**service_options)
+    _worker_workbook = _worker_service._open_workbook(input_file)
+    _worker_reader = _worker_service._bound_reader(input_file, _worker_workbook)
+
+
+def _export_sheet_in_worker(sheet_name: str, output_file: str) -> Tuple[bool, List[str], List[str]]:
+    return _worker_service._export_sheet(_worker_workbook, _worker_reader, sheet_name, output_file)
+
+
+class _RollingCsvWriter:
+    """按行数或字节数把一个工作表的输出滚动拆分为多个 CSV 分片。
+
+    先写入 output_file；当需要第二个分片时，把已写完的文件重命名为
+    "<名称>_part001.csv"，后续分片依次为 _part002、_part003……，每个分片都会
+    重复写入首行（表头）。每个分片至少包含一行数据，因此单行超过字节上限时
+    该分片会略超预算。字节数按输出编码精确计算（含 BOM）。
+    """
+
+    def __init__(
+        self,
+        output_file: str,
+        encoding: str,
+        max_rows: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        self.output_file = output_file
+        self.encoding = encoding
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.parts: List[str] = [output_file]
+        self._line: List[str] = []
+        self._formatter = csv.writer(self)
+        self._header: Optional[str] = None
+        self._handle = None
+        # 先编码一次空串，得到 BOM 长度；之后同一编码器只输出行本身的字节
+        self._encoder = codecs.getincrementalencoder(encoding)()
+        self._bom_bytes = len(self._encoder.encode(""))
+        self._open_part(output_file)
+
+    def write(self, text: str) -> int:
+        # 供内部 csv.writer 使用：只收集格式化后的行文本，由 writerow 决定写入哪个分片
+        self._line.append(text)
+        return len(text)
+
+    def writerow(self, row: Sequence[str]) -> None:
+        self._formatter.writerow(row)
+        line = "".join(self._line)
+        self._line = []
+
+        line_bytes = len(self._encoder.encode(line)) if self.max_bytes else 0
+        if self._header is None:
+            self._header = line
+            self._header_bytes = line_bytes
+            self._write_line(line, line_bytes)
+            return
+
+        if self._part_rows and (
+            (self.max_rows and self._part_rows >= self.max_rows)
+            or (self.max_bytes and self._part_bytes + line_bytes > self.max_bytes)
+        ):
+            self._roll()
+        self._write_line(line, line_bytes)
+        self._part_rows += 1
+
+    def writerows(self, rows: Iterable[Sequence[str]]) -> None:
+        for row in rows:
+            self.writerow(row)
+
+    def discard(self) -> None:
+        """丢弃已写出的全部分片，只保留一个空的 output_file。"""
+        self.close()
+        for part in self.parts:
+            if os.path.exists(part):
+                os.remove(part)
+        self.parts = [self.output_file]
+        self._header = None
+        self._open_part(self.output_file)
+        self.close()
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _open_part(self, path: str) -> None:
+        self._handle = open(path, "w", newline="", encoding=self.encoding)
+        self._part_rows = 0
+        self._part_bytes = self._bom_bytes
+
+    def _write_line(self, line: str, line_bytes: int) -> None:
+        self._handle.write(line)
+        self._part_bytes += line_bytes
+
+    def _roll(self) -> None:
+        self.close()
+        base, ext = os.path.splitext(self.output_file)
+        if len(self.parts) == 1:
+            first_part = f"{base}_part001{ext}"
+            os.replace(self.output_file, first_part)
+            self.parts = [first_part]
+        next_part = f"{base}_part{len(self.parts) + 1:03d}{ext}"
+        self.parts.append(next_part)
+        self._open_part(next_part)
+        self._write_line(self._header, self._header_bytes)
 
 
 class XlsxSheetSplitterService:
@@ -37,24 +161,77 @@ class XlsxSheetSplitterService:
         "LPT9",
     }
 
-    def __init__(self, output_encoding: str = "utf-8-sig") -> None:
+    def __init__(
+        self,
+        output_encoding: str = "utf-8-sig",
+        engine: str = "openpyxl",
+        render_number_formats: bool = False,
+        max_rows_per_part: Optional[int] = None,
+        max_bytes_per_part: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            output_encoding: 输出 CSV 的编码。
+            engine: 读取引擎，"openpyxl"（只读模式）或 "fast"（FastXlsxReader，
+                直接解析工作表 XML，输出与 openpyxl 引擎一致）。
+            render_number_formats: 是否按单元格的数值格式（定点小数、百分比、
+                千分位等）输出数字，使其与 Excel 中显示的一致；默认输出原始数值。
+            max_rows_per_part: 单个 CSV 分片最多包含的数据行数（不含表头），
+                超过时在同一次流式写出中滚动为 "<名称>_part001.csv"、"_part002.csv"……
+                每个分片重复表头。None 表示不限。
+            max_bytes_per_part: 单个 CSV 分片的字节上限（按输出编码计算，含表头），
+                可与 max_rows_per_part 同时使用，任一条件触发即滚动。None 表示不限。
+        """
+        for option, limit in (("max_rows_per_part", max_rows_per_part), ("max_bytes_per_part", max_bytes_per_part)):
+            if limit is not None and limit < 1:
+                raise ValueError(f"{option} 必须为正整数: {limit}")
         self.output_encoding = output_encoding
+        self.engine = validate_engine(engine)
+        self.render_number_formats = render_number_formats
+        self.max_rows_per_part = max_rows_per_part
+        self.max_bytes_per_part = max_bytes_per_part
 
     def split_file(
         self,
         input_file: str,
         output_path: Optional[str] = None,
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        workers: int = 1,
+        include: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        pattern_mode: str = "glob",
+        parallel_min_bytes: int = PARALLEL_MIN_BYTES,
+        remove_stale_parts: bool = False,
     ) -> Dict[str, object]:
         """将单个 Excel 文件拆分为多个 CSV（按工作表）。
 
+        workers > 1、选中的工作表多于一个且文件不小于 parallel_min_bytes 时启用
+        并行模式（进程数不超过工作表数；小工作簿启动进程池的开销大于收益）：每个工作进程各自以只读方式打开工作簿并导出
+        分配到的工作表。输出文件名在派发前按工作表顺序统一分配，结果也按原工作表
+        顺序合并，因此与顺序模式的输出完全一致；进度回调在每个工作表完成时触发。
+
+        remove_stale_parts=True 时，导出前会删除输出目录中与这些工作表同名的
+        "<名称>_partNNN.csv" 分片，避免以不同的分片上限（或不分片）重新拆分时残留
+        旧分片。这些文件不一定由本工具写出，因此默认不删除。
+
         Args:
             input_file: 输入 Excel 文件路径（.xlsx）。
             output_path: 输出目录，None 时输出到原文件所在目录。
             progress_callback: 进度回调 (current, total, sheet_name)。
+            workers: 并行进程数上限，默认 1（顺序处理）。
+            include: 只导出名称匹配任一模式的工作表，None 表示全部。
+            exclude: 跳过名称匹配任一模式的工作表（在 include 之后应用）。
+            pattern_mode: 模式类型，"glob"（默认，如 "AE*"，不区分大小写）或
+                "regex"（整名匹配的正则表达式）。
+            parallel_min_bytes: 启用并行模式的最小文件大小（字节）。
+            remove_stale_parts: 导出前删除同名工作表的旧分片文件，默认 False。
 
         Returns:
-            dict: 包含 output_dir、output_files、errors、total_sheets、success。
+            dict: 包含 output_dir、output_files、sheet_outputs、skipped_sheets、errors、
+            total_sheets（实际导出的工作表数）、success。
+            sheet_outputs 中每项为 {"sheet", "output_file", "parts"}，parts 为该工作表
+            实际写出的文件列表（未分片时只有 output_file 一项，分片时 output_file
+            为第一个分片）；output_files 按顺序包含所有分片。
         """
         if not os.path.isfile(input_file):
             raise FileNotFoundError(f"文件不存在: {input_file}")
@@ -62,39 +239,51 @@ class XlsxSheetSplitterService:
         output_dir = output_path or os.path.dirname(input_file)
         os.makedirs(output_dir, exist_ok=True)
 
-        workbook = load_workbook(input_file, read_only=True, data_only=True)
-        sheet_names = list(workbook.sheetnames)
+        workbook = self._open_workbook(input_file)
+        all_sheet_names = self._sheet_names(workbook)
+        try:
+            sheet_names = self.select_sheets(all_sheet_names, include, exclude, pattern_mode)
+            reader = self._bound_reader(input_file, workbook)
+        except Exception:
+            workbook.close()
+            raise
+        selected = set(sheet_names)
+        skipped_sheets = [name for name in all_sheet_names if name not in selected]
         total = len(sheet_names)
 
         used_names: Set[str] = set()
-        output_files: List[str] = []
-        sheet_outputs: List[Dict[str, str]] = []
-        errors: List[str] = []
-
+        targets: List[str] = []
+        for sheet_name in sheet_names:
+            safe_name = self._sanitize_sheet_name(sheet_name)
+            safe_name = self._make_unique_name(safe_name, used_names)
+            targets.append(os.path.join(output_dir, f"{safe_name}.csv"))
+        if remove_stale_parts:
+            self._remove_stale_parts(targets)
+
+        results: List[Tuple[bool, List[str], List[str]]] = []
         try:
-            for index, sheet_name in enumerate(sheet_names, 1):
-                if progress_callback:
-                    progress_callback(index, total, sheet_name)
-
-                safe_name = self._sanitize_sheet_name(sheet_name)
-                safe_name = self._make_unique_name(safe_name, used_names)
-                output_file = os.path.join(output_dir, f"{safe_name}.csv")
-
-                try:
-                    worksheet = workbook[sheet_name]
-                    rows = self._read_sheet_as_strings(worksheet.iter_rows())
-                except Exception as exc:  # pylint: disable=broad-except
-                    errors.append(f"{sheet_name}: {exc}")
-                    rows = []
-
-                try:
-                    self._write_csv(output_file, rows)
-                    output_files.append(output_file)
-                    sheet_outputs.append({"sheet": sheet_name, "output_file": output_file})
-                except Exception as exc:  # pylint: disable=broad-except
-                    errors.append(f"{sheet_name}: {exc}")
+            workers = min(workers, total)
+            if workers > 1 and os.path.getsize(input_file) >= parallel_min_bytes:
+                workbook.close()
+                reader.close()
+                results = self._export_parallel(input_file, sheet_names, targets, workers, progress_callback)
+            else:
+                for index, (sheet_name, output_file) in enumerate(zip(sheet_names, targets), 1):
+                    if progress_callback:
+                        progress_callback(index, total, sheet_name)
+                    results.append(self._export_sheet(workbook, reader, sheet_name, output_file))
         finally:
             workbook.close()
+            reader.close()
+
+        output_files: List[str] = []
+        sheet_outputs: List[Dict[str, object]] = []
+        errors: List[str] = []
+        for sheet_name, (written, sheet_errors, parts) in zip(sheet_names, results):
+            errors.extend(sheet_errors)
+            if written:
+                output_files.extend(parts)
+                sheet_outputs.append({"sheet": sheet_name, "output_file": parts[0], "parts": parts})
 
         return {
             "input_file": input_file,
@@ -102,10 +291,232 @@ class XlsxSheetSplitterService:
             "total_sheets": total,
             "output_files": output_files,
             "sheet_outputs": sheet_outputs,
+            "skipped_sheets": skipped_sheets,
             "errors": errors,
             "success": len(errors) == 0,
         }
 
+    def inventory(self, input_file: str) -> List[Dict[str, object]]:
+        """列出工作簿中各工作表的元数据，不读取单元格数据。
+
+        只解析 workbook.xml、关系文件以及每个工作表 XML 开头的 <dimension> 元素，
+        因此即使工作表有上百万行也能立即返回，可用于拆分前预览与筛选。
+
+        Returns:
+            按工作表顺序排列的列表，每项包含：
+            sheet（名称）、state（visible/hidden/veryHidden）、dimension（声明的区域，
+            如 "A1:F120"，未声明时为 None）、estimated_rows / estimated_columns（按
+            dimension 推算的导出行数与列数，从第 1 行、A 列起算；未声明时为 None）、
+            xml_bytes（工作表 XML 解压后的大小）。
+        """
+        if not os.path.isfile(input_file):
+            raise FileNotFoundError(f"文件不存在: {input_file}")
+
+        sheets: List[Dict[str, object]] = []
+        with FastXlsxReader(input_file) as reader:
+            for sheet_name in reader.sheet_names:
+                ref = reader.dimension_ref(sheet_name)
+                bounds = range_boundaries(ref) if ref else None
+                sheets.append(
+                    {
+                        "sheet": sheet_name,
+                        "state": reader.sheet_state(sheet_name),
+                        "dimension": ref,
+                        "estimated_rows": bounds[3] if bounds else None,
+                        "estimated_columns": bounds[2] if bounds else None,
+                        "xml_bytes": reader.sheet_xml_size(sheet_name),
+                    }
+                )
+        return sheets
+
+    @staticmethod
+    def select_sheets(
+        sheet_names: Sequence[str],
+        include: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+        pattern_mode: str = "glob",
+    ) -> List[str]:
+        """按 include/exclude 模式筛选工作表名，保持原有顺序。"""
+        if pattern_mode not in {"glob", "regex"}:
+            raise ValueError(f"不支持的匹配模式: {pattern_mode}（可选: glob, regex）")
+
+        def compile_patterns(patterns: Optional[Sequence[str]]) -> List["re.Pattern[str]"]:
+            if isinstance(patterns, str):
+                patterns = [patterns]
+            compiled = []
+            for pattern in patterns or []:
+                if pattern_mode == "glob":
+                    compiled.append(re.compile(fnmatch.translate(pattern), re.IGNORECASE))
+                else:
+                    compiled.append(re.compile(pattern))
+            return compiled
+
+        included = compile_patterns(include)
+        excluded = compile_patterns(exclude)
+        selected: List[str] = []
+        for name in sheet_names:
+            if included and not any(pattern.fullmatch(name) for pattern in included):
+                continue
+            if any(pattern.fullmatch(name) for pattern in excluded):
+                continue
+            selected.append(name)
+        return selected
+
+    def _export_parallel(
+        self,
+        input_file: str,
+        sheet_names: List[str],
+        targets: List[str],
+        workers: int,
+        progress_callback: Optional[Callable[[int, int, str], None]],
+    ) -> List[Tuple[bool, List[str], List[str]]]:
+        total = len(sheet_names)
+        results: List[Tuple[bool, List[str], List[str]]] = [(False, [], [])] * total
+        service_options = {
+            "output_encoding": self.output_encoding,
+            "engine": self.engine,
+            "render_number_formats": self.render_number_formats,
+            "max_rows_per_part": self.max_rows_per_part,
+            "max_bytes_per_part": self.max_bytes_per_part,
+        }
+        with ProcessPoolExecutor(
+            max_workers=min(workers, total),
+            initializer=_init_split_worker,
+            initargs=(input_file, service_options),
+        ) as executor:
+            futures = {
+                executor.submit(_export_sheet_in_worker, sheet_name, output_file): index
+                for index, (sheet_name, output_file) in enumerate(zip(sheet_names, targets))
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                sheet_name = sheet_names[index]
+                try:
+                    results[index] = future.result()
+                except Exception as exc:  # pylint: disable=broad-except
+                    results[index] = (False, [f"{sheet_name}: {exc}"], [])
+                if progress_callback:
+                    progress_callback(done, total, sheet_name)
+        return results
+
+    def _export_sheet(
+        self, workbook, reader: FastXlsxReader, sheet_name: str, output_file: str
+    ) -> Tuple[bool, List[str], List[str]]:
+        """导出单个工作表，返回 (是否写出文件, 错误列表, 写出的文件列表)。
+
+        reader 用于求最右侧非空列（见 _bound_reader）；fast 引擎下它就是 workbook。
+        """
+        errors: List[str] = []
+        try:
+            if self.max_rows_per_part or self.max_bytes_per_part:
+                writer = _RollingCsvWriter(
+                    output_file, self.output_encoding, self.max_rows_per_part, self.max_bytes_per_part
+                )
+                handle = writer
+            else:
+                handle = open(output_file, "w", newline="", encoding=self.output_encoding)
+                writer = csv.writer(handle)
+        except Exception as exc:  # pylint: disable=broad-except
+            errors.append(f"{sheet_name}: {exc}")
+            return False, errors, []
+
+        try:
+            if isinstance(workbook, FastXlsxReader):
+                self._stream_fast_sheet_rows(workbook, sheet_name, writer, self.render_number_formats)
+            else:
+                column_bound = reader.max_value_column(sheet_name)
+                self._stream_sheet_rows(workbook[sheet_name], writer, column_bound, self.render_number_formats)
+        except Exception as exc:  # pylint: disable=broad-except
+            # 读取失败时与之前一致，输出一个空的 CSV
+            errors.append(f"{sheet_name}: {exc}")
+            if isinstance(writer, _RollingCsvWriter):
+                writer.discard()
+            else:
+                handle.seek(0)
+                handle.truncate()
+        finally:
+            handle.close()
+        return True, errors, getattr(writer, "parts", [output_file])
+
+    @staticmethod
+    def _remove_stale_parts(targets: Sequence[str]) -> None:
+        """删除各目标文件此前分片留下的 "<名称>_partNNN.csv"，本次的目标文件除外。"""
+        if not targets:
+            return
+        output_dir = os.path.dirname(targets[0])
+        names = [os.path.basename(path) for path in targets]
+        pattern = re.compile(
+            "|".join(
+                rf"{re.escape(base)}_part\d{{3,}}{re.escape(ext)}" for base, ext in map(os.path.splitext, names)
+            )
+        )
+        keep = set(names)
+        for entry in os.listdir(output_dir or "."):
+            if entry not in keep and pattern.fullmatch(entry):
+                os.remove(os.path.join(output_dir, entry))
+
+    def _open_workbook(self, input_file: str):
+        if self.engine == "fast":
+            return FastXlsxReader(input_file)
+        return load_workbook(input_file, read_only=True, data_only=True)
+
+    @staticmethod
+    def _bound_reader(input_file: str, workbook) -> FastXlsxReader:
+        """返回用于 max_value_column 的读取器：fast 引擎直接复用 workbook。
+
+        openpyxl 引擎没有廉价的列范围扫描，每个工作簿额外打开一个 FastXlsxReader，
+        由所有工作表共用；调用方负责关闭（对 fast 引擎重复关闭无副作用）。
+        """
+        if isinstance(workbook, FastXlsxReader):
+            return workbook
+        return FastXlsxReader(input_file)
+
+    @staticmethod
+    def _sheet_names(workbook) -> List[str]:
+        if isinstance(workbook, FastXlsxReader):
+            return workbook.sheet_names
+        return list(workbook.sheetnames)
+
+    @staticmethod
+    def _stream_sheet_rows(worksheet, writer, column_bound: int, render_numbers: bool = False) -> None:
+        """边读边写工作表行：截去最右侧非空列之后的列，丢弃末尾的连续空行。
+
+        column_bound 为最右侧非空列号（由 FastXlsxReader.max_value_column 求得，通常在
+        表头行即可确定）；逐行文本化并写出时只缓存尚未确定是否位于末尾的连续空行。
+        """
+        to_string = XlsxSheetSplitterService._cell_to_string
+        if column_bound:
+            string_rows = (
+                [to_string(cell, render_numbers) for cell in row[:column_bound]] for row in worksheet.iter_rows()
+            )
+        else:
+            string_rows = ([to_string(cell, render_numbers) for cell in row] for row in worksheet.iter_rows())
+        XlsxSheetSplitterService._write_trimmed_rows(string_rows, writer)
+
+    @staticmethod
+    def _stream_fast_sheet_rows(reader: FastXlsxReader, sheet_name: str, writer, render_numbers: bool = False) -> None:
+        bound = reader.max_value_column(sheet_name)
+        string_rows = reader.iter_string_rows(
+            sheet_name,
+            format_excel_date,
+            number_formatter=format_excel_number if render_numbers else None,
+        )
+        if bound:
+            string_rows = (row[:bound] for row in string_rows)
+        XlsxSheetSplitterService._write_trimmed_rows(string_rows, writer)
+
+    @staticmethod
+    def _write_trimmed_rows(string_rows: Iterable[Sequence[str]], writer) -> None:
+        pending_empty: List[Sequence[str]] = []
+        for string_row in string_rows:
+            if all(value == "" for value in string_row):
+                pending_empty.append(string_row)
+                continue
+            if pending_empty:
+                writer.writerows(pending_empty)
+                pending_empty = []
+            writer.writerow(string_row)
+
     @classmethod
     def _sanitize_sheet_name(cls, name: str) -> str:
         sanitized = cls.INVALID_CHARS_PATTERN.sub("_", name)
@@ -135,34 +546,7 @@ class XlsxSheetSplitterService:
             counter += 1
 
     @staticmethod
-    def _read_sheet_as_strings(rows: Iterable[Iterable[object]]) -> List[List[str]]:
-        output_rows: List[List[str]] = []
-        max_nonempty_col = -1
-
-        for row in rows:
-            string_row = [XlsxSheetSplitterService._cell_to_string(cell) for cell in row]
-            for idx in range(len(string_row) - 1, -1, -1):
-                if string_row[idx] != "":
-                    if idx > max_nonempty_col:
-                        max_nonempty_col = idx
-                    break
-            output_rows.append(string_row)
-
-        if max_nonempty_col >= 0:
-            output_rows = [row[: max_nonempty_col + 1] for row in output_rows]
-
-        while output_rows and all(cell == "" for cell in output_rows[-1]):
-            output_rows.pop()
-
-        return output_rows
-
-    def _write_csv(self, output_file: str, rows: List[List[str]]) -> None:
-        with open(output_file, "w", newline="", encoding=self.output_encoding) as handle:
-            writer = csv.writer(handle)
-            writer.writerows(rows)
-
-    @staticmethod
-    def _cell_to_string(cell: object) -> str:
+    def _cell_to_string(cell: object, render_numbers: bool = False) -> str:
         if cell is None:
             return ""
 
@@ -172,101 +556,13 @@ class XlsxSheetSplitterService:
 
         if getattr(cell, "is_date", False) and isinstance(value, (datetime, date)):
             number_format = getattr(cell, "number_format", "")
-            return XlsxSheetSplitterService._format_excel_date(value, number_format)
+            return format_excel_date(value, number_format)
+
+        if render_numbers and getattr(cell, "data_type", None) == "n" and isinstance(value, (int, float)):
+            return format_excel_number(value, getattr(cell, "number_format", ""))
 
         return str(value)
 
     @staticmethod
     def _format_excel_date(value: object, number_format: str) -> str:
-        fmt = (number_format or "").lower()
-        fmt = fmt.split(";")[0]
-        fmt = re.sub(r"\[[^\]]*\]", "", fmt)
-        fmt = re.sub(r'"[^"]*"', "", fmt)
-
-        if "h" in fmt:
-            date_part, time_part = fmt.split("h", 1)
-            time_part = "h" + time_part
-        else:
-            date_part, time_part = fmt, ""
-
-        date_tokens = XlsxSheetSplitterService._extract_date_tokens(date_part)
-        sep = XlsxSheetSplitterService._detect_date_separator(date_part)
-        date_str = XlsxSheetSplitterService._render_date_tokens(value, date_tokens, sep)
-
-        include_time = XlsxSheetSplitterService._should_include_time(value, time_part)
-        if not include_time:
-            return date_str
-
-        time_str = XlsxSheetSplitterService._render_time(value, time_part)
-        return f"{date_str} {time_str}"
-
-    @staticmethod
-    def _extract_date_tokens(date_part: str) -> Sequence[str]:
-        tokens: List[str] = []
-        i = 0
-        while i < len(date_part):
-            ch = date_part[i]
-            if ch in {"y", "m", "d"}:
-                j = i + 1
-                while j < len(date_part) and date_part[j] == ch:
-                    j += 1
-                tokens.append(date_part[i:j])
-                i = j
-            else:
-                i += 1
-        return tokens
-
-    @staticmethod
-    def _detect_date_separator(date_part: str) -> str:
-        if "/" in date_part:
-            return "/"
-        if "-" in date_part:
-            return "-"
-        if "." in date_part:
-            return "."
-        return "-"
-
-    @staticmethod
-    def _render_date_tokens(value: object, tokens: Sequence[str], sep: str) -> str:
-        if not isinstance(value, (datetime, date)):
-            return str(value)
-
-        year = value.year
-        month = value.month
-        day = value.day
-
-        if not tokens:
-            return f"{year:04d}{sep}{month:02d}{sep}{day:02d}"
-
-        parts: List[str] = []
-        for token in tokens:
-            if token.startswith("y"):
-                if len(token) <= 2:
-                    parts.append(f"{year % 100:02d}")
-                else:
-                    parts.append(f"{year:04d}")
-            elif token.startswith("m"):
-                if len(token) >= 2:
-                    parts.append(f"{month:02d}")
-                else:
-                    parts.append(str(month))
-            elif token.startswith("d"):
-                if len(token) >= 2:
-                    parts.append(f"{day:02d}")
-                else:
-                    parts.append(str(day))
-
-        return sep.join(parts)
-
-    @staticmethod
-    def _should_include_time(value: object, time_part: str) -> bool:
-        if not isinstance(value, datetime):
-            return False
-        if value.time() != time(0, 0, 0):
-            return True
-        return bool(time_part and ("h" in time_part or "s" in time_part))
-
-    @staticmethod
-    def _render_time(value: datetime, time_part: str) -> str:
-        include_seconds = "s" in time_part
-        return value.strftime("%H:%M:%S" if include_seconds else "%H:%M")
+        return format_excel_date(value, number_format)
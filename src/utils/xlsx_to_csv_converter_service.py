@@ -1,20 +1,20 @@
-﻿import os
+﻿import csv
+import os
 import pandas as pd
 from typing import Tuple, Optional
 
+from openpyxl import load_workbook
+
+from .fast_xlsx_reader import FastXlsxReader, validate_engine
+from .xlsx_sheet_splitter_service import XlsxSheetSplitterService
+
 class XlsxToCsvConverterService:
     @staticmethod
     def convert_file(input_file: str, output_path: Optional[str] = None) -> Tuple[bool, str]:
         try:
             df = pd.read_excel(input_file, dtype=str, engine='openpyxl', na_filter=False)
             
-            if output_path:
-                output_file = os.path.join(
-                    output_path,
-                    os.path.splitext(os.path.basename(input_file))[0] + '.csv'
-                )
-            else:
-                output_file = os.path.splitext(input_file)[0] + '.csv'
+            output_file = XlsxToCsvConverterService._build_output_file(input_file, output_path)
             
             df.to_csv(output_file, index=False, encoding='utf-8-sig')
             
@@ -23,3 +23,61 @@ class XlsxToCsvConverterService:
         except Exception as e:
             return False, str(e)
 
+    @staticmethod
+    def convert_file_streaming(
+        input_file: str,
+        output_path: Optional[str] = None,
+        engine: str = "openpyxl",
+    ) -> Tuple[bool, str]:
+        """以只读模式逐行读取第一个工作表，并在读取的同时写出 CSV（UTF-8 BOM）。
+
+        单元格文本化沿用 XlsxSheetSplitterService._cell_to_string 的日期格式规则，
+        与工作表拆分工具的输出一致。内存中只保留当前行以及工作簿的共享字符串表；
+        末尾的空列与连续空行会被丢弃（仅缓存尚未确定的空行，遇到非空行时再补写）。
+
+        Args:
+            input_file: 输入 XLSX 文件路径。
+            output_path: 输出目录，None 时输出到原文件所在目录。
+            engine: 读取引擎，"openpyxl" 或 "fast"（FastXlsxReader），两者输出一致。
+
+        Returns:
+            (是否成功, 错误信息)。
+        """
+        try:
+            validate_engine(engine)
+            output_file = XlsxToCsvConverterService._build_output_file(input_file, output_path)
+
+            if engine == "fast":
+                with FastXlsxReader(input_file) as reader:
+                    with open(output_file, 'w', newline='', encoding='utf-8-sig') as handle:
+                        XlsxSheetSplitterService._stream_fast_sheet_rows(
+                            reader, reader.sheet_names[0], csv.writer(handle)
+                        )
+                return True, ""
+
+            workbook = load_workbook(input_file, read_only=True, data_only=True)
+            try:
+                worksheet = workbook.worksheets[0]
+                reader = XlsxSheetSplitterService._bound_reader(input_file, workbook)
+                try:
+                    column_bound = reader.max_value_column(worksheet.title)
+                finally:
+                    reader.close()
+                with open(output_file, 'w', newline='', encoding='utf-8-sig') as handle:
+                    XlsxSheetSplitterService._stream_sheet_rows(worksheet, csv.writer(handle), column_bound)
+            finally:
+                workbook.close()
+
+            return True, ""
+
+        except Exception as e:
+            return False, str(e)
+
+    @staticmethod
+    def _build_output_file(input_file: str, output_path: Optional[str]) -> str:
+        if output_path:
+            return os.path.join(
+                output_path,
+                os.path.splitext(os.path.basename(input_file))[0] + '.csv'
+            )
+        return os.path.splitext(input_file)[0] + '.csv'
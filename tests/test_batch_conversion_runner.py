@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+
+from src.utils.batch_conversion_runner import BatchConversionRunner
+
+
+class BatchConversionRunnerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = self.temp_dir.name
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _write_csv(self, filename: str, rows: int) -> str:
+        path = os.path.join(self.base, filename)
+        with open(path, "w", encoding="utf-8-sig", newline="") as handle:
+            handle.write('A,B\r\n')
+            handle.write('"x","y"\r\n' * rows)
+        return path
+
+    def test_inline_run_orders_largest_first(self):
+        small = self._write_csv("small.csv", 1)
+        large = self._write_csv("large.csv", 100)
+        medium = self._write_csv("medium.csv", 10)
+
+        runner = BatchConversionRunner(max_workers=1)
+        results = list(runner.run("csv_quote", [small, large, medium]))
+
+        self.assertEqual([result.file_path for result in results], [large, medium, small])
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(
+            [result.message for result in results],
+            ["处理 101 行，去除 0 个引号", "处理 11 行，去除 0 个引号", "处理 2 行，去除 0 个引号"],
+        )
+        self.assertTrue(all(result.error == "" for result in results))
+
+    def test_process_pool_converts_every_file(self):
+        files = [self._write_csv(f"f{idx}.csv", idx + 1) for idx in range(4)]
+        output_dir = os.path.join(self.base, "out")
+        os.makedirs(output_dir)
+
+        runner = BatchConversionRunner(max_workers=2)
+        results = list(runner.run("csv_to_xlsx", files, output_dir))
+
+        self.assertEqual(sorted(result.file_path for result in results), sorted(files))
+        self.assertTrue(all(result.success for result in results), [result.error for result in results])
+        self.assertEqual(sorted(os.listdir(output_dir)), [f"f{idx}.xlsx" for idx in range(4)])
+
+    def test_cancel_stops_dispatching(self):
+        files = [self._write_csv(f"f{idx}.csv", idx + 1) for idx in range(3)]
+
+        runner = BatchConversionRunner(max_workers=1)
+        results = []
+        for result in runner.run("csv_quote", files):
+            results.append(result)
+            runner.cancel()
+
+        self.assertEqual(len(results), 1)
+        self.assertTrue(runner.cancelled)
+
+    def test_incremental_run_skips_unchanged_in_place_files(self):
+        first = self._write_csv("a.csv", 2)
+        second = self._write_csv("b.csv", 3)
+        runner = BatchConversionRunner(max_workers=1)
+
+        initial = list(runner.run("csv_quote", [first, second], incremental=True))
+        self.assertFalse(any(result.skipped for result in initial))
+        self.assertTrue(os.path.isfile(os.path.join(self.base, "_conversion_manifest.json")))
+
+        rerun = list(runner.run("csv_quote", [first, second], incremental=True))
+        self.assertTrue(all(result.skipped for result in rerun))
+
+        with open(second, "a", encoding="utf-8", newline="") as handle:
+            handle.write('"z","w"\r\n')
+        changed = {result.file_path: result.skipped for result in runner.run("csv_quote", [first, second], incremental=True)}
+        self.assertEqual(changed, {first: True, second: False})
+
+    def test_incremental_run_checks_outputs_settings_and_content_hash(self):
+        source = self._write_csv("lab.csv", 5)
+        output_dir = os.path.join(self.base, "out")
+        os.makedirs(output_dir)
+        runner = BatchConversionRunner(max_workers=1)
+
+        list(runner.run("csv_to_xlsx", [source], output_dir, incremental=True))
+        output_file = os.path.join(output_dir, "lab.xlsx")
+        self.assertTrue(os.path.isfile(output_file))
+        self.assertTrue(os.path.isfile(os.path.join(output_dir, "_conversion_manifest.json")))
+
+        # 仅修改时间变化、内容不变：比较哈希后仍跳过
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+        self.assertTrue(next(runner.run("csv_to_xlsx", [source], output_dir, incremental=True)).skipped)
+
+        # 输出文件被删除：重新转换
+        os.remove(output_file)
+        self.assertFalse(next(runner.run("csv_to_xlsx", [source], output_dir, incremental=True)).skipped)
+        self.assertTrue(os.path.isfile(output_file))
+
+        # 设置变化（不同输出目录）：重新转换
+        other_dir = os.path.join(self.base, "other")
+        os.makedirs(other_dir)
+        self.assertFalse(next(runner.run("csv_to_xlsx", [source], other_dir, incremental=True)).skipped)
+
+    def test_unknown_mode_is_rejected(self):
+        runner = BatchConversionRunner(max_workers=1)
+        with self.assertRaises(ValueError):
+            list(runner.run("pdf", []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from src.utils.column_profiler import ColumnProfiler, HyperLogLog, ReservoirSampler, profile_rows
+
+
+class ColumnProfilerTests(unittest.TestCase):
+    def test_hyperloglog_estimate_is_close(self):
+        for cardinality in (0, 10, 1000, 50000):
+            sketch = HyperLogLog()
+            for index in range(cardinality):
+                sketch.add(f"SUBJ{index:06d}")
+                sketch.add(f"SUBJ{index:06d}")
+            self.assertLessEqual(abs(sketch.estimate() - cardinality), max(2, cardinality * 0.05), cardinality)
+
+    def test_reservoir_keeps_bounded_deterministic_samples(self):
+        first, second = ReservoirSampler(3), ReservoirSampler(3)
+        for index in range(10000):
+            first.add(str(index))
+            second.add(str(index))
+        self.assertEqual(len(first.samples), 3)
+        self.assertEqual(first.samples, second.samples)
+
+    def test_profiles_types_ratios_and_trailing_blank_rows(self):
+        rows = [
+            ["SUBJ001", "2024-01-02", "5.5", "Headache and nausea", "Y"],
+            ["SUBJ002", "2024/02", "-3", "", "N"],
+            ["SUBJ002", "", "1e3", "Rash", " "],
+            ["", "", "", "", ""],
+            ["SUBJ003", "02/03/2024", "7", "x", "Y", "ignored"],
+            ["", "", "", "", ""],
+        ]
+        profiles = profile_rows(["USUBJID", "AESTDTC", "AESEV", "AETERM", "FLAG"], rows)
+        by_field = {item["field"]: item for item in profiles}
+
+        self.assertEqual(by_field["USUBJID"]["rows"], 5)
+        self.assertEqual(by_field["USUBJID"]["inferred_type"], "code")
+        self.assertEqual(by_field["USUBJID"]["approx_distinct"], 3)
+        self.assertEqual(by_field["AESTDTC"]["inferred_type"], "date")
+        self.assertEqual(by_field["AESEV"]["inferred_type"], "numeric")
+        self.assertEqual(by_field["AETERM"]["inferred_type"], "text")
+        self.assertEqual(by_field["AETERM"]["max_length"], len("Headache and nausea"))
+        self.assertEqual(by_field["FLAG"]["non_empty"], 3)
+        self.assertEqual(by_field["FLAG"]["non_empty_ratio"], 0.6)
+        self.assertEqual(by_field["FLAG"]["samples"], ["Y", "N", "Y"])
+
+    def test_empty_column(self):
+        profiler = ColumnProfiler(["A", "B"])
+        profiler.add_row(["x", ""])
+        self.assertEqual(profiler.results()[1]["inferred_type"], "empty")
+        self.assertEqual(profiler.results()[1]["non_empty_ratio"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
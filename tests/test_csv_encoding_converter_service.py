@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+
+from src.utils.csv_encoding_converter_service import CsvEncodingConverterService
+
+
+class CsvEncodingStreamingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = self.temp_dir.name
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _write_bytes(self, filename: str, payload: bytes) -> str:
+        path = os.path.join(self.base, filename)
+        with open(path, "wb") as handle:
+            handle.write(payload)
+        return path
+
+    def test_streaming_transcodes_gbk_in_place(self):
+        text = "编号,姓名\r\n" + "".join(f"{idx},患者{idx}\r\n" for idx in range(500))
+        input_file = self._write_bytes("gbk.csv", text.encode("gbk"))
+
+        service = CsvEncodingConverterService(streaming=True, chunk_size=97, sample_size=128)
+        success, error = service.convert_file(input_file)
+        self.assertTrue(success, error)
+
+        with open(input_file, "rb") as handle:
+            self.assertEqual(handle.read(), text.encode("utf-8-sig"))
+        self.assertEqual(os.listdir(self.base), ["gbk.csv"])
+
+    def test_streaming_restarts_with_next_encoding_when_later_chunk_fails(self):
+        # 样本部分是纯 ASCII（UTF-8 可解码），后面才出现 GBK 字节
+        text = "ID,NAME\r\n" + "1,ABC\r\n" * 200 + "2,中文\r\n"
+        input_file = self._write_bytes("late.csv", text.encode("gbk"))
+        output_dir = os.path.join(self.base, "out")
+
+        service = CsvEncodingConverterService(streaming=True, chunk_size=64, sample_size=64)
+        success, error = service.convert_file(input_file, output_dir)
+        self.assertTrue(success, error)
+
+        with open(os.path.join(output_dir, "late.csv"), "rb") as handle:
+            self.assertEqual(handle.read(), text.encode("utf-8-sig"))
+
+    def test_streaming_keeps_original_when_no_encoding_matches(self):
+        payload = b"\xff\xfe\x00bad"
+        input_file = self._write_bytes("bad.csv", payload)
+
+        service = CsvEncodingConverterService(fallback_encodings=["utf-8"], streaming=True)
+        success, _ = service.convert_file(input_file)
+        self.assertFalse(success)
+
+        with open(input_file, "rb") as handle:
+            self.assertEqual(handle.read(), payload)
+        self.assertEqual(os.listdir(self.base), ["bad.csv"])
+
+    def test_detector_fallback_does_not_override_configured_encodings(self):
+        payload = b"\x80\x81\xffbad"
+        input_file = self._write_bytes("bad.csv", payload)
+
+        for streaming in (False, True):
+            with self.subTest(streaming=streaming):
+                service = CsvEncodingConverterService(fallback_encodings=["utf-8"], streaming=streaming)
+                success, _ = service.convert_file(input_file)
+                self.assertFalse(success)
+                with open(input_file, "rb") as handle:
+                    self.assertEqual(handle.read(), payload)
+
+    def test_detected_encoding_outside_candidates_is_ignored(self):
+        input_file = self._write_bytes("gbk.csv", "编号,姓名\n".encode("gbk"))
+        service = CsvEncodingConverterService(fallback_encodings=["utf-8", "latin1"])
+        self.assertEqual(service._ordered_encodings(input_file), ["utf-8", "latin1"])
+
+        service = CsvEncodingConverterService(fallback_encodings=["utf-8", "cp936"])
+        self.assertEqual(service._ordered_encodings(input_file), ["cp936", "utf-8"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+
+from src.utils.csv_quote_remover_service import CsvQuoteRemoverService
+
+
+class CsvQuoteRemoverStreamingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = self.temp_dir.name
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _write_text(self, filename: str, content: str) -> str:
+        path = os.path.join(self.base, filename)
+        with open(path, "w", encoding="utf-8-sig", newline="") as handle:
+            handle.write(content)
+        return path
+
+    def test_clean_file_overwrites_in_place_and_reports_stats(self):
+        content = 'ID;NAME;NOTE\r\n1;"""Alice""";say ""hi""\r\n2;Bob;plain\r\n'
+        input_file = self._write_text("data.csv", content)
+
+        result = CsvQuoteRemoverService.clean_file(input_file)
+
+        self.assertEqual(result["output_file"], input_file)
+        self.assertEqual(result["rows"], 3)
+        # """Alice""" 解析为 "Alice"（去掉两个引号）；say ""hi"" 未被 csv 视为引用字段，
+        # 内部两处 "" 各还原为一个引号
+        self.assertEqual(result["quotes_removed"], 4)
+        with open(input_file, encoding="utf-8-sig", newline="") as handle:
+            self.assertEqual(handle.read(), 'ID;NAME;NOTE\r\n1;Alice;"say ""hi"""\r\n2;Bob;plain\r\n')
+        self.assertEqual(os.listdir(self.base), ["data.csv"])
+
+    def test_process_file_writes_to_output_folder_and_reports_stats(self):
+        input_file = self._write_text("data.csv", 'A,B\r\n"x","""y"""\r\n')
+        output_dir = os.path.join(self.base, "out")
+        os.makedirs(output_dir)
+
+        success, message = CsvQuoteRemoverService.process_file(input_file, output_dir)
+
+        self.assertTrue(success, message)
+        self.assertEqual(message, "处理 2 行，去除 2 个引号")
+        with open(os.path.join(output_dir, "data.csv"), encoding="utf-8-sig", newline="") as handle:
+            self.assertEqual(handle.read(), "A,B\r\nx,y\r\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
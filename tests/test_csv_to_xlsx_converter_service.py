@@ -0,0 +1,105 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from openpyxl import load_workbook
+
+from src.utils.csv_to_xlsx_converter_service import CsvToXlsxConverterService
+
+
+class CsvToXlsxStreamingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = self.temp_dir.name
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _write_csv(self, filename: str, rows: list[list[str]]) -> str:
+        path = os.path.join(self.base, filename)
+        with open(path, "w", encoding="utf-8-sig", newline="") as handle:
+            csv.writer(handle).writerows(rows)
+        return path
+
+    def test_streaming_writes_text_cells_with_shared_format(self):
+        input_file = self._write_csv(
+            "LB.csv",
+            [
+                ["USUBJID", "LBORRES", "LBDTC"],
+                ["SUBJ001", "0012", "2024-01-02"],
+                ["SUBJ002", "", "2024-01-03"],
+            ],
+        )
+
+        success, error = CsvToXlsxConverterService.convert_file_streaming(input_file)
+        self.assertTrue(success, error)
+
+        workbook = load_workbook(os.path.join(self.base, "LB.xlsx"))
+        worksheet = workbook["Sheet1"]
+        values = [[cell.value for cell in row] for row in worksheet.iter_rows()]
+        self.assertEqual(values[0], ["USUBJID", "LBORRES", "LBDTC"])
+        self.assertEqual(values[1], ["SUBJ001", "0012", "2024-01-02"])
+        self.assertEqual(values[2], ["SUBJ002", None, "2024-01-03"])
+        for row in worksheet.iter_rows():
+            for cell in row:
+                self.assertEqual(cell.number_format, "@")
+
+    def test_streaming_matches_pandas_values(self):
+        rows = [["A", "B"]] + [[str(idx), f"v{idx}"] for idx in range(50)]
+        input_file = self._write_csv("DATA.csv", rows)
+        pandas_dir = os.path.join(self.base, "pandas")
+        streaming_dir = os.path.join(self.base, "streaming")
+        os.makedirs(pandas_dir)
+        os.makedirs(streaming_dir)
+
+        self.assertTrue(CsvToXlsxConverterService.convert_file(input_file, pandas_dir)[0])
+        self.assertTrue(CsvToXlsxConverterService.convert_file_streaming(input_file, streaming_dir)[0])
+
+        def read_values(folder: str) -> list[list[object]]:
+            worksheet = load_workbook(os.path.join(folder, "DATA.xlsx"))["Sheet1"]
+            return [[cell.value for cell in row] for row in worksheet.iter_rows()]
+
+        self.assertEqual(read_values(pandas_dir), read_values(streaming_dir))
+
+    def test_streaming_rolls_over_to_new_sheets_with_header(self):
+        rows = [["ID", "VAL"]] + [[str(idx), f"v{idx}"] for idx in range(5)]
+        input_file = self._write_csv("VS.csv", rows)
+
+        success, error = CsvToXlsxConverterService.convert_file_streaming(input_file, max_rows_per_sheet=3)
+        self.assertTrue(success, error)
+
+        workbook = load_workbook(os.path.join(self.base, "VS.xlsx"))
+        self.assertEqual(workbook.sheetnames, ["Sheet1", "Sheet2", "Sheet3"])
+        sheets = [[[cell.value for cell in row] for row in workbook[name].iter_rows()] for name in workbook.sheetnames]
+        self.assertEqual(sheets[0], [["ID", "VAL"], ["0", "v0"], ["1", "v1"]])
+        self.assertEqual(sheets[1], [["ID", "VAL"], ["2", "v2"], ["3", "v3"]])
+        self.assertEqual(sheets[2], [["ID", "VAL"], ["4", "v4"]])
+
+    def test_streaming_can_split_into_workbooks_by_size_budget(self):
+        rows = [["ID", "VAL"]] + [[str(idx), "x" * 10] for idx in range(4)]
+        input_file = self._write_csv("LB.csv", rows)
+
+        success, error = CsvToXlsxConverterService.convert_file_streaming(
+            input_file,
+            max_bytes_per_sheet=30,
+            split_workbooks=True,
+        )
+        self.assertTrue(success, error)
+
+        parts = sorted(name for name in os.listdir(self.base) if name.endswith(".xlsx"))
+        self.assertEqual(parts, ["LB_part001.xlsx", "LB_part002.xlsx", "LB_part003.xlsx", "LB_part004.xlsx"])
+        for name in parts:
+            worksheet = load_workbook(os.path.join(self.base, name))["Sheet1"]
+            values = [[cell.value for cell in row] for row in worksheet.iter_rows()]
+            self.assertEqual(values[0], ["ID", "VAL"])
+            self.assertEqual(len(values), 2)
+
+    def test_streaming_reports_missing_input(self):
+        success, error = CsvToXlsxConverterService.convert_file_streaming(os.path.join(self.base, "missing.csv"))
+        self.assertFalse(success)
+        self.assertTrue(error)
+
+
+if __name__ == "__main__":
+    unittest.main()
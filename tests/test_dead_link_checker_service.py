@@ -0,0 +1,512 @@
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import urlparse
+
+import requests
+
+from src.utils.dead_link_checker_service import (
+    DeadLinkCheckerService,
+    HostTracker,
+    LinkResultCache,
+    LocalSiteIndex,
+    _probe_host,
+)
+from src.utils.link_check_cache import LinkCheckCache
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Local stand-in for remote sites; behaviour is chosen by path."""
+
+    def log_message(self, *args):  # noqa: D401 - silence request logging
+        pass
+
+    def _track(self):
+        server = self.server
+        host = self.headers.get("Host", "")
+        with server.lock:
+            server.in_flight[host] = server.in_flight.get(host, 0) + 1
+            server.total_in_flight += 1
+            server.max_per_host[host] = max(server.max_per_host.get(host, 0), server.in_flight[host])
+            server.max_total = max(server.max_total, server.total_in_flight)
+            server.requests.append((self.command, self.path))
+
+    def _untrack(self):
+        server = self.server
+        host = self.headers.get("Host", "")
+        with server.lock:
+            server.in_flight[host] -= 1
+            server.total_in_flight -= 1
+
+    def _respond(self):
+        self._track()
+        try:
+            path = self.path.split("?", 1)[0]
+            extra_headers = {}
+            if path == "/etag":
+                if self.headers.get("If-None-Match") == '"v1"':
+                    status = 304
+                else:
+                    status = 200
+                    extra_headers["ETag"] = '"v1"'
+            elif path.startswith("/slow"):
+                time.sleep(0.15)
+                status = 200
+            elif path == "/missing":
+                status = 404
+            elif path == "/no-head":
+                status = 405 if self.command == "HEAD" else 200
+            elif path == "/head-timeout":
+                if self.command == "HEAD":
+                    time.sleep(0.6)
+                status = 200
+            else:
+                status = 200
+            self.send_response(status)
+            for name, value in extra_headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        finally:
+            self._untrack()
+
+    do_HEAD = _respond
+    do_GET = _respond
+
+
+class DeadLinkCheckerServiceTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+        cls.server.daemon_threads = True
+        cls.server.lock = threading.Lock()
+        cls.port = cls.server.server_address[1]
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.server.in_flight = {}
+        self.server.total_in_flight = 0
+        self.server.max_per_host = {}
+        self.server.max_total = 0
+        self.server.requests = []
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _url(self, path: str, host: str = "127.0.0.1") -> str:
+        return f"http://{host}:{self.port}{path}"
+
+    def test_concurrent_engine_matches_sequential_results(self):
+        urls = [
+            self._url("/ok"),
+            self._url("/missing"),
+            self._url("/no-head"),
+            self._url("/head-timeout"),
+            "mailto:someone@example.com",
+            "#top",
+        ]
+        sequential = DeadLinkCheckerService(timeout=0.3).check_links(urls)
+        concurrent = DeadLinkCheckerService(timeout=0.3, max_concurrency=8).check_links(urls)
+
+        self.assertEqual(concurrent, sequential)
+        statuses = [(item["status"], item["status_code"], item["error"]) for item in concurrent]
+        self.assertEqual(statuses[0], ("alive", 200, None))
+        self.assertEqual(statuses[1], ("dead", 404, None))
+        self.assertEqual(statuses[2], ("alive", 200, "HEAD blocked, verified with GET"))
+        self.assertEqual(statuses[3], ("alive", 200, "HEAD timeout, verified with GET"))
+        self.assertEqual(statuses[4][0], "skipped")
+
+    def test_global_and_per_host_caps_are_respected(self):
+        urls = [self._url(f"/slow{index}") for index in range(8)]
+        urls += [self._url(f"/slow{index}", host="localhost") for index in range(8)]
+        progress = []
+        checker = DeadLinkCheckerService(timeout=5, max_concurrency=3, max_per_host=2)
+
+        started = time.perf_counter()
+        results = checker.check_links(urls, progress_callback=lambda done, total, url: progress.append(done))
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual([item["url"] for item in results], urls)
+        self.assertTrue(all(item["status"] == "alive" for item in results))
+        self.assertLessEqual(self.server.max_total, 3)
+        self.assertGreater(self.server.max_total, 1)
+        self.assertLessEqual(max(self.server.max_per_host.values()), 2)
+        self.assertEqual(progress, list(range(1, 17)))
+        self.assertLess(elapsed, 16 * 0.15)
+
+    def test_check_html_file_report_shape_is_unchanged(self):
+        page = os.path.join(self.temp_dir.name, "index.html")
+        with open(page, "w", encoding="utf-8") as handle:
+            handle.write(
+                f'<a href="{self._url("/ok")}">a</a><a href="{self._url("/ok")}">dup</a>'
+                f'<img src="{self._url("/missing")}"><a href="mailto:x@example.com">m</a>'
+            )
+        checker = DeadLinkCheckerService(timeout=2, max_concurrency=4)
+        result = checker.check_html_file(page)
+
+        self.assertEqual(result["total_links"], 4)
+        self.assertEqual(result["unique_links"], 3)
+        self.assertEqual(result["summary"], {"alive": 1, "dead": 1, "timeout": 0, "error": 0, "skipped": 1})
+        report = os.path.join(self.temp_dir.name, "report.txt")
+        checker.generate_report(result, report)
+        self.assertTrue(os.path.getsize(report) > 0)
+
+    def _write_pages(self, count: int) -> None:
+        shared = (
+            f'<link href="{self._url("/slow-style.css")}"><a href="{self._url("/ok")}">home</a>'
+            f'<a href="{self._url("/missing")}">gone</a><a href="mailto:x@example.com">m</a>'
+        )
+        for index in range(count):
+            with open(os.path.join(self.temp_dir.name, f"page{index}.html"), "w", encoding="utf-8") as handle:
+                handle.write(shared + f'<a href="{self._url(f"/ok?page={index}")}">own</a>')
+
+    def test_folder_run_requests_each_url_once(self):
+        self._write_pages(5)
+        for concurrency in (1, 8):
+            with self.subTest(max_concurrency=concurrency):
+                self.server.requests = []
+                checker = DeadLinkCheckerService(timeout=2, max_concurrency=concurrency)
+                result = checker.check_folder(self.temp_dir.name)
+
+                self.assertEqual(result["total_files"], 5)
+                for file_result in result["files"]:
+                    self.assertEqual(file_result["unique_links"], 5)
+                    self.assertEqual(len(file_result["checks"]), 5)
+                    self.assertEqual(
+                        file_result["summary"], {"alive": 3, "dead": 1, "timeout": 0, "error": 0, "skipped": 1}
+                    )
+                self.assertEqual(result["checks_requested"], 25)
+                self.assertEqual(result["network_requests"], 3 + 5)
+                self.assertEqual(len({path for _method, path in self.server.requests}), 8)
+                self.assertEqual(
+                    sum(1 for _method, path in self.server.requests if path == "/slow-style.css"), 1
+                )
+
+    def test_in_flight_checks_are_shared(self):
+        cache = LinkResultCache()
+        calls = []
+        release = threading.Event()
+
+        def check(url):
+            calls.append(url)
+            release.wait(2)
+            return {"url": url, "status": "alive", "status_code": 200, "error": None}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get("http://a/", check))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(calls, ["http://a/"])
+        self.assertEqual(len(results), 4)
+        self.assertEqual(len({id(item) for item in results}), 4)
+        self.assertEqual((cache.checks_requested, cache.network_requests), (4, 1))
+
+    def test_persistent_cache_reuses_and_revalidates_results(self):
+        self._write_pages(2)
+        with open(os.path.join(self.temp_dir.name, "page0.html"), "a", encoding="utf-8") as handle:
+            handle.write(f'<img src="{self._url("/etag")}">')
+        cache_path = os.path.join(self.temp_dir.name, "cache", "links.sqlite3")
+        checker = DeadLinkCheckerService(timeout=2, max_concurrency=4, cache_path=cache_path)
+
+        def run(**kwargs):
+            self.server.requests = []
+            return checker.check_folder(self.temp_dir.name, use_cache=True, **kwargs)
+
+        first = run()
+        self.assertEqual((first["cache_hits"], first["network_requests"]), (0, 6))
+
+        second = run()
+        self.assertEqual((second["cache_hits"], second["network_requests"]), (6, 0))
+        self.assertEqual(self.server.requests, [])
+        self.assertEqual(
+            [file_result["summary"] for file_result in second["files"]],
+            [file_result["summary"] for file_result in first["files"]],
+        )
+
+        # Expire everything: the ETag link is revalidated with a conditional
+        # HEAD, the other links are checked again.
+        checker.cache_ttl = {"alive": 0, "dead": 0}
+        third = run()
+        self.assertEqual((third["cache_hits"], third["network_requests"]), (0, 6))
+        self.assertEqual([method for method, path in self.server.requests if path == "/etag"], ["HEAD"])
+        self.assertEqual(third["files"][0]["summary"], first["files"][0]["summary"])
+
+        checker.cache_ttl = None
+        fresh = run(fresh=True)
+        self.assertEqual((fresh["cache_hits"], fresh["network_requests"]), (0, 6))
+        self.assertIn(("HEAD", "/ok"), self.server.requests)
+
+    def _closed_port(self) -> int:
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
+
+    def test_unreachable_host_is_probed_once_and_short_circuited(self):
+        port = self._closed_port()
+        dead_urls = [f"http://127.0.0.1:{port}/asset{index}.js" for index in range(20)]
+        urls = [self._url("/ok")] + dead_urls
+        for concurrency in (1, 8):
+            with self.subTest(max_concurrency=concurrency):
+                self.server.requests = []
+                checker = DeadLinkCheckerService(timeout=2, max_concurrency=concurrency)
+                original_head = checker.session.head
+                requested = []
+                checker.session.head = lambda url, **kwargs: requested.append(url) or original_head(url, **kwargs)
+
+                with mock.patch("src.utils.dead_link_checker_service._probe_host", wraps=_probe_host) as probe:
+                    results = checker.check_links(urls)
+
+                self.assertEqual(results[0]["status"], "alive")
+                self.assertEqual(requested, [self._url("/ok")])
+                self.assertEqual(probe.call_count, 2)
+                for result in results[1:]:
+                    self.assertEqual(result["status"], "dead")
+                    self.assertIsNone(result["status_code"])
+                    self.assertTrue(result["error"].startswith(f"Host unreachable: connection to 127.0.0.1:{port} failed"))
+
+    def test_dns_failure_is_recorded_in_folder_results_and_report(self):
+        with open(os.path.join(self.temp_dir.name, "page.html"), "w", encoding="utf-8") as handle:
+            handle.write(
+                "".join(f'<img src="https://cdn.retired.example/img{index}.png">' for index in range(5))
+                + f'<a href="{self._url("/ok")}">ok</a>'
+            )
+        real_getaddrinfo = socket.getaddrinfo
+
+        def fake_getaddrinfo(host, *args, **kwargs):
+            if host == "cdn.retired.example":
+                raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+            return real_getaddrinfo(host, *args, **kwargs)
+
+        checker = DeadLinkCheckerService(timeout=2, max_concurrency=4)
+        with mock.patch("src.utils.dead_link_checker_service.socket.getaddrinfo", side_effect=fake_getaddrinfo):
+            result = checker.check_folder(self.temp_dir.name)
+
+        self.assertEqual(result["files"][0]["summary"]["dead"], 5)
+        self.assertEqual(result["files"][0]["summary"]["alive"], 1)
+        self.assertEqual(result["network_requests"], 1)
+        self.assertEqual(
+            result["unreachable_hosts"],
+            {"cdn.retired.example:443": "Host unreachable: DNS lookup failed for cdn.retired.example"},
+        )
+        report = os.path.join(self.temp_dir.name, "report.txt")
+        checker.generate_report(result, report)
+        with open(report, encoding="utf-8") as handle:
+            content = handle.read()
+        self.assertIn("不可达主机", content)
+        self.assertIn("DNS lookup failed for cdn.retired.example", content)
+
+    def test_host_short_circuit_results_are_not_persisted(self):
+        port = self._closed_port()
+        dead_url = f"http://127.0.0.1:{port}/asset.js"
+        with open(os.path.join(self.temp_dir.name, "page.html"), "w", encoding="utf-8") as handle:
+            handle.write(f'<script src="{dead_url}"></script><a href="{self._url("/ok")}">ok</a>')
+        cache_path = os.path.join(self.temp_dir.name, "cache", "links.sqlite3")
+        checker = DeadLinkCheckerService(timeout=2, max_concurrency=4, cache_path=cache_path)
+
+        result = checker.check_folder(self.temp_dir.name, use_cache=True)
+
+        self.assertEqual(result["files"][0]["summary"]["dead"], 1)
+        with LinkCheckCache(cache_path) as store:
+            self.assertIsNone(store.lookup(dead_url))
+            self.assertTrue(store.lookup(self._url("/ok")).fresh)
+
+    def test_proxy_lookup_runs_once_per_host_off_the_event_loop(self):
+        urls = [self._url(f"/page{index}") for index in range(10)]
+        urls += [self._url(f"/page{index}", host="localhost") for index in range(10)]
+        calls = []
+        real_lookup = requests.utils.get_environ_proxies
+
+        def lookup(url, *args, **kwargs):
+            calls.append((urlparse(url).netloc, threading.current_thread() is threading.main_thread()))
+            return real_lookup(url, *args, **kwargs)
+
+        checker = DeadLinkCheckerService(timeout=2, max_concurrency=4)
+        with mock.patch("requests.utils.get_environ_proxies", side_effect=lookup):
+            results = checker.check_links(urls)
+
+        self.assertTrue(all(result["status"] == "alive" for result in results))
+        self.assertEqual(
+            sorted(calls),
+            [(f"127.0.0.1:{self.port}", False), (f"localhost:{self.port}", False)],
+        )
+
+    def test_temporary_dns_errors_do_not_short_circuit(self):
+        hosts = HostTracker()
+        with mock.patch(
+            "src.utils.dead_link_checker_service.socket.getaddrinfo",
+            side_effect=socket.gaierror(socket.EAI_AGAIN, "Temporary failure"),
+        ):
+            self.assertIsNone(hosts.probe("example.com", 443, 1).result())
+        self.assertEqual(hosts.failures(), {})
+
+    def test_invalid_limits_are_rejected(self):
+        with self.assertRaises(ValueError):
+            DeadLinkCheckerService(max_concurrency=0)
+
+
+
+class LinkExtractionTests(unittest.TestCase):
+    PAGE = (
+        '<html><head><base href="https://example.com/docs/">'
+        '<link rel="stylesheet" href="site.css"><script src="app.js"></script>'
+        '<script>var fake = \'<a href="not-a-link.html">\';</script></head>'
+        '<body id="top-of-page"><a href="guide.html?a=1&amp;b=2">guide</a><a name="legacy"></a>'
+        '<img src="logo.png" srcset="logo-1x.png 1x, logo-2x.png 2x">'
+        '<picture><source srcset="hero-480.webp 480w,hero-960.webp 960w" type="image/webp"></picture>'
+        '<iframe src="https://video.example.org/embed/1"></iframe>'
+        '<video src="clip.mp4" poster="poster.jpg"><source src="clip.webm"></video>'
+        '<a href=" mailto:x@example.com ">mail</a><a>no href</a></body></html>'
+    )
+
+    def test_fast_engine_collects_all_url_attributes_in_document_order(self):
+        links = DeadLinkCheckerService().extract_links_from_html(self.PAGE)
+
+        self.assertEqual(
+            links,
+            [
+                "https://example.com/docs/site.css",
+                "https://example.com/docs/app.js",
+                "https://example.com/docs/guide.html?a=1&b=2",
+                "https://example.com/docs/logo.png",
+                "https://example.com/docs/logo-1x.png",
+                "https://example.com/docs/logo-2x.png",
+                "https://example.com/docs/hero-480.webp",
+                "https://example.com/docs/hero-960.webp",
+                "https://video.example.org/embed/1",
+                "https://example.com/docs/clip.mp4",
+                "https://example.com/docs/poster.jpg",
+                "https://example.com/docs/clip.webm",
+                "mailto:x@example.com",
+            ],
+        )
+
+    def test_srcset_urls_may_contain_commas_and_data_candidates_are_skipped(self):
+        html = (
+            '<img srcset="https://res.cloudinary.com/demo/image/upload/w_300,h_200,c_fill/cat.jpg 300w, '
+            'https://res.cloudinary.com/demo/image/upload/w_600,h_400,c_fill/cat.jpg 600w">'
+            '<img srcset="data:image/png;base64,iVBORw0KGgo= 1x, dot@2x.png 2x,dot@3x.png">'
+        )
+        self.assertEqual(
+            DeadLinkCheckerService().extract_links_from_html(html),
+            [
+                "https://res.cloudinary.com/demo/image/upload/w_300,h_200,c_fill/cat.jpg",
+                "https://res.cloudinary.com/demo/image/upload/w_600,h_400,c_fill/cat.jpg",
+                "dot@2x.png",
+                "dot@3x.png",
+            ],
+        )
+
+    def test_base_href_is_resolved_against_base_url(self):
+        checker = DeadLinkCheckerService()
+        html = '<base href="sub/"><a href="page.html">p</a><a href="/root.html">r</a>'
+        self.assertEqual(
+            checker.extract_links_from_html(html, "https://example.com/a/index.html"),
+            ["https://example.com/a/sub/page.html", "https://example.com/root.html"],
+        )
+        self.assertEqual(checker.extract_links_from_html(html), ["sub/page.html", "/root.html"])
+        self.assertEqual(checker.extract_links_from_html('<a href="x.html">x</a>'), ["x.html"])
+
+    def test_fast_engine_collects_fragment_targets(self):
+        _links, anchors = DeadLinkCheckerService()._parse_html(self.PAGE)
+        self.assertEqual(anchors, {"top-of-page", "legacy"})
+
+    def test_soup_engine_keeps_previous_behaviour(self):
+        links = DeadLinkCheckerService(engine="soup").extract_links_from_html(self.PAGE)
+        self.assertEqual(
+            links,
+            ["guide.html?a=1&b=2", " mailto:x@example.com ", "site.css", "logo.png", "app.js"],
+        )
+        with self.assertRaises(ValueError):
+            DeadLinkCheckerService(engine="regex")
+
+
+class LocalSiteModeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+        self._write("index.html", (
+            '<h1 id="intro">Intro</h1>'
+            '<a href="#intro">ok</a><a href="#missing">bad anchor</a><a href="#">top</a>'
+            '<a href="docs/guide.html#install">ok</a><a href="docs/guide.html#nope">bad anchor</a>'
+            '<a href="docs/">dir index</a><a href="docs/%E6%8C%87%E5%8D%97.html">encoded</a>'
+            '<img src="img/logo.png"><a href="missing.html">gone</a>'
+            '<a href="/docs/guide.html?v=2#legacy">root relative</a>'
+            '<a href="mailto:x@example.com">mail</a>'
+        ))
+        self._write("docs/index.html", '<a href="../index.html#intro">back</a><a href="../img/none.png">x</a>')
+        self._write("docs/guide.html", '<h2 id="install">Install</h2><a name="legacy"></a>')
+        self._write("docs/指南.html", "")
+        self._write("img/logo.png", "")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _write(self, name: str, content: str) -> None:
+        path = os.path.join(self.root, *name.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(content)
+
+    def test_relative_links_and_fragments_are_checked_on_disk(self):
+        checker = DeadLinkCheckerService()
+        checker.session.head = checker.session.get = None  # any request would fail loudly
+
+        result = checker.check_html_file(os.path.join(self.root, "index.html"), local_site=True)
+
+        statuses = {check["url"]: (check["status"], check["error"]) for check in result["checks"]}
+        self.assertEqual(statuses["#intro"], ("alive", None))
+        self.assertEqual(statuses["#missing"], ("dead", "Anchor not found: #missing"))
+        self.assertEqual(statuses["#"], ("alive", None))
+        self.assertEqual(statuses["docs/guide.html#install"], ("alive", None))
+        self.assertEqual(statuses["docs/guide.html#nope"][0], "dead")
+        self.assertEqual(statuses["docs/"], ("alive", None))
+        self.assertEqual(statuses["docs/%E6%8C%87%E5%8D%97.html"], ("alive", None))
+        self.assertEqual(statuses["img/logo.png"], ("alive", None))
+        self.assertEqual(statuses["missing.html"], ("dead", "File not found"))
+        self.assertEqual(statuses["/docs/guide.html?v=2#legacy"], ("alive", None))
+        self.assertEqual(statuses["mailto:x@example.com"][0], "skipped")
+        self.assertEqual(result["summary"], {"alive": 7, "dead": 3, "timeout": 0, "error": 0, "skipped": 1})
+
+    def test_folder_run_parses_each_target_page_once(self):
+        checker = DeadLinkCheckerService()
+        parsed = []
+        original = checker._parse_html
+        checker._parse_html = lambda html, base_url="": parsed.append(html) or original(html, base_url)
+
+        result = checker.check_folder(self.root, include_subfolders=True, local_site=True)
+
+        self.assertEqual(result["total_files"], 4)
+        self.assertEqual(len(parsed), 4)
+        self.assertEqual(result["network_requests"], 0)
+        docs_index = next(item for item in result["files"] if item["file"].endswith(os.path.join("docs", "index.html")))
+        self.assertEqual(docs_index["summary"]["alive"], 1)
+        self.assertEqual(docs_index["summary"]["dead"], 1)
+
+    def test_site_index_caches_stat_results(self):
+        index = LocalSiteIndex(self.root)
+        path = os.path.join(self.root, "img", "logo.png")
+        self.assertEqual(index.kind(path), "file")
+        os.remove(path)
+        self.assertEqual(index.kind(path), "file")
+        self.assertIsNone(index.kind(os.path.join(self.root, "nothing")))
+
+
+if __name__ == "__main__":
+    unittest.main()
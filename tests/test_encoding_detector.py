@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.utils.encoding_detector import EncodingDetector
+
+
+class EncodingDetectorTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = self.temp_dir.name
+        self.detector = EncodingDetector()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_detects_bom_encodings(self):
+        self.assertEqual(self.detector.detect_bytes("患者".encode("utf-8-sig")), "utf-8-sig")
+        self.assertEqual(self.detector.detect_bytes("患者".encode("utf-16")), "utf-16")
+
+    def test_truncated_utf8_sample_is_still_utf8(self):
+        payload = "患者姓名".encode("utf-8")
+        self.assertEqual(self.detector.detect_bytes(payload[:-1]), "utf-8")
+
+    def test_distinguishes_gbk_and_shift_jis(self):
+        chinese = "受试者编号,姓名,医院名称\n" * 10
+        japanese = "被験者番号,名前,これはテストです\n" * 10
+        self.assertEqual(self.detector.detect_bytes(chinese.encode("gbk")), "gbk")
+        self.assertEqual(self.detector.detect_bytes(japanese.encode("shift_jis")), "shift_jis")
+
+    def test_falls_back_when_no_candidate_is_plausible(self):
+        self.assertEqual(self.detector.detect_bytes("héllo wörld".encode("latin1")), "latin1")
+
+    def test_cp936_is_treated_as_gbk_alias(self):
+        self.assertEqual(self.detector.candidates, ["gbk", "shift_jis"])
+
+    def test_results_are_cached_until_file_changes(self):
+        path = os.path.join(self.base, "data.csv")
+        with open(path, "wb") as handle:
+            handle.write("编号,姓名\n".encode("gbk"))
+
+        with patch.object(self.detector, "detect_bytes", wraps=self.detector.detect_bytes) as spy:
+            self.assertEqual(self.detector.detect(path), "gbk")
+            self.assertEqual(self.detector.detect(path), "gbk")
+            self.assertEqual(spy.call_count, 1)
+
+            with open(path, "wb") as handle:
+                handle.write("编号,姓名,年龄\n".encode("utf-8-sig"))
+            self.assertEqual(self.detector.detect(path), "utf-8-sig")
+            self.assertEqual(spy.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
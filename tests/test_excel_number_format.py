@@ -0,0 +1,89 @@
+import csv
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+
+from openpyxl import Workbook
+
+from src.utils.excel_number_format import compile_number_format, format_excel_date, format_excel_number
+from src.utils.xlsx_sheet_splitter_service import XlsxSheetSplitterService
+
+
+class ExcelDateFormatTests(unittest.TestCase):
+    def test_date_formats_render_like_sheet_export(self):
+        cases = [
+            (datetime(2024, 1, 2), "yyyy/mm/dd", "2024/01/02"),
+            (datetime(2024, 1, 2, 3, 4, 5), "yyyy/mm/dd", "2024/01/02 03:04"),
+            (datetime(2024, 1, 2), "yyyy-mm-dd hh:mm:ss", "2024-01-02 00:00:00"),
+            (datetime(2024, 3, 4), "d-mmm-yy", "4-03-24"),
+            (datetime(2024, 3, 4), "m/d/yy h:mm", "3/4/24 00:00"),
+            (datetime(2024, 3, 4), '[$-409]yyyy"年"m"月"d"日"', "2024-3-4"),
+            (date(2020, 2, 29), "dd.mm.yyyy", "29.02.2020"),
+            (datetime(2024, 3, 4), "General", "2024-03-04"),
+        ]
+        for value, number_format, expected in cases:
+            self.assertEqual(format_excel_date(value, number_format), expected, number_format)
+
+
+class ExcelNumberFormatTests(unittest.TestCase):
+    def test_numeric_formats_render_like_excel(self):
+        cases = [
+            (1234.5, "0.00", "1234.50"),
+            (2.675, "0.00", "2.68"),
+            (-1234.5, "#,##0.00", "-1,234.50"),
+            (1234567, "#,##0", "1,234,567"),
+            (0.125, "0.0%", "12.5%"),
+            (0.5, "0%", "50%"),
+            (0.5, "#.##", ".5"),
+            (3, "0.0#", "3.0"),
+            (1234567, "#,##0,", "1,235"),
+            (-5, "0.00;(0.00)", "(5.00)"),
+            (0, "0.00;-0.00;\"-\"", "-"),
+            (12.5, '"$"#,##0.00', "$12.50"),
+            (12.5, "#,##0.00 [$€-407]", "12.50 €"),
+            (7, '0"件"', "7件"),
+            (12, "000", "012"),
+        ]
+        for value, number_format, expected in cases:
+            self.assertEqual(format_excel_number(value, number_format), expected, number_format)
+
+    def test_unsupported_formats_fall_back_to_raw_value(self):
+        for number_format in ("General", "0.00E+00", "# ?/?", "@", "yyyy-mm-dd", "[>100]0;0"):
+            self.assertIsNone(compile_number_format(number_format), number_format)
+        self.assertEqual(format_excel_number(1.5, "0.00E+00"), "1.5")
+
+    def test_compiled_renderers_are_cached(self):
+        self.assertIs(compile_number_format("#,##0.00"), compile_number_format("#,##0.00"))
+
+
+class SplitterNumberFormatTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = self.temp_dir.name
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = "LB"
+        worksheet.append(["LBORRES", "RATIO", "COUNT", "RAW"])
+        worksheet.append([1.5, 0.256, 1234567, 0.1])
+        worksheet["A2"].number_format = "0.00"
+        worksheet["B2"].number_format = "0.0%"
+        worksheet["C2"].number_format = "#,##0"
+        self.input_file = os.path.join(self.base, "lab.xlsx")
+        workbook.save(self.input_file)
+
+    def _rows(self, service: XlsxSheetSplitterService, name: str):
+        result = service.split_file(self.input_file, os.path.join(self.base, name))
+        with open(result["output_files"][0], encoding="utf-8-sig", newline="") as handle:
+            return list(csv.reader(handle))
+
+    def test_number_formats_are_opt_in_for_both_engines(self):
+        self.assertEqual(self._rows(XlsxSheetSplitterService(), "raw")[1], ["1.5", "0.256", "1234567", "0.1"])
+        expected = ["1.50", "25.6%", "1,234,567", "0.1"]
+        for engine in ("openpyxl", "fast"):
+            service = XlsxSheetSplitterService(engine=engine, render_number_formats=True)
+            self.assertEqual(self._rows(service, engine)[1], expected, engine)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, time
+
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+
+from src.utils.fast_xlsx_reader import FastXlsxReader, read_sheet_frame, read_sheet_header
+from src.utils.file_field_extractor_service import FileFieldExtractorService
+from src.utils.xlsx_sheet_splitter_service import XlsxSheetSplitterService
+from src.utils.xlsx_to_csv_converter_service import XlsxToCsvConverterService
+
+
+class FastXlsxReaderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = self.temp_dir.name
+        self.input_file = self._build_workbook()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _build_workbook(self) -> str:
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = "AE"
+        worksheet.append(["USUBJID", "AESTDTC", "AESEQ", "", "USUBJID", None, "AEFLAG"])
+        worksheet.append(["SUBJ001", datetime(2024, 1, 2, 3, 4), 1.0, 2.5, True, None, "Y"])
+        worksheet["B2"].number_format = "yyyy/mm/dd hh:mm"
+        worksheet.append([None] * 7)
+        worksheet.append(["SUBJ002", time(12, 30), 3, "", False, 1e20, "中文"])
+        worksheet["B4"].number_format = "hh:mm"
+        worksheet.append(["SUBJ003", datetime(2024, 5, 6), -7, "x,\"y\"", None, 0.1, None])
+        worksheet["B5"].number_format = "d-mmm-yy"
+        worksheet["J9"] = "far"
+        single = workbook.create_sheet("CM")
+        single.append(["CMTRT"])
+        single.append([None])
+        single.append(["ASPIRIN"])
+        workbook.create_sheet("EMPTY")
+        path = os.path.join(self.base, "spec.xlsx")
+        workbook.save(path)
+        return path
+
+    def test_values_match_openpyxl_read_only(self):
+        workbook = load_workbook(self.input_file, read_only=True, data_only=True)
+        try:
+            with FastXlsxReader(self.input_file) as reader:
+                self.assertEqual(reader.sheet_names, workbook.sheetnames)
+                for name in reader.sheet_names:
+                    expected = list(workbook[name].iter_rows(values_only=True))
+                    self.assertEqual(list(reader.iter_values(name)), expected, name)
+                self.assertEqual(reader.dimensions("AE"), (1, 1, 10, 9))
+        finally:
+            workbook.close()
+
+    def test_sheet_frame_matches_pandas_read_excel(self):
+        with FastXlsxReader(self.input_file) as reader:
+            for name in reader.sheet_names:
+                for header in (0, 1):
+                    expected = pd.read_excel(self.input_file, sheet_name=name, header=header, dtype=str, na_filter=False)
+                    actual = read_sheet_frame(reader, name, header=header)
+                    self.assertEqual(list(actual.columns), list(expected.columns), (name, header))
+                    self.assertEqual(actual.values.tolist(), expected.values.tolist(), (name, header))
+
+    def test_fast_engine_outputs_match_openpyxl_engine(self):
+        slow = XlsxSheetSplitterService().split_file(self.input_file, os.path.join(self.base, "slow"))
+        fast = XlsxSheetSplitterService(engine="fast").split_file(self.input_file, os.path.join(self.base, "fast"))
+        self.assertTrue(fast["success"], fast["errors"])
+        for slow_file, fast_file in zip(slow["output_files"], fast["output_files"]):
+            with open(slow_file, "rb") as a, open(fast_file, "rb") as b:
+                self.assertEqual(a.read(), b.read(), os.path.basename(slow_file))
+
+        success, error = XlsxToCsvConverterService.convert_file_streaming(self.input_file, self.base, engine="fast")
+        self.assertTrue(success, error)
+        with open(os.path.join(self.base, "spec.csv"), "rb") as a, open(slow["output_files"][0], "rb") as b:
+            self.assertEqual(a.read(), b.read())
+
+    def test_field_extractor_fast_engine_matches_pandas(self):
+        slow = FileFieldExtractorService(engine="openpyxl")._extract_from_excel(self.input_file, 1)
+        fast = FileFieldExtractorService(engine="fast")._extract_from_excel(self.input_file, 1)
+        self.assertEqual(fast, slow)
+        self.assertIn("AE: USUBJID.1", fast)
+        self.assertIn("AE: Unnamed: 3", fast)
+
+    def test_header_only_read_matches_pandas_and_stops_early(self):
+        sample = os.path.join(os.path.dirname(__file__), "DS.xlsx")
+        excel_file = pd.ExcelFile(sample, engine="openpyxl")
+        with FastXlsxReader(sample) as reader:
+            first = reader.sheet_names[0]
+            for header in (0, 2):
+                self.assertEqual(
+                    read_sheet_header(reader, first, header=header),
+                    list(excel_file.parse(first, nrows=0, dtype=str, header=header).columns),
+                )
+            parsed = len(reader._shared_strings)
+
+        with FastXlsxReader(sample) as reader:
+            for sheet_name in reader.sheet_names:
+                for _row in reader.iter_values(sheet_name):
+                    pass
+            self.assertLess(parsed, len(reader._shared_strings))
+
+        for header_row in (1, 2):
+            self.assertEqual(
+                FileFieldExtractorService(engine="fast")._extract_from_excel(sample, header_row),
+                FileFieldExtractorService(engine="openpyxl")._extract_from_excel(sample, header_row),
+            )
+
+    def test_max_value_column_matches_full_value_scan(self):
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = "WIDE"
+        worksheet.append(["a", None, "c"])
+        worksheet["F3"] = ""
+        worksheet["E4"] = 0
+        worksheet["H2"].number_format = "0.00"
+        path = os.path.join(self.base, "wide.xlsx")
+        workbook.save(path)
+
+        for input_file in (self.input_file, path):
+            with FastXlsxReader(input_file) as reader:
+                for name in reader.sheet_names:
+                    expected = 0
+                    for row in reader.iter_values(name):
+                        for idx, value in enumerate(row, 1):
+                            if value is not None and str(value) != "":
+                                expected = max(expected, idx)
+                    self.assertEqual(reader.max_value_column(name), expected, name)
+
+        with FastXlsxReader(path) as reader:
+            self.assertEqual(reader.dimensions("WIDE")[2], 8)
+            self.assertEqual(reader.max_value_column("WIDE"), 5)
+
+    def test_unknown_engine_is_rejected(self):
+        with self.assertRaises(ValueError):
+            XlsxSheetSplitterService(engine="xlrd")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.utils.file_discovery import DEFAULT_IGNORED_FILES, collect_files, iter_files
+
+
+class FileDiscoveryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = self.temp_dir.name
+        for relative in [
+            "b.csv",
+            "a.CSV",
+            "a-b.xlsx",
+            "notes.txt",
+            "~$a-b.xlsx",
+            "file_fields_summary.csv",
+            "file_fields_profile_1.csv",
+            "a/x.csv",
+            "a/deep/y.xlsx",
+            "ab/z.csv",
+            ".git/objects/p.csv",
+            "node_modules/pkg/q.csv",
+            "output/r.csv",
+        ]:
+            path = os.path.join(self.base, *relative.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write("x")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _relative(self, paths):
+        return [os.path.relpath(path, self.base).replace(os.sep, "/") for path in paths]
+
+    def test_recursive_walk_filters_prunes_and_matches_sorted_order(self):
+        files = collect_files(
+            self.base,
+            extensions=[".csv", ".xlsx"],
+            ignored_files=DEFAULT_IGNORED_FILES + ("file_fields_*.csv",),
+        )
+        self.assertEqual(files, sorted(files))
+        self.assertEqual(
+            self._relative(files),
+            ["a-b.xlsx", "a.CSV", "a/deep/y.xlsx", "a/x.csv", "ab/z.csv", "b.csv", "output/r.csv"],
+        )
+
+    def test_non_recursive_and_unfiltered(self):
+        self.assertEqual(
+            self._relative(collect_files(self.base, recursive=False)),
+            ["a-b.xlsx", "a.CSV", "b.csv", "file_fields_profile_1.csv", "file_fields_summary.csv", "notes.txt"],
+        )
+
+    def test_results_are_yielded_incrementally(self):
+        real_scandir = os.scandir
+        scanned = []
+
+        def tracking_scandir(path):
+            scanned.append(path)
+            return real_scandir(path)
+
+        with patch("src.utils.file_discovery.os.scandir", side_effect=tracking_scandir):
+            first = next(iter_files(self.base, extensions=[".xlsx"]))
+        self.assertEqual(os.path.basename(first), "a-b.xlsx")
+        self.assertEqual(scanned, [self.base])
+
+    def test_missing_root_yields_nothing(self):
+        self.assertEqual(collect_files(os.path.join(self.base, "missing")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,249 @@
+import csv
+import os
+import tempfile
+import threading
+import time
+import unittest
+import unittest.mock
+from datetime import datetime
+
+from openpyxl import Workbook
+
+from src.utils.fast_xlsx_reader import read_sheet_header
+from src.utils.file_field_extractor_service import FileFieldExtractorService
+
+
+class FileFieldExtractorConcurrencyTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = self.temp_dir.name
+        for index in range(6):
+            with open(os.path.join(self.base, f"data{index}.csv"), "w", encoding="utf-8") as handle:
+                handle.write(f"USUBJID,FIELD{index}\nSUBJ001,1\n")
+        with open(os.path.join(self.base, "broken.csv"), "wb") as handle:
+            handle.write(b"")
+        workbook = Workbook()
+        workbook.active.title = "DM"
+        workbook.active.append(["USUBJID", "AGE"])
+        workbook.save(os.path.join(self.base, "spec.xlsx"))
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_concurrent_mode_matches_sequential_order(self):
+        sequential = FileFieldExtractorService().extract_fields(self.base)
+        with open(sequential["output_file"], "rb") as handle:
+            sequential_summary = handle.read()
+        os.remove(sequential["output_file"])
+
+        progress = []
+        concurrent = FileFieldExtractorService().extract_fields(
+            self.base,
+            progress_callback=lambda current, total, name: progress.append((current, total, name)),
+            max_workers=4,
+        )
+
+        self.assertEqual(list(concurrent["details"].items()), list(sequential["details"].items()))
+        self.assertEqual(concurrent["errors"], sequential["errors"])
+        self.assertEqual(len(concurrent["errors"]), 1)
+        self.assertEqual(concurrent["total_fields"], sequential["total_fields"])
+        self.assertEqual(
+            progress,
+            [(index, 8, os.path.basename(path)) for index, path in enumerate(sequential["details"], 1)],
+        )
+        with open(concurrent["output_file"], "rb") as handle:
+            self.assertEqual(handle.read(), sequential_summary)
+
+    def test_rerun_skips_own_summary_and_profile_files(self):
+        first = FileFieldExtractorService().extract_fields(self.base, profile=True)
+        second = FileFieldExtractorService().extract_fields(self.base, profile=True)
+
+        self.assertEqual(list(second["details"]), list(first["details"]))
+        self.assertNotIn(first["output_file"], second["details"])
+        self.assertNotIn(first["profile_file"], second["details"])
+
+    def test_callbacks_stay_in_order_when_later_files_finish_first(self):
+        service = FileFieldExtractorService()
+        original = service._extract_fields_from_file
+        callback_threads = set()
+
+        def delayed(file_path, header_row):
+            if os.path.basename(file_path) == "broken.csv":
+                time.sleep(0.2)
+            return original(file_path, header_row)
+
+        service._extract_fields_from_file = delayed
+        names = []
+        service.extract_fields(
+            self.base,
+            progress_callback=lambda current, total, name: (
+                names.append(name),
+                callback_threads.add(threading.get_ident()),
+            ),
+            max_workers=4,
+        )
+
+        self.assertEqual(names, sorted(names))
+        self.assertEqual(callback_threads, {threading.get_ident()})
+
+
+class FileFieldExtractorIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = os.path.join(self.temp_dir.name, "study")
+        os.makedirs(self.base)
+        self.index_path = os.path.join(self.temp_dir.name, "config", "header_index.sqlite3")
+        for name in ["dm.csv", "ae.csv"]:
+            self._write(name, "USUBJID,DOMAIN\nSUBJ001,X\n")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _write(self, name: str, content: str) -> str:
+        path = os.path.join(self.base, name)
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(content)
+        return path
+
+    def _extract(self, service, **kwargs):
+        result = service.extract_fields(self.base, use_index=True, **kwargs)
+        os.remove(result["output_file"])
+        return result
+
+    def test_unchanged_files_are_served_from_index(self):
+        service = FileFieldExtractorService(index_path=self.index_path)
+        first = self._extract(service)
+        self.assertEqual((first["index_hits"], first["index_misses"]), (0, 2))
+        self.assertTrue(os.path.isfile(self.index_path))
+
+        calls = []
+        original = service._extract_fields_from_file
+        service._extract_fields_from_file = lambda path, row: calls.append(path) or original(path, row)
+
+        second = self._extract(service)
+        self.assertEqual((second["index_hits"], second["index_misses"]), (2, 0))
+        self.assertEqual(second["details"], first["details"])
+        self.assertEqual(calls, [])
+
+        changed = self._write("ae.csv", "USUBJID,AETERM,AESEV\nSUBJ001,X,Y\n")
+        third = self._extract(service, max_workers=4)
+        self.assertEqual((third["index_hits"], third["index_misses"]), (1, 1))
+        self.assertEqual(third["details"][changed], ["USUBJID", "AETERM", "AESEV"])
+        self.assertEqual(calls, [changed])
+
+        other_header = self._extract(service, header_row=2)
+        self.assertEqual(other_header["index_hits"], 0)
+
+        refreshed = self._extract(service, refresh_index=True)
+        self.assertEqual((refreshed["index_hits"], refreshed["index_misses"]), (0, 2))
+
+    def test_partial_sheet_failures_are_not_indexed(self):
+        workbook = Workbook()
+        workbook.active.title = "DM"
+        workbook.active.append(["USUBJID", "AGE"])
+        workbook.create_sheet("AE").append(["USUBJID", "AETERM"])
+        workbook.save(os.path.join(self.base, "spec.xlsx"))
+        spec = os.path.join(self.base, "spec.xlsx")
+        service = FileFieldExtractorService(engine="fast", index_path=self.index_path)
+        real_read_header = read_sheet_header
+
+        def failing_read_header(reader, sheet, header=0):
+            if sheet == "AE":
+                raise ValueError("boom")
+            return real_read_header(reader, sheet, header=header)
+
+        with unittest.mock.patch(
+            "src.utils.file_field_extractor_service.read_sheet_header", side_effect=failing_read_header
+        ):
+            first = self._extract(service)
+        self.assertEqual(first["details"][spec], ["DM: USUBJID", "DM: AGE", "AE: 读取失败 (boom)"])
+
+        second = self._extract(service)
+        self.assertEqual((second["index_hits"], second["index_misses"]), (2, 1))
+        self.assertEqual(second["details"][spec], ["DM: USUBJID", "DM: AGE", "AE: USUBJID", "AE: AETERM"])
+
+    def test_index_is_unused_by_default(self):
+        result = FileFieldExtractorService(index_path=self.index_path).extract_fields(self.base)
+        self.assertEqual((result["index_hits"], result["index_misses"]), (0, 0))
+        self.assertFalse(os.path.exists(self.index_path))
+
+
+class FileFieldExtractorProfileTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = self.temp_dir.name
+        with open(os.path.join(self.base, "ae.csv"), "w", encoding="gbk", newline="") as handle:
+            handle.write("研究编号\n\nUSUBJID,AESTDTC,AETERM\nSUBJ001,2024-01-02,头痛\n\nSUBJ002,,恶心\n")
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = "DM"
+        worksheet.append(["USUBJID", "BRTHDTC", "AGE"])
+        worksheet.append(["SUBJ001", datetime(1980, 5, 6), 44])
+        worksheet["B2"].number_format = "yyyy-mm-dd"
+        worksheet.append(["SUBJ002", None, 51])
+        worksheet.append([None, None, None])
+        workbook.save(os.path.join(self.base, "dm.xlsx"))
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_profile_mode_writes_profile_csv_next_to_summary(self):
+        result = FileFieldExtractorService().extract_fields(self.base, header_row=2, profile=True)
+
+        self.assertEqual(result["errors"], [])
+        self.assertEqual(
+            os.path.basename(result["profile_file"]),
+            os.path.basename(result["output_file"]).replace("summary", "profile"),
+        )
+        csv_profiles = {item["field"]: item for item in result["profiles"][os.path.join(self.base, "ae.csv")]}
+        self.assertEqual(list(csv_profiles), ["USUBJID", "AESTDTC", "AETERM"])
+        self.assertEqual(csv_profiles["USUBJID"]["rows"], 2)
+        self.assertEqual(csv_profiles["AESTDTC"]["non_empty_ratio"], 0.5)
+        self.assertEqual(csv_profiles["AESTDTC"]["inferred_type"], "date")
+        self.assertEqual(csv_profiles["AETERM"]["samples"], ["头痛", "恶心"])
+
+        with open(result["profile_file"], encoding="utf-8-sig", newline="") as handle:
+            rows = list(csv.reader(handle))
+        self.assertEqual(rows[0][:3], ["文件名", "字段名", "行数"])
+        self.assertIn(["ae.csv", "AETERM", "2", "2", "1.0", "2", "2", "text", "头痛 | 恶心"], rows)
+
+    def test_excel_profile_uses_header_row_and_display_dates(self):
+        result = FileFieldExtractorService().extract_fields(self.base, profile=True)
+        excel_profiles = {item["field"]: item for item in result["profiles"][os.path.join(self.base, "dm.xlsx")]}
+
+        self.assertEqual(list(excel_profiles), ["DM: USUBJID", "DM: BRTHDTC", "DM: AGE"])
+        self.assertEqual(excel_profiles["DM: USUBJID"]["rows"], 2)
+        self.assertEqual(excel_profiles["DM: BRTHDTC"]["samples"], ["1980-05-06"])
+        self.assertEqual(excel_profiles["DM: BRTHDTC"]["inferred_type"], "date")
+        self.assertEqual(excel_profiles["DM: AGE"]["inferred_type"], "numeric")
+
+    def test_csv_profile_takes_header_from_the_same_reader(self):
+        path = os.path.join(self.base, "dup.csv")
+        with open(path, "w", encoding="utf-8", newline="") as handle:
+            handle.write("\nUSUBJID,,USUBJID\nSUBJ001,x,y\n")
+        service = FileFieldExtractorService()
+
+        with unittest.mock.patch("src.utils.file_field_extractor_service.pd.read_csv") as read_csv:
+            profiles = service._profile_csv(path, 1)
+        read_csv.assert_not_called()
+
+        fields = [item["field"] for item in profiles]
+        self.assertEqual(fields, service._extract_from_csv(path, 1))
+        self.assertEqual(fields, ["USUBJID", "Unnamed: 1", "USUBJID.1"])
+        self.assertEqual(profiles[1]["samples"], ["x"])
+    def test_detected_encoding_outside_configured_candidates_is_not_tried_first(self):
+        # 该 GBK 表头会被探测器判为 shift_jis；shift_jis 不在候选中，应按配置顺序用 gbk 读取
+        path = os.path.join(self.base, "ambiguous.csv")
+        with open(path, "wb") as handle:
+            handle.write("丂丄丅,x\n甲,1\n".encode("gbk"))
+        service = FileFieldExtractorService()
+        self.assertEqual(service.encoding_detector.detect(path), "shift_jis")
+
+        self.assertEqual(service._extract_from_csv(path, 1), ["丂丄丅", "x"])
+        profiles = service._profile_csv(path, 1)
+        self.assertEqual([item["field"] for item in profiles], ["丂丄丅", "x"])
+        self.assertEqual(profiles[0]["samples"], ["甲"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+
+from src.utils.link_check_cache import LinkCheckCache, normalize_url
+
+
+class NormalizeUrlTests(unittest.TestCase):
+    def test_equivalent_urls_share_a_key(self):
+        self.assertEqual(normalize_url("HTTP://Example.COM"), "http://example.com/")
+        self.assertEqual(normalize_url("https://example.com:443/a?b=1#top"), "https://example.com/a?b=1")
+        self.assertEqual(normalize_url("http://example.com:8080/a"), "http://example.com:8080/a")
+        self.assertNotEqual(normalize_url("http://example.com/A"), normalize_url("http://example.com/a"))
+
+
+class LinkCheckCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "nested", "links.sqlite3")
+        self.now = 1000.0
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _cache(self, **kwargs) -> LinkCheckCache:
+        return LinkCheckCache(self.path, clock=lambda: self.now, **kwargs)
+
+    def _result(self, url: str, status: str, code=200) -> dict:
+        return {"url": url, "status": status, "status_code": code, "error": None}
+
+    def test_ttl_depends_on_status(self):
+        with self._cache(ttl={"timeout": 60}) as cache:
+            cache.store("http://a/", self._result("http://a/", "alive"), etag='"x"')
+            cache.store("http://b/", self._result("http://b/", "timeout", None))
+            cache.store("mailto:x@example.com", self._result("mailto:x@example.com", "skipped", None))
+
+        self.now += 120
+        with self._cache(ttl={"timeout": 60}) as cache:
+            alive = cache.lookup("HTTP://A")
+            self.assertTrue(alive.fresh)
+            self.assertEqual(alive.result("HTTP://A")["status"], "alive")
+            self.assertEqual(alive.etag, '"x"')
+            self.assertFalse(cache.lookup("http://b/").fresh)
+            self.assertIsNone(cache.lookup("mailto:x@example.com"))
+            self.assertEqual(cache.hits, 1)
+
+    def test_dead_links_without_status_code_use_the_error_ttl(self):
+        with self._cache() as cache:
+            cache.store("http://gone/", self._result("http://gone/", "dead", 404))
+            cache.store("http://offline/", {
+                "url": "http://offline/", "status": "dead", "status_code": None, "error": "Connection error",
+            })
+            self.now += 2 * 3600
+            self.assertTrue(cache.lookup("http://gone/").fresh)
+            self.assertFalse(cache.lookup("http://offline/").fresh)
+
+    def test_expired_alive_entries_with_validators_can_be_revalidated(self):
+        with self._cache(ttl={"alive": 10}) as cache:
+            cache.store("http://a/", self._result("http://a/", "alive"), last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+            cache.store("http://b/", self._result("http://b/", "alive"))
+            self.now += 20
+            entry = cache.lookup("http://a/")
+            self.assertFalse(entry.fresh)
+            self.assertTrue(entry.revalidatable)
+            self.assertFalse(cache.lookup("http://b/").revalidatable)
+
+            cache.touch("http://a/")
+            self.assertTrue(cache.lookup("http://a/").fresh)
+            self.assertEqual(cache.revalidated, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
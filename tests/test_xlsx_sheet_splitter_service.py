@@ -0,0 +1,276 @@
+import csv
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from openpyxl import Workbook
+
+from src.utils.xlsx_sheet_splitter_service import XlsxSheetSplitterService
+
+
+class XlsxSheetSplitterParallelTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = self.temp_dir.name
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _build_workbook(self) -> str:
+        workbook = Workbook()
+        workbook.active.title = "DM"
+        names = ["DM", "AE", "A<E", "A>E", "CM", "con"]
+        for name in names:
+            worksheet = workbook[name] if name in workbook.sheetnames else workbook.create_sheet(name)
+            worksheet.append(["USUBJID", "DOMAIN"])
+            for index in range(5):
+                worksheet.append([f"SUBJ{index:03d}", name])
+        path = os.path.join(self.base, "study.xlsx")
+        workbook.save(path)
+        return path
+
+    def _read_outputs(self, result):
+        contents = []
+        for output_file in result["output_files"]:
+            with open(output_file, "rb") as handle:
+                contents.append((os.path.basename(output_file), handle.read()))
+        return contents
+
+    def test_parallel_split_matches_sequential_order_and_content(self):
+        input_file = self._build_workbook()
+        service = XlsxSheetSplitterService()
+
+        sequential = service.split_file(input_file, os.path.join(self.base, "seq"))
+        progress = []
+        parallel = service.split_file(
+            input_file,
+            os.path.join(self.base, "par"),
+            progress_callback=lambda current, total, name: progress.append((current, total, name)),
+            workers=3,
+            parallel_min_bytes=0,
+        )
+
+        self.assertTrue(parallel["success"], parallel["errors"])
+        self.assertEqual(
+            [os.path.basename(path) for path in parallel["output_files"]],
+            ["DM.csv", "AE.csv", "A_E.csv", "A_E_1.csv", "CM.csv", "con_.csv"],
+        )
+        self.assertEqual(self._read_outputs(sequential), self._read_outputs(parallel))
+        self.assertEqual(
+            [item["sheet"] for item in parallel["sheet_outputs"]],
+            [item["sheet"] for item in sequential["sheet_outputs"]],
+        )
+        self.assertEqual([current for current, _, _ in progress], [1, 2, 3, 4, 5, 6])
+        self.assertEqual(sorted(name for _, _, name in progress), sorted(["DM", "AE", "A<E", "A>E", "CM", "con"]))
+
+    def test_small_or_single_sheet_workbooks_skip_the_process_pool(self):
+        input_file = self._build_workbook()
+        service = XlsxSheetSplitterService()
+        calls = []
+        original = service._export_parallel
+        service._export_parallel = lambda *args: calls.append(args[3]) or original(*args)
+
+        result = service.split_file(input_file, os.path.join(self.base, "small"), workers=8)
+        self.assertTrue(result["success"], result["errors"])
+        self.assertEqual(calls, [])
+
+        service.split_file(input_file, os.path.join(self.base, "one"), workers=8, include=["DM"], parallel_min_bytes=0)
+        self.assertEqual(calls, [])
+
+        service.split_file(input_file, os.path.join(self.base, "capped"), workers=8, parallel_min_bytes=0)
+        self.assertEqual(calls, [6])
+
+
+class XlsxSheetSplitterStreamingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = self.temp_dir.name
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _build_workbook(self) -> str:
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = "LB"
+        worksheet.append(["USUBJID", "LBDTC", "LBORRES", None, None])
+        worksheet.append(["SUBJ001", datetime(2024, 1, 2), 5.5, None, ""])
+        worksheet["B2"].number_format = "yyyy/mm/dd"
+        worksheet.append([None, None, None, None, None])
+        worksheet.append(["SUBJ002", datetime(2024, 3, 4, 8, 15), "", "x, \"quoted\"", None])
+        worksheet["B4"].number_format = "yyyy-mm-dd hh:mm"
+        worksheet.append([None, None, None, None, None])
+        worksheet["F8"].number_format = "@"
+        worksheet["G9"] = ""
+        workbook.create_sheet("EMPTY")
+        blank = workbook.create_sheet("BLANK")
+        blank["C3"].number_format = "@"
+        path = os.path.join(self.base, "lab.xlsx")
+        workbook.save(path)
+        return path
+
+    def test_streaming_export_trims_trailing_columns_and_rows(self):
+        input_file = self._build_workbook()
+        expected = {
+            "LB": (
+                "\ufeffUSUBJID,LBDTC,LBORRES,\r\n"
+                "SUBJ001,2024/01/02,5.5,\r\n"
+                ",,,\r\n"
+                'SUBJ002,2024-03-04 08:15,,"x, ""quoted"""\r\n'
+            ).encode("utf-8"),
+            "EMPTY": b"",
+            "BLANK": b"",
+        }
+        for engine in ("openpyxl", "fast"):
+            result = XlsxSheetSplitterService(engine=engine).split_file(input_file, os.path.join(self.base, engine))
+            self.assertTrue(result["success"], result["errors"])
+            for item in result["sheet_outputs"]:
+                with open(item["output_file"], "rb") as handle:
+                    self.assertEqual(handle.read(), expected[item["sheet"]], (engine, item["sheet"]))
+
+
+class XlsxSheetSplitterPartTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = self.temp_dir.name
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = "LB"
+        worksheet.append(["USUBJID", "LBTESTCD"])
+        for index in range(7):
+            worksheet.append([f"SUBJ{index:03d}", "受试者检查"])
+        small = workbook.create_sheet("DM")
+        small.append(["USUBJID"])
+        small.append(["SUBJ000"])
+        self.input_file = os.path.join(self.base, "lab.xlsx")
+        workbook.save(self.input_file)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    @staticmethod
+    def _rows(path):
+        with open(path, encoding="utf-8-sig", newline="") as handle:
+            return list(csv.reader(handle))
+
+    def test_rows_per_part_repeats_header_and_reports_parts(self):
+        service = XlsxSheetSplitterService(max_rows_per_part=3)
+        result = service.split_file(self.input_file, os.path.join(self.base, "rows"))
+
+        self.assertTrue(result["success"], result["errors"])
+        self.assertEqual(
+            [os.path.basename(path) for path in result["output_files"]],
+            ["LB_part001.csv", "LB_part002.csv", "LB_part003.csv", "DM.csv"],
+        )
+        lab = result["sheet_outputs"][0]
+        self.assertEqual(lab["output_file"], lab["parts"][0])
+        self.assertEqual(result["sheet_outputs"][1]["parts"], [result["sheet_outputs"][1]["output_file"]])
+        self.assertFalse(os.path.exists(os.path.join(self.base, "rows", "LB.csv")))
+
+        part_rows = [self._rows(path) for path in lab["parts"]]
+        self.assertEqual([len(rows) for rows in part_rows], [4, 4, 2])
+        for rows in part_rows:
+            self.assertEqual(rows[0], ["USUBJID", "LBTESTCD"])
+        self.assertEqual(
+            [row[0] for rows in part_rows for row in rows[1:]],
+            [f"SUBJ{index:03d}" for index in range(7)],
+        )
+
+    def test_bytes_per_part_stays_within_budget(self):
+        budget = 80
+        result = XlsxSheetSplitterService(max_bytes_per_part=budget).split_file(
+            self.input_file, os.path.join(self.base, "bytes"), workers=2, parallel_min_bytes=0
+        )
+
+        self.assertTrue(result["success"], result["errors"])
+        parts = result["sheet_outputs"][0]["parts"]
+        self.assertGreater(len(parts), 1)
+        for path in parts:
+            self.assertLessEqual(os.path.getsize(path), budget)
+        whole = XlsxSheetSplitterService().split_file(self.input_file, os.path.join(self.base, "whole"))
+        self.assertEqual(
+            [row for path in parts for row in self._rows(path)[1:]],
+            self._rows(whole["output_files"][0])[1:],
+        )
+
+    def test_rerun_removes_stale_parts_only_when_requested(self):
+        output_dir = os.path.join(self.base, "rerun")
+        XlsxSheetSplitterService(max_rows_per_part=2).split_file(self.input_file, output_dir)
+        self.assertIn("LB_part004.csv", os.listdir(output_dir))
+
+        XlsxSheetSplitterService(max_rows_per_part=3).split_file(self.input_file, output_dir)
+        self.assertIn("LB_part004.csv", os.listdir(output_dir))
+
+        XlsxSheetSplitterService(max_rows_per_part=3).split_file(self.input_file, output_dir, remove_stale_parts=True)
+        self.assertEqual(
+            sorted(os.listdir(output_dir)),
+            ["DM.csv", "LB_part001.csv", "LB_part002.csv", "LB_part003.csv"],
+        )
+
+        result = XlsxSheetSplitterService().split_file(self.input_file, output_dir, remove_stale_parts=True)
+        self.assertTrue(result["success"], result["errors"])
+        self.assertEqual(sorted(os.listdir(output_dir)), ["DM.csv", "LB.csv"])
+        self.assertEqual(len(self._rows(os.path.join(output_dir, "LB.csv"))), 8)
+
+    def test_invalid_part_limit_is_rejected(self):
+        with self.assertRaises(ValueError):
+            XlsxSheetSplitterService(max_rows_per_part=0)
+
+
+class XlsxSheetSplitterSelectionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = self.temp_dir.name
+        workbook = Workbook()
+        workbook.active.title = "DM"
+        workbook.active.append(["USUBJID", "AGE", "SEX"])
+        workbook.active.append(["SUBJ001", 30, "F"])
+        for name in ["AE", "AE_SUPP", "CM", "Notes"]:
+            worksheet = workbook.create_sheet(name)
+            for index in range(4):
+                worksheet.append([f"{name}{index}"])
+        workbook["Notes"].sheet_state = "hidden"
+        workbook.create_sheet("EMPTY")
+        self.input_file = os.path.join(self.base, "study.xlsx")
+        workbook.save(self.input_file)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_inventory_reports_declared_dimensions(self):
+        inventory = XlsxSheetSplitterService().inventory(self.input_file)
+
+        self.assertEqual([item["sheet"] for item in inventory], ["DM", "AE", "AE_SUPP", "CM", "Notes", "EMPTY"])
+        dm = inventory[0]
+        self.assertEqual(dm["dimension"], "A1:C2")
+        self.assertEqual((dm["estimated_rows"], dm["estimated_columns"]), (2, 3))
+        self.assertEqual((inventory[1]["estimated_rows"], inventory[1]["estimated_columns"]), (4, 1))
+        self.assertEqual(inventory[4]["state"], "hidden")
+        self.assertEqual(inventory[0]["state"], "visible")
+        self.assertGreater(dm["xml_bytes"], 0)
+
+    def test_split_exports_only_selected_sheets(self):
+        service = XlsxSheetSplitterService(engine="fast")
+        result = service.split_file(
+            self.input_file, os.path.join(self.base, "glob"), include=["ae*", "DM"], exclude=["*_SUPP"]
+        )
+
+        self.assertTrue(result["success"], result["errors"])
+        self.assertEqual([item["sheet"] for item in result["sheet_outputs"]], ["DM", "AE"])
+        self.assertEqual(result["total_sheets"], 2)
+        self.assertEqual(result["skipped_sheets"], ["AE_SUPP", "CM", "Notes", "EMPTY"])
+        self.assertEqual(sorted(os.listdir(os.path.join(self.base, "glob"))), ["AE.csv", "DM.csv"])
+
+        regex = service.split_file(
+            self.input_file, os.path.join(self.base, "regex"), include=r"A.*|C.", pattern_mode="regex"
+        )
+        self.assertEqual([item["sheet"] for item in regex["sheet_outputs"]], ["AE", "AE_SUPP", "CM"])
+
+    def test_unknown_pattern_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            XlsxSheetSplitterService().split_file(self.input_file, self.base, include=["DM"], pattern_mode="sql")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from openpyxl import Workbook
+
+from src.utils.xlsx_sheet_splitter_service import XlsxSheetSplitterService
+from src.utils.xlsx_to_csv_converter_service import XlsxToCsvConverterService
+
+
+class XlsxToCsvStreamingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base = self.temp_dir.name
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def _build_workbook(self) -> str:
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.title = "DM"
+        worksheet.append(["USUBJID", "BRTHDTC", "AGE"])
+        worksheet.append(["SUBJ001", datetime(1980, 5, 6), 44])
+        worksheet["B2"].number_format = "yyyy/mm/dd"
+        worksheet.append(["SUBJ002", datetime(1990, 1, 2, 13, 30), None])
+        worksheet["B3"].number_format = "yyyy-mm-dd hh:mm"
+        worksheet.append([None, None, None])
+        worksheet.append(["SUBJ003", None, 30])
+        worksheet["A8"].number_format = "@"
+        second = workbook.create_sheet("AE")
+        second.append(["IGNORED"])
+        path = os.path.join(self.base, "DM.xlsx")
+        workbook.save(path)
+        return path
+
+    def test_streaming_output_matches_sheet_splitter(self):
+        input_file = self._build_workbook()
+        streaming_dir = os.path.join(self.base, "streaming")
+        splitter_dir = os.path.join(self.base, "splitter")
+        os.makedirs(streaming_dir)
+
+        success, error = XlsxToCsvConverterService.convert_file_streaming(input_file, streaming_dir)
+        self.assertTrue(success, error)
+        XlsxSheetSplitterService().split_file(input_file, splitter_dir)
+
+        with open(os.path.join(streaming_dir, "DM.csv"), "rb") as handle:
+            streamed = handle.read()
+        with open(os.path.join(splitter_dir, "DM.csv"), "rb") as handle:
+            split = handle.read()
+        self.assertEqual(streamed, split)
+        self.assertTrue(streamed.startswith(b"\xef\xbb\xbf"))
+        self.assertIn("1980/05/06".encode("utf-8"), streamed)
+        self.assertIn("1990-01-02 13:30".encode("utf-8"), streamed)
+
+    def test_streaming_drops_trailing_empty_rows_only(self):
+        input_file = self._build_workbook()
+        success, error = XlsxToCsvConverterService.convert_file_streaming(input_file)
+        self.assertTrue(success, error)
+
+        with open(os.path.join(self.base, "DM.csv"), encoding="utf-8-sig", newline="") as handle:
+            lines = handle.read().splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(lines[3], ",,")
+        self.assertEqual(lines[-1], "SUBJ003,,30")
+
+
+if __name__ == "__main__":
+    unittest.main()